@@ -0,0 +1,102 @@
+"""
+Measure the memory used per edge by the ObjectGraph storage.
+
+The dict-based storage used by earlier versions of refcycle is rebuilt here
+for comparison, so that the "before" and "after" numbers come from the same
+run on the same objects.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/memory_per_edge.py [objects] [out_degree]
+
+Requires Python 3, for the tracemalloc module.
+
+"""
+import gc
+import itertools
+import random
+import sys
+import tracemalloc
+
+from refcycle import ObjectGraph
+from refcycle.element_transform_set import ElementTransformSet
+from refcycle.key_transform_dict import KeyTransformDict
+
+
+def make_objects(object_count, out_degree, seed=12345):
+    """
+    Create lists holding references to randomly chosen other lists.
+
+    """
+    random.seed(seed)
+    objects = [[] for _ in range(object_count)]
+    for obj in objects:
+        obj.extend(random.choice(objects) for _ in range(out_degree))
+    return objects
+
+
+def dict_based_storage(objects):
+    """
+    Build the graph structures used by the dict-based ObjectGraph.
+
+    """
+    vertices = ElementTransformSet(transform=id)
+    out_edges = KeyTransformDict(transform=id)
+    in_edges = KeyTransformDict(transform=id)
+    for obj in objects:
+        vertices.add(obj)
+        out_edges[obj] = []
+        in_edges[obj] = []
+
+    edge_label = itertools.count()
+    edges = set()
+    head = {}
+    tail = {}
+    for referrer in vertices:
+        for referent in gc.get_referents(referrer):
+            if referent not in vertices:
+                continue
+            edge = next(edge_label)
+            edges.add(edge)
+            tail[edge] = referrer
+            head[edge] = referent
+            out_edges[referrer].append(edge)
+            in_edges[referent].append(edge)
+    return vertices, out_edges, in_edges, edges, head, tail
+
+
+def measure(build, objects):
+    """
+    Return the memory (in bytes) still allocated by build(objects) once it
+    has returned, together with its result.
+
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = build(objects)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before, result
+
+
+def main(object_count=200000, out_degree=5):
+    objects = make_objects(object_count, out_degree)
+    edge_count = object_count * out_degree
+
+    old_bytes, old_storage = measure(dict_based_storage, objects)
+    del old_storage
+    new_bytes, graph = measure(ObjectGraph, objects)
+    assert len(graph.edges) == edge_count
+
+    print("{} objects, {} edges".format(object_count, edge_count))
+    print("dict-based storage:  {:8.1f} bytes per edge".format(
+        old_bytes / edge_count))
+    print("CSR array storage:   {:8.1f} bytes per edge".format(
+        new_bytes / edge_count))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
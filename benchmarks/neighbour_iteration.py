@@ -0,0 +1,76 @@
+"""
+Compare the per-edge cost of looping over the neighbours of every vertex of
+an ObjectGraph via the list-building children and parents methods, the
+generic edge-based iteration, and iter_children and iter_parents.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/neighbour_iteration.py [objects] [degree]
+
+"""
+import random
+import sys
+import time
+
+from refcycle import ObjectGraph
+from refcycle.i_directed_graph import IDirectedGraph
+
+
+def make_objects(object_count, out_degree, seed=12345):
+    """
+    Create lists each holding references to `out_degree` randomly chosen
+    other lists.
+
+    """
+    random.seed(seed)
+    objects = [[] for _ in range(object_count)]
+    for obj in objects:
+        obj.extend(random.choice(objects) for _ in range(out_degree))
+    return objects
+
+
+def time_neighbours(graph, neighbours, repeat=3):
+    """
+    Loop over the neighbours of every vertex; return the best elapsed time
+    of `repeat` runs.
+
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        for vertex in graph.vertices:
+            for neighbour in neighbours(vertex):
+                pass
+        timings.append(time.time() - start)
+    return min(timings)
+
+
+def edge_based_children(graph):
+    # The generic implementation: one head lookup per out-edge.
+    return lambda vertex: [graph.head(e) for e in graph.out_edges(vertex)]
+
+
+def main(object_count=20000, out_degree=4):
+    objects = make_objects(object_count, out_degree)
+    graph = ObjectGraph(objects)
+    edge_count = len(graph.edges)
+    graph.in_edges(objects[0])  # Build the reverse structure up front.
+    print("{} objects, {} references".format(len(graph), edge_count))
+
+    timings = [
+        ("head(edge) list", edge_based_children(graph)),
+        ("generic iter_children",
+         lambda vertex: IDirectedGraph.iter_children(graph, vertex)),
+        ("children", graph.children),
+        ("iter_children", graph.iter_children),
+        ("parents", graph.parents),
+        ("iter_parents", graph.iter_parents),
+    ]
+    for name, neighbours in timings:
+        elapsed = time_neighbours(graph, neighbours)
+        print("{:22} {:8.3f} seconds  {:6.1f} ns per edge".format(
+            name, elapsed, 1e9 * elapsed / edge_count))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,59 @@
+"""
+Time objects_reachable_from on a large structure of nested containers, and
+compare with the cost of examining the referents of the same objects a
+second time, as rebuilding the graph from its objects does.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/reachable_speed.py [objects] [degree]
+
+"""
+import random
+import sys
+import time
+
+from refcycle import ObjectGraph, objects_reachable_from
+
+
+def make_root(object_count, out_degree, seed=12345):
+    """
+    Create lists and dicts holding references to randomly chosen others,
+    and return a list holding all of them.
+
+    """
+    random.seed(seed)
+    objects = [
+        [] if index % 2 else {}
+        for index in range(object_count)
+    ]
+    for index, obj in enumerate(objects):
+        targets = [random.choice(objects) for _ in range(out_degree)]
+        if isinstance(obj, list):
+            obj.extend(targets)
+        else:
+            obj.update(
+                ('key{}'.format(i), target)
+                for i, target in enumerate(targets)
+            )
+    return objects
+
+
+def main(object_count=200000, out_degree=4):
+    root = make_root(object_count, out_degree)
+
+    start = time.time()
+    graph = objects_reachable_from(root)
+    walk_time = time.time() - start
+    print("{} objects, {} references".format(len(graph), len(graph.edges)))
+
+    start = time.time()
+    rebuilt = ObjectGraph(graph.vertices)
+    rebuild_time = time.time() - start
+    assert len(rebuilt.edges) == len(graph.edges)
+
+    print("objects_reachable_from: {:8.2f} seconds".format(walk_time))
+    print("second referent pass:   {:8.2f} seconds".format(rebuild_time))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""
+Compare finding a shortest cycle through each member of a strongly
+connected component one vertex at a time with the batch shortest_cycles
+method.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/shortest_cycles_speed.py [objects] [members]
+
+"""
+import random
+import sys
+import time
+
+from refcycle import ObjectGraph
+
+
+def make_objects(object_count, member_count, seed=12345):
+    """
+    Create lists holding references to randomly chosen other lists, with a
+    strongly connected component of `member_count` lists among them.
+
+    """
+    random.seed(seed)
+    objects = [[] for _ in range(object_count)]
+    for obj in objects:
+        obj.extend(random.choice(objects) for _ in range(2))
+
+    # A ring of members, with chords; plus references out of the ring into
+    # the rest of the objects.
+    members = [[] for _ in range(member_count)]
+    for index, member in enumerate(members):
+        member.append(members[(index + 1) % member_count])
+        member.append(random.choice(members))
+        member.append(random.choice(objects))
+    return objects + members, members
+
+
+def main(object_count=200000, member_count=200):
+    objects, members = make_objects(object_count, member_count)
+    graph = ObjectGraph(objects)
+    graph.condensation()
+    print("{} objects, {} component members".format(
+        len(graph), member_count))
+
+    start = time.time()
+    one_at_a_time = [len(graph.shortest_cycle(member)) for member in members]
+    loop_time = time.time() - start
+
+    start = time.time()
+    batch = [len(cycle) for cycle in graph.shortest_cycles(members)]
+    batch_time = time.time() - start
+    assert batch == one_at_a_time
+
+    print("shortest_cycle loop:  {:8.2f} seconds".format(loop_time))
+    print("shortest_cycles:      {:8.2f} seconds".format(batch_time))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -13,38 +13,110 @@
 # limitations under the License.
 
 from refcycle.creators import (
+    census,
     cycles_created_by,
     garbage,
     objects_reachable_from,
     snapshot,
 )
 from refcycle.annotated_graph import AnnotatedGraph
+from refcycle.component_record import ComponentRecord
+from refcycle.condensation import Condensation
 from refcycle.i_directed_graph import IDirectedGraph
-from refcycle.object_graph import ObjectGraph
+from refcycle.object_graph import ObjectGraph, ObjectGraphView
 from refcycle.version import __version__
 
 __all__ = [
-    'AnnotatedGraph', 'IDirectedGraph', 'ObjectGraph',
-    'cycles_created_by', 'garbage', 'objects_reachable_from', 'snapshot',
-    'key_cycles',
+    'AnnotatedGraph', 'ComponentRecord', 'Condensation', 'IDirectedGraph',
+    'ObjectGraph', 'ObjectGraphView',
+    'census', 'cycles_created_by', 'garbage', 'objects_reachable_from',
+    'snapshot',
+    'iter_key_cycles', 'key_cycles',
     '__version__',
 ]
 
 
-def _is_orphan(scc, graph):
+def key_cycles(graph=None):
     """
-    Return False iff the given scc is reachable from elsewhere.
+    Collect cyclic garbage, and return the strongly connected
+    components that were keeping the garbage alive.
+
+    If a graph is given, return instead the strongly connected components
+    of that graph not reachable from elsewhere in the graph; this skips the
+    garbage collection, so the caller can reuse a graph that it has already
+    collected.
+
+    Each component is returned as a standalone graph (an
+    :class:`~refcycle.object_graph.ObjectGraph`, unless a graph of another
+    type is given), so that holding on to one component doesn't keep the
+    rest of the graph alive.
 
     """
-    return all(p in scc for v in scc for p in graph.parents(v))
+    return list(iter_key_cycles(graph))
 
 
-def key_cycles():
+def iter_key_cycles(graph=None, max_cycles=None, min_size=1,
+                    order='discovery'):
     """
-    Collect cyclic garbage, and return the strongly connected
-    components that were keeping the garbage alive.
+    Collect cyclic garbage, and generate the strongly connected
+    components that were keeping the garbage alive, one at a time.
+
+    Like :func:`key_cycles`, but components are generated as standalone
+    graphs one by one, and the generator keeps alive only the objects of the components that it
+    has yet to generate: once a component has been generated and dropped
+    by the caller, the garbage it was keeping alive can be collected.
+
+    As for :func:`key_cycles`, if a graph is given then its components
+    are generated instead, with no garbage collection; the graph itself
+    of course keeps its objects alive for as long as the caller holds it.
+
+    Components with fewer than `min_size` objects are skipped, and at most
+    `max_cycles` components are generated.  `order` should be either
+    ``'discovery'``, to generate components in the order they're found, or
+    ``'largest'``, to generate the largest components first.
+
+    The arguments are checked, and garbage collected, when this function is
+    called rather than when the first component is requested.
+
+    """
+    if order not in ('discovery', 'largest'):
+        raise ValueError(
+            "order should be 'discovery' or 'largest', "
+            "not {!r}".format(order))
+    if max_cycles is not None and max_cycles < 0:
+        raise ValueError(
+            "max_cycles should be nonnegative, not {!r}".format(max_cycles))
+
+    if graph is None:
+        graph = garbage()
+    # Choose the components by number first, so that only the chosen ones
+    # are materialized, reusing the edges already found; from here on, only
+    # the members of those components are kept.
+    condensation = graph.condensation()
+    chosen = [
+        component for component in condensation.sources()
+        if condensation.size(component) >= min_size
+    ]
+    if order == 'largest':
+        chosen.sort(key=condensation.size, reverse=True)
+    if max_cycles is not None:
+        del chosen[max_cycles:]
+
+    components = [
+        graph._component_subgraph(condensation, component).materialize()
+        for component in chosen
+    ]
+    del graph, condensation
+
+    components.reverse()
+    return _pop_components(components)
+
+
+def _pop_components(components):
+    """
+    Generate the given components from last to first, dropping each one from
+    the list as it's generated.
 
     """
-    graph = garbage()
-    sccs = graph.strongly_connected_components()
-    return [scc for scc in sccs if _is_orphan(scc, graph)]
+    while components:
+        yield components.pop()
@@ -0,0 +1,115 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Lightweight description of a strongly connected component of a graph.
+
+"""
+
+
+class ComponentRecord(object):
+    """
+    Summary of a strongly connected component of a graph.
+
+    `graph` is the graph that the component belongs to
+    `component` is the number of the component in the graph's condensation
+    `members` is the list of vertices of the component
+    `internal_edge_count` is the number of edges between members
+    `outgoing_edge_count` is the number of edges from a member to a vertex
+       in some other component
+
+    Unlike the subgraphs returned by
+    :meth:`~refcycle.i_directed_graph.IDirectedGraph.strongly_connected_components`,
+    records don't build any graph structure for the component; use
+    :meth:`subgraph` to get one when it's needed.  A record is created from
+    the graph's :class:`~refcycle.condensation.Condensation`, and its
+    `members` and `outgoing_edge_count` are only computed when first used.
+
+    """
+    __slots__ = (
+        '_condensation', 'component', '_members', '_outgoing_edge_count',
+    )
+
+    def __init__(self, condensation, component):
+        self._condensation = condensation
+        self.component = component
+        self._members = None
+        self._outgoing_edge_count = None
+
+    @property
+    def graph(self):
+        return self._condensation.graph
+
+    @property
+    def members(self):
+        if self._members is None:
+            self._members = self._condensation.members(self.component)
+        return self._members
+
+    @property
+    def internal_edge_count(self):
+        return self._condensation.internal_edge_count(self.component)
+
+    @property
+    def outgoing_edge_count(self):
+        if self._outgoing_edge_count is None:
+            self._outgoing_edge_count = (
+                self._condensation.outgoing_edge_count(self.component))
+        return self._outgoing_edge_count
+
+    def __len__(self):
+        """
+        Number of vertices in the component.
+
+        """
+        return self._condensation.size(self.component)
+
+    def __iter__(self):
+        """
+        Generate the vertices of the component.
+
+        """
+        return iter(self.members)
+
+    def __repr__(self):
+        return (
+            "<{}.{} with {} vertices, {} internal edges and "
+            "{} outgoing edges at 0x{:x}>".format(
+                self.__module__,
+                type(self).__name__,
+                len(self),
+                self.internal_edge_count,
+                self.outgoing_edge_count,
+                id(self),
+            )
+        )
+
+    @property
+    def cyclic(self):
+        """
+        True if the component contains at least one cycle.
+
+        A component is acyclic only if it consists of a single vertex with
+        no edge to itself.
+
+        """
+        return self.internal_edge_count > 0
+
+    def subgraph(self):
+        """
+        Return the full subgraph of the graph on the members of this
+        component.
+
+        """
+        return self.graph._component_subgraph(
+            self._condensation, self.component)
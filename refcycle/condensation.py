@@ -0,0 +1,251 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The condensation of a directed graph: the directed acyclic graph obtained by
+contracting each strongly connected component to a single vertex.
+
+"""
+import copy
+
+from six.moves import range
+
+from refcycle.component_record import ComponentRecord
+from refcycle.csr_graph import CSRGraph, filled_index_array, index_array
+
+
+class Condensation(object):
+    """
+    The condensation of a directed graph.
+
+    Components are numbered 0, 1, ..., k-1 in topological order: every edge
+    between two different components goes from a lower-numbered component
+    to a higher-numbered one.
+
+    `graph` is the graph that this is the condensation of
+    `vertices` is an IndexedVertexSet numbering the vertices of `graph` in
+       iteration order; a vertex's number is referred to as its position
+    `labels` is an index array mapping the position of each vertex of
+       `graph` to the number of its component
+    `dag` is a CSRGraph on the components, with an edge from component c to
+       component d whenever the graph has at least one edge from a member
+       of c to a member of d
+    `multiplicities` is an index array giving, for each edge of `dag`, the
+       number of edges of the graph that it represents
+
+    """
+    def __init__(self, graph, vertices, labels, component_count, children):
+        """
+        Build the condensation from a labelling of the vertices.
+
+        `children` is a callable that maps the position of a vertex to an
+        iterable of the positions of its children.
+
+        """
+        self.graph = graph
+        self.labels = labels
+        self.vertices = vertices
+
+        # Group the vertex positions by component, preserving order.
+        member_offsets = filled_index_array(component_count + 1)
+        for label in labels:
+            member_offsets[label + 1] += 1
+        for component in range(component_count):
+            member_offsets[component + 1] += member_offsets[component]
+        next_slot = index_array(member_offsets)
+        member_order = filled_index_array(len(labels))
+        for position, label in enumerate(labels):
+            member_order[next_slot[label]] = position
+            next_slot[label] += 1
+        self._member_offsets = member_offsets
+        self._member_order = member_order
+
+        # Edges between components, with multiplicities, and the number of
+        # edges within each component.
+        dag_offsets = index_array([0])
+        dag_heads = index_array()
+        multiplicities = index_array()
+        internal_edge_counts = filled_index_array(component_count)
+        for component in range(component_count):
+            targets = {}
+            internal_edge_count = 0
+            for position in self.member_positions(component):
+                for child in children(position):
+                    target = labels[child]
+                    if target == component:
+                        internal_edge_count += 1
+                    else:
+                        targets[target] = targets.get(target, 0) + 1
+            internal_edge_counts[component] = internal_edge_count
+            dag_heads.extend(targets)
+            multiplicities.extend(targets.values())
+            dag_offsets.append(len(dag_heads))
+
+        self.dag = CSRGraph(dag_offsets, dag_heads)
+        self.multiplicities = multiplicities
+        self._internal_edge_counts = internal_edge_counts
+
+    def for_graph(self, graph):
+        """
+        Return a copy of this condensation whose `graph` attribute is the
+        given graph.  The copy shares all other data with this one.
+
+        """
+        condensation = copy.copy(self)
+        condensation.graph = graph
+        return condensation
+
+    def __len__(self):
+        """
+        Number of components.
+
+        """
+        return len(self._member_offsets) - 1
+
+    def __repr__(self):
+        return "<{}.{} with {} components at 0x{:x}>".format(
+            self.__module__,
+            type(self).__name__,
+            len(self),
+            id(self),
+        )
+
+    @property
+    def topological_order(self):
+        """
+        The component numbers, in topological order.
+
+        """
+        return range(len(self))
+
+    def component_of(self, vertex):
+        """
+        Return the number of the component containing the given vertex.
+
+        """
+        return self.labels[self.vertices.index(vertex)]
+
+    def member_positions(self, component):
+        """
+        Return an index array of the positions of the members of the given
+        component.
+
+        """
+        offsets = self._member_offsets
+        return self._member_order[offsets[component]:offsets[component + 1]]
+
+    def members(self, component):
+        """
+        Return the list of vertices belonging to the given component.
+
+        """
+        vertices = self.vertices
+        return [
+            vertices[position]
+            for position in self.member_positions(component)
+        ]
+
+    def size(self, component):
+        """
+        Return the number of vertices in the given component.
+
+        """
+        offsets = self._member_offsets
+        return offsets[component + 1] - offsets[component]
+
+    def internal_edge_count(self, component):
+        """
+        Return the number of edges between members of the given component.
+
+        """
+        return self._internal_edge_counts[component]
+
+    def outgoing_edge_count(self, component):
+        """
+        Return the number of edges leaving the given component.
+
+        """
+        multiplicities = self.multiplicities
+        return sum(
+            multiplicities[edge] for edge in self.dag.out_edges(component))
+
+    def successors(self, component):
+        """
+        Return a list of pairs (target, multiplicity), one for each
+        component that the given component has edges to.
+
+        """
+        dag, multiplicities = self.dag, self.multiplicities
+        return [
+            (dag.heads[edge], multiplicities[edge])
+            for edge in dag.out_edges(component)
+        ]
+
+    def predecessors(self, component):
+        """
+        Return a list of pairs (source, multiplicity), one for each
+        component that has edges to the given component.
+
+        """
+        dag, multiplicities = self.dag, self.multiplicities
+        return [
+            (dag.tail(edge), multiplicities[edge])
+            for edge in dag.in_edges(component)
+        ]
+
+    def sources(self):
+        """
+        Return the list of components with no incoming edges.
+
+        Every component is reachable from one of these.
+
+        """
+        in_offsets = self.dag.in_offsets
+        return [
+            component for component in range(len(self))
+            if in_offsets[component] == in_offsets[component + 1]
+        ]
+
+    def sinks(self):
+        """
+        Return the list of components with no outgoing edges.
+
+        """
+        out_offsets = self.dag.out_offsets
+        return [
+            component for component in range(len(self))
+            if out_offsets[component] == out_offsets[component + 1]
+        ]
+
+    def owned_objects(self):
+        """
+        List of gc-tracked objects owned by this Condensation instance.
+
+        """
+        return [
+            self,
+            self.__dict__,
+            self.labels,
+            self._member_offsets,
+            self._member_order,
+            self.multiplicities,
+            self._internal_edge_counts,
+        ] + self.dag.owned_objects()
+
+    def record(self, component):
+        """
+        Return a :class:`~refcycle.component_record.ComponentRecord` for the
+        given component.
+
+        """
+        return ComponentRecord(self, component)
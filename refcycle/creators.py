@@ -18,9 +18,20 @@ instances.
 """
 import gc
 import inspect
+import sys
+
+from six.moves import map
 
 from refcycle.gc_utils import restore_gc_state
-from refcycle.object_graph import ObjectGraph
+from refcycle.object_graph import (
+    _live_graph_objects,
+    ObjectGraph,
+    ObjectGraphView,
+)
+
+
+# gc.get_objects accepts a generation argument from Python 3.8 onwards.
+_HAVE_GENERATION_OBJECTS = sys.version_info >= (3, 8)
 
 
 def cycles_created_by(callable):
@@ -76,47 +87,190 @@ def garbage():
         return ObjectGraph(objects)
 
 
-def objects_reachable_from(obj):
+def objects_reachable_from(*roots, **options):
     """
-    Return graph of objects reachable from *obj* via ``gc.get_referrers``.
+    Return graph of objects reachable from the given objects via
+    ``gc.get_referents``.
 
     Returns an :class:`~refcycle.object_graph.ObjectGraph` object holding all
-    objects reachable from the given one by following the output of
-    ``gc.get_referrers``.  Note that unlike the
+    objects reachable from the given roots by following the output of
+    ``gc.get_referents``.  Note that unlike the
     :func:`~refcycle.creators.snapshot` function, the output graph may
     include non-gc-tracked objects.
 
+    For compatibility with earlier versions, a single root may instead be
+    passed as the `obj` keyword argument.
+
+    The walk is breadth-first, and can be limited with the following
+    keyword arguments:
+
+    `exclude` is an iterable of objects (for example, another graph) that
+       are left out of the search: they're neither included nor looked
+       through
+    `max_depth` is the greatest number of references followed from a root
+    `max_objects` bounds the number of objects in the graph; the walk stops
+       before an object whose referents would take it over the limit, and
+       if there are more roots than that, only the first `max_objects`
+       roots are included
+    `follow` is a predicate called on each object found other than the
+       roots; the referents of objects for which it returns false aren't
+       followed
+    `include_untracked` can be set to False to leave out objects that aren't
+       tracked by the garbage collector, such as ints and strings
+
+    Objects whose referents weren't followed because of one of these limits
+    are included without outgoing edges, and are listed by the
+    :meth:`~refcycle.object_graph.ObjectGraph.truncated_vertices` method of
+    the returned graph.
+
     """
-    # Depth-first search.
-    found = ObjectGraph.vertex_set()
-    to_process = [obj]
-    while to_process:
-        obj = to_process.pop()
-        found.add(obj)
-        for referent in gc.get_referents(obj):
-            if referent not in found:
-                to_process.append(referent)
-    return ObjectGraph(found)
-
-
-def snapshot():
+    if 'obj' in options:
+        if roots:
+            raise TypeError(
+                "objects_reachable_from() got multiple values for "
+                "argument 'obj'")
+        roots = (options.pop('obj'),)
+    exclude = options.pop('exclude', None)
+    max_depth = options.pop('max_depth', None)
+    max_objects = options.pop('max_objects', None)
+    follow = options.pop('follow', None)
+    include_untracked = options.pop('include_untracked', True)
+    if options:
+        raise TypeError(
+            "objects_reachable_from() got an unexpected keyword argument "
+            "{!r}".format(sorted(options)[0]))
+
+    return ObjectGraph._from_roots(
+        roots,
+        excluded_ids=set() if exclude is None else set(map(id, exclude)),
+        max_depth=max_depth,
+        max_objects=max_objects,
+        follow=follow,
+        include_untracked=include_untracked,
+    )
+
+
+def snapshot(generation=None, generations=None, boundary=False,
+             exclude=None):
     """Return the graph of all currently gc-tracked objects.
 
     Excludes the returned :class:`~refcycle.object_graph.ObjectGraph` and
-    objects owned by it.
+    objects owned by it, along with the objects owned by any other live
+    :class:`~refcycle.object_graph.ObjectGraph`, such as an earlier
+    snapshot.  The objects that those graphs hold as vertices are still
+    captured; pass them as `exclude` to leave them out too.
+
+    `exclude`, if given, is an iterable of objects to leave out of the
+    snapshot; passing an earlier snapshot gives a graph of the objects
+    created since.  Excluded objects are filtered out by identity before
+    any references are examined.
 
-    Note that a subsequent call to :func:`~refcycle.creators.snapshot` will
-    capture all of the objects owned by this snapshot.  The
-    :meth:`~refcycle.object_graph.ObjectGraph.owned_objects` method may be
-    helpful when excluding these objects from consideration.
+    To capture only the objects currently in some of the garbage collector's
+    generations, pass a single generation number as `generation`, or a
+    sequence of them as `generations`; for example, ``generation=0`` gives
+    the objects allocated since the last collection.  This needs the
+    per-generation ``gc.get_objects`` of Python 3.8 or later; on earlier
+    versions all gc-tracked objects are captured.
+
+    If `boundary` is true, gc-tracked objects outside the selected
+    generations that are referred to by selected objects are also included,
+    as stubs whose own references aren't followed.  The
+    :meth:`~refcycle.object_graph.ObjectGraph.truncated_vertices` method of
+    the returned graph lists these stubs.
 
     """
-    all_objects = gc.get_objects()
+    if generation is not None:
+        if generations is not None:
+            raise ValueError(
+                "At most one of generation and generations may be given.")
+        generations = [generation]
+    if generations is not None:
+        for g in generations:
+            if not 0 <= g < len(gc.get_count()):
+                raise ValueError("Invalid generation: {!r}".format(g))
+        if not _HAVE_GENERATION_OBJECTS:
+            generations = None
+
     this_frame = inspect.currentframe()
+    if generations is None:
+        all_objects = gc.get_objects()
+    else:
+        all_objects = []
+        for g in generations:
+            all_objects.extend(gc.get_objects(g))
+
+    # Skip this frame and the containers that it created before the objects
+    # were listed, since young generations include them.
+    excluded_ids = {id(this_frame), id(all_objects), id(generations)}
+    excluded_ids.update(map(id, _live_graph_objects()))
+    # Views aren't registered as live graphs, so look for them here.  Views
+    # can't be subclassed, and an exact type check avoids both reading
+    # __class__, which can raise, and filling the ABC caches.
+    obj = None
+    for obj in all_objects:
+        if type(obj) is ObjectGraphView:
+            excluded_ids.update(map(id, obj._own_objects()))
+    if exclude is not None:
+        excluded_ids.update(map(id, exclude))
     selected_objects = []
     for obj in all_objects:
-        if obj is not this_frame:
+        if id(obj) not in excluded_ids:
             selected_objects.append(obj)
-    graph = ObjectGraph(selected_objects)
+
+    # Tracked objects referred to from the selection but outside it are
+    # added as stubs while the edges are found.
+    graph = ObjectGraph._from_objects(
+        selected_objects,
+        boundary=excluded_ids if boundary and generations is not None
+        else None,
+    )
     del this_frame, all_objects, selected_objects, obj
     return graph
+
+
+def _qualified_typename(cls):
+    """
+    Return the fully qualified name of the given type, as
+    ``module.qualname``.
+
+    """
+    name = getattr(cls, '__qualname__', cls.__name__)
+    return '{}.{}'.format(cls.__module__, name)
+
+
+def census():
+    """
+    Return the number and total size of the currently gc-tracked objects of
+    each type.
+
+    Returns a dict mapping the fully qualified name of each type to a pair
+    ``(count, size)``: the number of gc-tracked objects of that type, and
+    their total size as reported by ``sys.getsizeof``.
+
+    Unlike ``snapshot().count_by_typename()``, this doesn't look at any
+    references or build an :class:`~refcycle.object_graph.ObjectGraph`, and
+    it keeps no references to the objects after it returns.
+
+    """
+    all_objects = gc.get_objects()
+    this_frame = inspect.currentframe()
+    getsizeof = sys.getsizeof
+
+    # Aggregate by type first, and only compute names per type.
+    counts = {}
+    sizes = {}
+    obj = None
+    for obj in all_objects:
+        if obj is this_frame:
+            continue
+        cls = type(obj)
+        counts[cls] = counts.get(cls, 0) + 1
+        sizes[cls] = sizes.get(cls, 0) + getsizeof(obj)
+    del this_frame, all_objects, obj
+
+    table = {}
+    for cls, count in counts.items():
+        name = _qualified_typename(cls)
+        old_count, old_size = table.get(name, (0, 0))
+        table[name] = old_count + count, old_size + sizes[cls]
+    return table
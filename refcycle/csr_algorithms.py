@@ -0,0 +1,681 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Graph algorithms working directly on the integer vertices and edges of a
+CSRGraph.
+
+These avoid the per-vertex dictionaries and per-step tuples of the generic
+IDirectedGraph algorithms: all working state lives in preallocated index
+arrays.
+
+"""
+import time
+
+from six.moves import range
+
+from refcycle.csr_graph import filled_index_array, index_array
+
+
+def strongly_connected_components(graph):
+    """
+    Compute the strongly connected components of a CSRGraph.
+
+    Returns a pair (component_count, labels), where labels is an index array
+    mapping each vertex to the number of its component.  Components are
+    numbered in topological order: every edge between different components
+    goes from a lower-numbered component to a higher-numbered one.
+
+    Algorithm is the path-based depth-first search described in "Path-based
+    depth-first search for strong and biconnected components" by Harold N.
+    Gabow, Inf.Process.Lett. 74 (2000) 107--114, run iteratively.
+
+    """
+    vertex_count = graph.vertex_count
+    out_offsets, heads = graph.out_offsets, graph.heads
+
+    # Preorder number of each vertex, or -1 if not yet visited.
+    preorder = filled_index_array(vertex_count, -1)
+    # Component of each vertex, or -1 if not yet assigned.
+    labels = filled_index_array(vertex_count, -1)
+    # Next out-edge to examine for each vertex.
+    next_edge = index_array(out_offsets)
+    # Gabow's stack S of vertices not yet assigned to a component.
+    path = filled_index_array(vertex_count)
+    # Gabow's stack B, holding preorder numbers of component roots.
+    boundaries = filled_index_array(vertex_count)
+    # Depth-first search stack.
+    calls = filled_index_array(vertex_count)
+
+    counter = 0
+    component_count = 0
+    for root in range(vertex_count):
+        if preorder[root] != -1:
+            continue
+
+        preorder[root] = counter
+        path[0] = calls[0] = root
+        boundaries[0] = counter
+        path_top = boundary_top = call_top = 1
+        counter += 1
+
+        while call_top:
+            vertex = calls[call_top - 1]
+            edge = next_edge[vertex]
+            end = out_offsets[vertex + 1]
+            while edge < end:
+                child = heads[edge]
+                edge += 1
+                child_preorder = preorder[child]
+                if child_preorder == -1:
+                    break
+                if labels[child] == -1:
+                    # Child is on the path stack: merge components.
+                    while child_preorder < boundaries[boundary_top - 1]:
+                        boundary_top -= 1
+            else:
+                # All edges examined: leave the vertex.
+                call_top -= 1
+                if boundaries[boundary_top - 1] == preorder[vertex]:
+                    boundary_top -= 1
+                    while True:
+                        path_top -= 1
+                        member = path[path_top]
+                        labels[member] = component_count
+                        if member == vertex:
+                            break
+                    component_count += 1
+                continue
+
+            # Descend to an unvisited child.
+            next_edge[vertex] = edge
+            preorder[child] = counter
+            path[path_top] = child
+            path_top += 1
+            boundaries[boundary_top] = counter
+            boundary_top += 1
+            calls[call_top] = child
+            call_top += 1
+            counter += 1
+
+    # Components were identified in reverse topological order.
+    last = component_count - 1
+    for vertex in range(vertex_count):
+        labels[vertex] = last - labels[vertex]
+    return component_count, labels
+
+
+def immediate_dominators(graph, roots):
+    """
+    Compute the immediate dominators of the vertices of a CSRGraph, with
+    respect to the given iterable of root vertices.
+
+    A vertex u dominates a vertex v if every path from a root to v passes
+    through u.  The immediate dominator of v is the dominator of v, other
+    than v itself, that is dominated by all the others.  Roots have no
+    immediate dominator, and neither do vertices reachable along disjoint
+    paths from two different roots.
+
+    Returns a pair (dominators, order).  `dominators` is an index array
+    mapping each vertex to its immediate dominator; vertices with no
+    immediate dominator are mapped to themselves, and vertices not reachable
+    from any root are mapped to -1.
+    `order` is an index array of the vertices reachable from the roots, in
+    an order in which every vertex comes after its immediate dominator.
+
+    Algorithm is that described in "A Simple, Fast Dominance Algorithm" by
+    Keith D. Cooper, Timothy J. Harvey and Ken Kennedy, Software Practice
+    and Experience 4 (2001) 1--10, applied to the graph extended by a
+    virtual root with an edge to each of the given roots.
+
+    """
+    vertex_count = graph.vertex_count
+    out_offsets, heads = graph.out_offsets, graph.heads
+    roots = index_array(roots)
+
+    # Depth-first search from the roots, recording vertices in postorder.
+    visited = bytearray(vertex_count)
+    postorder = index_array()
+    next_edge = index_array(out_offsets)
+    calls = filled_index_array(vertex_count)
+    for root in roots:
+        if visited[root]:
+            continue
+        visited[root] = 1
+        calls[0] = root
+        call_top = 1
+        while call_top:
+            vertex = calls[call_top - 1]
+            edge = next_edge[vertex]
+            end = out_offsets[vertex + 1]
+            while edge < end:
+                child = heads[edge]
+                edge += 1
+                if not visited[child]:
+                    break
+            else:
+                call_top -= 1
+                postorder.append(vertex)
+                continue
+            next_edge[vertex] = edge
+            visited[child] = 1
+            calls[call_top] = child
+            call_top += 1
+    del next_edge, calls
+
+    # Rank reachable vertices by reverse postorder, starting from 1; the
+    # virtual root has rank 0.  Dominators have lower rank than the vertices
+    # they dominate.
+    order = postorder[::-1]
+    del postorder
+    reachable_count = len(order)
+    rank = filled_index_array(vertex_count, -1)
+    for index, vertex in enumerate(order):
+        rank[vertex] = index + 1
+
+    # Predecessors of each rank, in terms of ranks.
+    is_root = bytearray(vertex_count)
+    for root in roots:
+        is_root[root] = 1
+    in_offsets, in_order, tails = graph.in_offsets, graph.in_order, graph.tails
+    predecessor_offsets = filled_index_array(reachable_count + 2)
+    predecessors = index_array()
+    for index, vertex in enumerate(order):
+        if is_root[vertex]:
+            predecessors.append(0)
+        for edge in in_order[in_offsets[vertex]:in_offsets[vertex + 1]]:
+            parent_rank = rank[tails[edge]]
+            if parent_rank != -1:
+                predecessors.append(parent_rank)
+        predecessor_offsets[index + 2] = len(predecessors)
+    del rank, is_root
+
+    # Iterate to a fixed point.
+    dominator_ranks = filled_index_array(reachable_count + 1, -1)
+    dominator_ranks[0] = 0
+    changed = True
+    while changed:
+        changed = False
+        for vertex_rank in range(1, reachable_count + 1):
+            new_dominator = -1
+            for parent_rank in predecessors[
+                    predecessor_offsets[vertex_rank]:
+                    predecessor_offsets[vertex_rank + 1]]:
+                if dominator_ranks[parent_rank] == -1:
+                    continue
+                if new_dominator == -1:
+                    new_dominator = parent_rank
+                    continue
+                # Find the nearest common dominator of the two.
+                while parent_rank != new_dominator:
+                    while parent_rank > new_dominator:
+                        parent_rank = dominator_ranks[parent_rank]
+                    while new_dominator > parent_rank:
+                        new_dominator = dominator_ranks[new_dominator]
+            if dominator_ranks[vertex_rank] != new_dominator:
+                dominator_ranks[vertex_rank] = new_dominator
+                changed = True
+
+    dominators = filled_index_array(vertex_count, -1)
+    for index, vertex in enumerate(order):
+        dominator_rank = dominator_ranks[index + 1]
+        if dominator_rank == 0:
+            dominators[vertex] = vertex
+        else:
+            dominators[vertex] = order[dominator_rank - 1]
+    return dominators, order
+
+
+def shortest_path(graph, start, end, max_length=None):
+    """
+    Find a shortest path from start to end in a CSRGraph.
+
+    Returns the list of vertices of the path, beginning with start and
+    ending with end, or None if there's no path with at most `max_length`
+    edges (or no path at all, if `max_length` is None).
+
+    Uses a bidirectional breadth-first search, expanding children of the
+    vertices reached from start and parents of the vertices reached from
+    end, a level at a time, always from whichever side has the smaller
+    frontier.  Only the vertices actually reached are recorded, so a
+    search that succeeds quickly costs little even on a huge graph.
+
+    """
+    if start == end:
+        return [start]
+
+    out_offsets, heads = graph.out_offsets, graph.heads
+    in_offsets, in_order = graph.in_offsets, graph.in_order
+    tails = graph.tails
+
+    # Mappings from each vertex reached to the vertex it was reached from.
+    forward = {start: -1}
+    backward = {end: -1}
+    forward_frontier = [start]
+    backward_frontier = [end]
+
+    # Total number of levels explored from both sides.
+    length = 0
+    meeting = None
+    while forward_frontier and backward_frontier and meeting is None:
+        if max_length is not None and length >= max_length:
+            break
+        length += 1
+
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier = []
+            for vertex in forward_frontier:
+                children = heads[out_offsets[vertex]:out_offsets[vertex + 1]]
+                for child in children:
+                    if child not in forward:
+                        forward[child] = vertex
+                        if child in backward:
+                            meeting = child
+                            break
+                        frontier.append(child)
+                if meeting is not None:
+                    break
+            forward_frontier = frontier
+        else:
+            frontier = []
+            for vertex in backward_frontier:
+                edges = in_order[in_offsets[vertex]:in_offsets[vertex + 1]]
+                for edge in edges:
+                    parent = tails[edge]
+                    if parent not in backward:
+                        backward[parent] = vertex
+                        if parent in forward:
+                            meeting = parent
+                            break
+                        frontier.append(parent)
+                if meeting is not None:
+                    break
+            backward_frontier = frontier
+
+    if meeting is None:
+        return None
+
+    path = []
+    vertex = meeting
+    while vertex != -1:
+        path.append(vertex)
+        vertex = forward[vertex]
+    path.reverse()
+    vertex = backward[meeting]
+    while vertex != -1:
+        path.append(vertex)
+        vertex = backward[vertex]
+    return path
+
+
+def breadth_first_order(graph, sources, generations=None, reverse=False):
+    """
+    Generate the vertices of a CSRGraph reachable from the given iterable
+    of source vertices, in breadth-first order, beginning with the sources.
+
+    If `generations` is given, only vertices at most that many edges away
+    from a source are generated.  If `reverse` is true, edges are followed
+    backwards, from head to tail.
+
+    """
+    if reverse:
+        offsets, order, ends = graph.in_offsets, graph.in_order, graph.tails
+    else:
+        offsets, order, ends = graph.out_offsets, None, graph.heads
+
+    visited = bytearray(graph.vertex_count)
+    queue = index_array()
+    for source in sources:
+        if not visited[source]:
+            visited[source] = 1
+            queue.append(source)
+            yield source
+
+    depth = 0
+    level_end = len(queue)
+    index = 0
+    while index < len(queue):
+        if index == level_end:
+            depth += 1
+            level_end = len(queue)
+        if depth == generations:
+            break
+        vertex = queue[index]
+        index += 1
+        first, last = offsets[vertex], offsets[vertex + 1]
+        edges = range(first, last) if order is None else order[first:last]
+        for edge in edges:
+            neighbour = ends[edge]
+            if not visited[neighbour]:
+                visited[neighbour] = 1
+                queue.append(neighbour)
+                yield neighbour
+
+
+def breadth_first_tree(graph, sources, targets=None):
+    """
+    Run a breadth-first search of a CSRGraph from the given iterable of
+    source vertices.
+
+    Returns an index array mapping each vertex reached to the vertex that it
+    was first reached from.  Sources are mapped to themselves, and vertices
+    not reached to -1.  Following these links back from any vertex reached
+    gives a shortest path to it from one of the sources.
+
+    If an iterable of `targets` is given, the search stops as soon as all of
+    them have been reached.
+
+    """
+    vertex_count = graph.vertex_count
+    out_offsets, heads = graph.out_offsets, graph.heads
+    predecessors = filled_index_array(vertex_count, -1)
+
+    if targets is None:
+        remaining = -1
+        is_target = None
+    else:
+        is_target = bytearray(vertex_count)
+        for target in targets:
+            is_target[target] = 1
+        remaining = sum(is_target)
+
+    queue = filled_index_array(vertex_count)
+    queue_end = 0
+    for source in sources:
+        if predecessors[source] == -1:
+            predecessors[source] = source
+            queue[queue_end] = source
+            queue_end += 1
+            if is_target is not None and is_target[source]:
+                remaining -= 1
+
+    queue_start = 0
+    while queue_start < queue_end and remaining:
+        vertex = queue[queue_start]
+        queue_start += 1
+        for child in heads[out_offsets[vertex]:out_offsets[vertex + 1]]:
+            if predecessors[child] == -1:
+                predecessors[child] = vertex
+                queue[queue_end] = child
+                queue_end += 1
+                if is_target is not None and is_target[child]:
+                    remaining -= 1
+    return predecessors
+
+
+# Number of search steps between checks of the clock, for searches with a
+# deadline.
+_STEPS_PER_CLOCK_CHECK = 1024
+
+
+def elementary_cycles(graph, labels, max_length=None, deadline=None,
+                      starts=None):
+    """
+    Generate the elementary cycles of a CSRGraph, as lists of vertices;
+    cycles differing only in their choice of parallel edges are generated
+    once.
+
+    `labels` should map each vertex to the number of its strongly connected
+    component, as returned by :func:`strongly_connected_components`; the
+    search for cycles through a vertex never leaves its component.
+
+    Each cycle is generated as a list of vertices, beginning with its
+    smallest vertex, such that there's an edge from each vertex to the next
+    and from the last vertex back to the first.  Cycles are generated in
+    order of their smallest vertex.
+
+    If `max_length` is given, only cycles with at most that many edges are
+    generated.  If `deadline` is given, generation stops once the value
+    of ``time.time()`` exceeds it.  If `starts` is given, it's an iterable
+    of vertices, and only cycles whose smallest vertex is one of them are
+    generated, in the order given; passing just the members of the
+    components that contain cycles saves searching from the others.
+
+    Without a length limit, this is the algorithm described in "Finding all
+    the elementary circuits of a directed graph" by Donald B. Johnson, SIAM
+    J. Comput. 4 (1975) 77--84, run iteratively.  Johnson's blocking rules
+    assume that every path may be extended without limit, so with a length
+    limit a depth-first search is used instead, pruned by the distance
+    from each vertex back to the start of the cycle.
+
+    """
+    if max_length is None:
+        search = _johnson_cycles
+    else:
+        search = _bounded_cycles
+
+    if starts is None:
+        starts = range(graph.vertex_count)
+
+    clock = _Clock(deadline)
+    for start in starts:
+        for cycle in search(graph, labels, start, max_length, clock):
+            yield cycle
+        if clock.expired():
+            return
+
+
+class _Clock(object):
+    """
+    Cheap deadline checks for long-running searches: the clock is consulted
+    only once every _STEPS_PER_CLOCK_CHECK steps.
+
+    """
+    __slots__ = ('deadline', 'steps', 'is_expired')
+
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.steps = 0
+        self.is_expired = False
+
+    def tick(self):
+        """
+        Record a step of the search, and return True if the deadline has
+        passed.
+
+        """
+        if self.deadline is None:
+            return False
+        self.steps += 1
+        if self.steps >= _STEPS_PER_CLOCK_CHECK:
+            self.steps = 0
+            if time.time() > self.deadline:
+                self.is_expired = True
+        return self.is_expired
+
+    def expired(self):
+        if self.deadline is not None and time.time() > self.deadline:
+            self.is_expired = True
+        return self.is_expired
+
+
+def _cycle_children(graph, labels, start):
+    """
+    Return a function giving the distinct children of a vertex that may
+    appear in a cycle whose smallest vertex is start.
+
+    """
+    out_offsets, heads = graph.out_offsets, graph.heads
+    label = labels[start]
+
+    def children(vertex):
+        # Parallel edges would give repeats of the same cycle.
+        seen = set()
+        result = []
+        for child in heads[out_offsets[vertex]:out_offsets[vertex + 1]]:
+            if child >= start and labels[child] == label and child not in seen:
+                seen.add(child)
+                result.append(child)
+        return result
+
+    return children
+
+
+def _johnson_cycles(graph, labels, start, max_length, clock):
+    """
+    Generate the elementary cycles whose smallest vertex is start, using
+    Johnson's algorithm.
+
+    """
+    children = _cycle_children(graph, labels, start)
+    blocked = {start}
+    blocked_by = {}
+    # Vertices of the path from which a cycle has been found.
+    closed = set()
+
+    path = [start]
+    stack = [children(start)]
+    while stack:
+        if clock.tick():
+            return
+        unexplored = stack[-1]
+        if unexplored:
+            child = unexplored.pop()
+            if child == start:
+                yield path[:]
+                closed.update(path)
+            elif child not in blocked:
+                path.append(child)
+                stack.append(children(child))
+                closed.discard(child)
+                blocked.add(child)
+                continue
+        if not unexplored:
+            # All children explored: leave the vertex.
+            vertex = path.pop()
+            stack.pop()
+            if vertex in closed:
+                # Unblock the vertex, and anything blocked by it.
+                to_unblock = [vertex]
+                while to_unblock:
+                    vertex = to_unblock.pop()
+                    if vertex in blocked:
+                        blocked.remove(vertex)
+                        to_unblock.extend(blocked_by.pop(vertex, ()))
+            else:
+                for child in children(vertex):
+                    blocked_by.setdefault(child, set()).add(vertex)
+
+
+def _bounded_cycles(graph, labels, start, max_length, clock):
+    """
+    Generate the elementary cycles with at most max_length edges whose
+    smallest vertex is start.
+
+    """
+    if max_length < 1:
+        return
+    children = _cycle_children(graph, labels, start)
+
+    # Distance from each vertex back to start, for vertices close enough to
+    # lie on a short enough cycle.
+    in_offsets, in_order = graph.in_offsets, graph.in_order
+    tails = graph.tails
+    label = labels[start]
+    distance = {start: 0}
+    frontier = [start]
+    for depth in range(1, max_length):
+        next_frontier = []
+        for vertex in frontier:
+            for edge in in_order[in_offsets[vertex]:in_offsets[vertex + 1]]:
+                parent = tails[edge]
+                if (parent not in distance and parent > start and
+                        labels[parent] == label):
+                    distance[parent] = depth
+                    next_frontier.append(parent)
+        frontier = next_frontier
+
+    path = [start]
+    on_path = {start}
+    stack = [children(start)]
+    while stack:
+        if clock.tick():
+            return
+        unexplored = stack[-1]
+        if not unexplored:
+            on_path.discard(path.pop())
+            stack.pop()
+            continue
+        child = unexplored.pop()
+        if child == start:
+            yield path[:]
+        elif (child not in on_path and child in distance and
+                len(path) + distance[child] <= max_length):
+            path.append(child)
+            on_path.add(child)
+            stack.append(children(child))
+
+
+def shortest_cycles(graph, labels, starts, max_length=None):
+    """
+    Generate, for each of the given start vertices of a CSRGraph, a
+    shortest cycle through that vertex.
+
+    `labels` should map each vertex to the number of its strongly connected
+    component, as returned by :func:`strongly_connected_components`; since a
+    cycle never leaves a component, neither does the search.
+
+    For each start vertex, generates either a list of vertices, beginning
+    with the start vertex, such that there's an edge from each vertex to the
+    next and from the last vertex back to the first, or None if there's no
+    cycle through the start vertex with at most `max_length` edges (or no
+    cycle at all, if `max_length` is None).
+
+    Each search is a breadth-first search from the start vertex.  The
+    scratch space for the searches is allocated once, and only the entries
+    touched by a search are reset after it.
+
+    """
+    out_offsets, heads = graph.out_offsets, graph.heads
+    # Vertex from which each vertex was reached, or -1.
+    predecessors = filled_index_array(graph.vertex_count, -1)
+    # Vertices reached, in the order reached; doubles as the queue.
+    reached = []
+
+    for start in starts:
+        label = labels[start]
+        reached.append(start)
+        predecessors[start] = start
+        # Number of edges from start to vertices in the current level.
+        depth = 0
+        level_end = 1
+        last = None
+        index = 0
+        while index < len(reached) and last is None:
+            if index == level_end:
+                depth += 1
+                level_end = len(reached)
+            if max_length is not None and depth >= max_length:
+                break
+            vertex = reached[index]
+            index += 1
+            for child in heads[out_offsets[vertex]:out_offsets[vertex + 1]]:
+                if child == start:
+                    last = vertex
+                    break
+                if predecessors[child] == -1 and labels[child] == label:
+                    predecessors[child] = vertex
+                    reached.append(child)
+
+        if last is None:
+            yield None
+        else:
+            cycle = [last]
+            while cycle[-1] != start:
+                cycle.append(predecessors[cycle[-1]])
+            cycle.reverse()
+            yield cycle
+
+        for vertex in reached:
+            predecessors[vertex] = -1
+        del reached[:]
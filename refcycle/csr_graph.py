@@ -0,0 +1,327 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compact array-based storage for the structure of a directed graph.
+
+A CSRGraph describes a directed graph whose vertices are the integers
+0, 1, ..., n-1 and whose edges are the integers 0, 1, ..., m-1.  Edges are
+grouped by tail, in compressed sparse row (CSR) form: the edges leaving
+vertex v are those in ``range(out_offsets[v], out_offsets[v+1])``, and
+``heads[e]`` is the head of edge e.  The reverse, compressed sparse column
+(CSC), structure is computed from the forward one on first use, and then
+cached; graphs that are only ever traversed forwards never pay for it.
+
+All the bookkeeping is held in ``array.array`` instances, which costs a few
+machine words per edge, in place of the several dictionary entries per edge
+needed for a dict-based representation.
+
+"""
+import array
+import bisect
+
+from six.moves import map, range
+
+
+def _index_typecode():
+    """
+    Return the array typecode to use for vertex and edge indices.
+
+    """
+    # The 'q' typecode isn't available on Python 2; there we fall back to
+    # 'l', which is 64 bits wide on most 64-bit platforms.
+    try:
+        array.array('q')
+    except ValueError:
+        return 'l'
+    else:
+        return 'q'
+
+
+INDEX_TYPECODE = _index_typecode()
+
+
+def index_array(initial=()):
+    """
+    Return an array suitable for holding vertex or edge indices.
+
+    """
+    return array.array(INDEX_TYPECODE, initial)
+
+
+def filled_index_array(length, value=0):
+    """
+    Return an index array of the given length, with every entry equal to
+    *value*.
+
+    """
+    return array.array(INDEX_TYPECODE, [value]) * length
+
+
+class CSRGraph(object):
+    """
+    Directed graph on the vertices 0, 1, ..., n-1, stored in compressed
+    sparse row form.
+
+    `out_offsets` is an index array of length n + 1
+    `heads` is an index array of length m giving the head of each edge
+    `in_offsets` and `in_order` give the edges entering each vertex: those
+       entering vertex v are in_order[in_offsets[v]:in_offsets[v+1]]
+    `tails` is an index array of length m giving the tail of each edge
+
+    The last three are computed when first needed.
+
+    """
+    __slots__ = (
+        'out_offsets', 'heads', '_in_offsets', '_in_order', '_tails',
+    )
+
+    def __init__(self, out_offsets, heads):
+        self.out_offsets = out_offsets
+        self.heads = heads
+        self._in_offsets = None
+        self._in_order = None
+        self._tails = None
+
+    @classmethod
+    def from_successors(cls, successors):
+        """
+        Create a CSRGraph from an iterable that gives, for each of the
+        vertices 0, 1, ..., n-1 in turn, an iterable of the heads of the
+        edges leaving that vertex.
+
+        """
+        out_offsets = index_array([0])
+        heads = index_array()
+        for vertex_heads in successors:
+            heads.extend(vertex_heads)
+            out_offsets.append(len(heads))
+        return cls(out_offsets, heads)
+
+    def _build_reverse(self):
+        """
+        Compute the compressed sparse column form of the graph: the edges
+        entering each vertex, and the tail of each edge.
+
+        """
+        out_offsets, heads = self.out_offsets, self.heads
+        vertex_count = len(out_offsets) - 1
+        edge_count = len(heads)
+
+        # Counting sort of the edges by head.
+        in_offsets = filled_index_array(vertex_count + 1)
+        for head in heads:
+            in_offsets[head + 1] += 1
+        for vertex in range(vertex_count):
+            in_offsets[vertex + 1] += in_offsets[vertex]
+
+        next_slot = index_array(in_offsets)
+        in_order = filled_index_array(edge_count)
+        tails = filled_index_array(edge_count)
+        for tail in range(vertex_count):
+            for edge in range(out_offsets[tail], out_offsets[tail + 1]):
+                head = heads[edge]
+                slot = next_slot[head]
+                in_order[slot] = edge
+                next_slot[head] = slot + 1
+                tails[edge] = tail
+
+        self._in_offsets = in_offsets
+        self._in_order = in_order
+        self._tails = tails
+
+    @property
+    def has_reverse(self):
+        """
+        True if the reverse structure has already been computed.
+
+        """
+        return self._tails is not None
+
+    @property
+    def in_offsets(self):
+        """
+        Offsets into in_order of the edges entering each vertex.
+
+        """
+        if self._in_offsets is None:
+            self._build_reverse()
+        return self._in_offsets
+
+    @property
+    def in_order(self):
+        """
+        Index array of the edges, sorted by head.
+
+        """
+        if self._in_order is None:
+            self._build_reverse()
+        return self._in_order
+
+    @property
+    def tails(self):
+        """
+        Index array giving the tail of each edge.
+
+        """
+        if self._tails is None:
+            self._build_reverse()
+        return self._tails
+
+    @property
+    def vertex_count(self):
+        """
+        Number of vertices in the graph.
+
+        """
+        return len(self.out_offsets) - 1
+
+    @property
+    def edge_count(self):
+        """
+        Number of edges in the graph.
+
+        """
+        return len(self.heads)
+
+    def out_degrees(self):
+        """
+        Return an index array giving the number of edges leaving each
+        vertex.
+
+        """
+        out_offsets = self.out_offsets
+        return index_array(
+            out_offsets[vertex + 1] - out_offsets[vertex]
+            for vertex in range(self.vertex_count)
+        )
+
+    def in_degrees(self):
+        """
+        Return an index array giving the number of edges entering each
+        vertex.
+
+        """
+        if self._in_offsets is not None:
+            in_offsets = self._in_offsets
+            return index_array(
+                in_offsets[vertex + 1] - in_offsets[vertex]
+                for vertex in range(self.vertex_count)
+            )
+        in_degrees = filled_index_array(self.vertex_count)
+        for head in self.heads:
+            in_degrees[head] += 1
+        return in_degrees
+
+    def head(self, edge):
+        """
+        Return the head of the given edge.
+
+        """
+        return self.heads[edge]
+
+    def tail(self, edge):
+        """
+        Return the tail of the given edge.
+
+        """
+        if self._tails is None:
+            # Avoid building the reverse structure just for this: the tail
+            # is the vertex whose range of out-edges contains the edge.
+            if not 0 <= edge < len(self.heads):
+                raise IndexError("edge index out of range")
+            return bisect.bisect_right(self.out_offsets, edge) - 1
+        return self._tails[edge]
+
+    def out_edges(self, vertex):
+        """
+        Return the range of edges leaving the given vertex.
+
+        """
+        return range(self.out_offsets[vertex], self.out_offsets[vertex + 1])
+
+    def in_edges(self, vertex):
+        """
+        Return an array of the edges entering the given vertex.
+
+        """
+        return self.in_order[
+            self.in_offsets[vertex]:self.in_offsets[vertex + 1]]
+
+    def children(self, vertex):
+        """
+        Return an array of the heads of the edges leaving the given vertex.
+
+        """
+        return self.heads[
+            self.out_offsets[vertex]:self.out_offsets[vertex + 1]]
+
+    def parents(self, vertex):
+        """
+        Return a list of the tails of the edges entering the given vertex.
+
+        """
+        return list(self.iter_parents(vertex))
+
+    def iter_parents(self, vertex):
+        """
+        Return an iterator over the tails of the edges entering the given
+        vertex.
+
+        """
+        return map(self.tails.__getitem__, self.in_edges(vertex))
+
+    def subgraph(self, vertices):
+        """
+        Return the full subgraph on the given vertices.
+
+        `vertices` is a sequence of distinct vertices of this graph.  In the
+        returned graph, ``vertices[i]`` is renumbered as vertex i.  The edges
+        of the subgraph are the edges of this graph between those vertices,
+        renumbered consecutively.
+
+        """
+        renumber = {vertex: i for i, vertex in enumerate(vertices)}
+        return type(self).from_successors(
+            [
+                renumber[head]
+                for head in self.children(vertex)
+                if head in renumber
+            ]
+            for vertex in vertices
+        )
+
+    def owned_objects(self):
+        """
+        List of the objects owned by this CSRGraph: the graph itself and the
+        arrays computed so far.
+
+        """
+        arrays = [
+            self.out_offsets, self.heads,
+            self._in_offsets, self._in_order, self._tails,
+        ]
+        return [self] + [a for a in arrays if a is not None]
+
+    def nbytes(self):
+        """
+        Number of bytes used by the arrays holding the graph structure.
+
+        Only the arrays computed so far are counted.
+
+        """
+        arrays = [
+            self.out_offsets, self.heads,
+            self._in_offsets, self._in_order, self._tails,
+        ]
+        return sum(len(a) * a.itemsize for a in arrays if a is not None)
@@ -21,36 +21,41 @@ A directed graph consists of:
   - a mapping 'heads' from edges to vertices
   - a mapping 'tails' from edges to vertices
 
+Here vertices are numbered consecutively and edges are positions in a
+contiguous edge table, so the heads and tails mappings are array lookups.
+
 This setup allows for self-edges, and multiple edges between a pair of
 vertices.  Since we want to use these directed graphs to represent references
 between Python objects, both these capabilities are necessary.
 
 """
-import collections
 import itertools
 
 import six
+from six.moves import range
 
 from refcycle.annotated_graph import (
     AnnotatedEdge,
     AnnotatedGraph,
     AnnotatedVertex,
 )
+from refcycle.csr_graph import CSRGraph
 from refcycle.i_directed_graph import IDirectedGraph
+from refcycle.indexed_vertex_set import IndexedVertexSet
 
 
 class DirectedGraph(IDirectedGraph):
     """
     Object representing a directed graph.
 
-    `vertices` is a set of vertices
-    `edges` is a set of edges
-    `heads` is a mapping from edges to vertices mapping
-       each edge to its head
-    `tails` is a mapping from edges to vertices mapping
-       each edge to its tail
+    `vertices` is an IndexedVertexSet numbering the vertices
+    `adjacency` is a CSRGraph describing the edges in terms
+       of the vertex numbers
+
+    Edges are identified by consecutive integers: their positions
+    in the edge table of `adjacency`.
 
-    `vertices` and `edges` may contain any hashable Python objects.
+    `vertices` may contain any hashable Python objects.
 
     """
     ###########################################################################
@@ -62,28 +67,46 @@ class DirectedGraph(IDirectedGraph):
         Return the head (target, destination) of the given edge.
 
         """
-        return self._heads[edge]
+        return self._vertices[self._adjacency.head(edge)]
 
     def tail(self, edge):
         """
         Return the tail (source) of the given edge.
 
         """
-        return self._tails[edge]
+        return self._vertices[self._adjacency.tail(edge)]
 
     def out_edges(self, vertex):
         """
-        Return a list of the edges leaving the given vertex.
+        Return a range of the edges leaving the given vertex.
 
         """
-        return self._out_edges[vertex]
+        return self._adjacency.out_edges(self._vertices.index(vertex))
 
     def in_edges(self, vertex):
         """
-        Return a list of the edges entering the given vertex.
+        Return an array of the edges entering the given vertex.
+
+        """
+        return self._adjacency.in_edges(self._vertices.index(vertex))
 
+    def iter_children(self, vertex):
         """
-        return self._in_edges[vertex]
+        Return an iterator over the immediate children of the given vertex.
+
+        """
+        vertices = self._vertices
+        return vertices.iter_elements(
+            self._adjacency.children(vertices.index(vertex)))
+
+    def iter_parents(self, vertex):
+        """
+        Return an iterator over the immediate parents of the given vertex.
+
+        """
+        vertices = self._vertices
+        return vertices.iter_elements(
+            self._adjacency.iter_parents(vertices.index(vertex)))
 
     @property
     def vertices(self):
@@ -91,7 +114,7 @@ class DirectedGraph(IDirectedGraph):
 
     @property
     def edges(self):
-        return self._edges
+        return range(self._adjacency.edge_count)
 
     def full_subgraph(self, vertices):
         """
@@ -100,28 +123,25 @@ class DirectedGraph(IDirectedGraph):
         of the original graph between those vertices.
 
         """
-        subgraph_vertices = {v for v in vertices}
-        subgraph_edges = {edge
-                          for v in subgraph_vertices
-                          for edge in self._out_edges[v]
-                          if self._heads[edge] in subgraph_vertices}
-        subgraph_heads = {edge: self._heads[edge]
-                          for edge in subgraph_edges}
-        subgraph_tails = {edge: self._tails[edge]
-                          for edge in subgraph_edges}
+        subgraph_vertices = IndexedVertexSet()
+        subgraph_vertices.update(vertices)
+        index = self._vertices.index
+        subgraph_adjacency = self._adjacency.subgraph(
+            [index(v) for v in subgraph_vertices])
         return DirectedGraph._raw(
             vertices=subgraph_vertices,
-            edges=subgraph_edges,
-            heads=subgraph_heads,
-            tails=subgraph_tails,
+            adjacency=subgraph_adjacency,
         )
 
+    def _integer_graph(self):
+        return self._vertices, self._adjacency
+
     ###########################################################################
     ### DirectedGraph constructors.
     ###########################################################################
 
     @classmethod
-    def _raw(cls, vertices, edges, heads, tails):
+    def _raw(cls, vertices, adjacency):
         """
         Private constructor for direct construction of
         a DirectedGraph from its consituents.
@@ -129,17 +149,7 @@ class DirectedGraph(IDirectedGraph):
         """
         self = object.__new__(cls)
         self._vertices = vertices
-        self._edges = edges
-        self._heads = heads
-        self._tails = tails
-
-        # For future use, map each vertex to its outward and inward edges.
-        # These could be computed on demand instead of precomputed.
-        self._out_edges = collections.defaultdict(set)
-        self._in_edges = collections.defaultdict(set)
-        for edge in self._edges:
-            self._out_edges[self._tails[edge]].add(edge)
-            self._in_edges[self._heads[edge]].add(edge)
+        self._adjacency = adjacency
         return self
 
     @classmethod
@@ -149,26 +159,14 @@ class DirectedGraph(IDirectedGraph):
         a mapping giving the vertices that each vertex is connected to.
 
         """
-        vertices = set(vertices)
-        edges = set()
-        heads = {}
-        tails = {}
-
-        # Number the edges arbitrarily.
-        edge_identifier = itertools.count()
-        for tail in vertices:
-            for head in edge_mapper[tail]:
-                edge = next(edge_identifier)
-                edges.add(edge)
-                heads[edge] = head
-                tails[edge] = tail
-
-        return cls._raw(
-            vertices=vertices,
-            edges=edges,
-            heads=heads,
-            tails=tails,
+        vertex_set = IndexedVertexSet()
+        vertex_set.update(vertices)
+        index = vertex_set.index
+        adjacency = CSRGraph.from_successors(
+            [index(head) for head in edge_mapper[tail]]
+            for tail in vertex_set
         )
+        return cls._raw(vertices=vertex_set, adjacency=adjacency)
 
     @classmethod
     def from_edge_pairs(cls, vertices, edge_pairs):
@@ -177,25 +175,17 @@ class DirectedGraph(IDirectedGraph):
         and a collection of pairs giving links between the vertices.
 
         """
-        vertices = set(vertices)
-        edges = set()
-        heads = {}
-        tails = {}
+        vertex_set = IndexedVertexSet()
+        vertex_set.update(vertices)
+        index = vertex_set.index
 
-        # Number the edges arbitrarily.
-        edge_identifier = itertools.count()
+        # Group the edges by tail.
+        successors = [[] for _ in vertex_set]
         for tail, head in edge_pairs:
-            edge = next(edge_identifier)
-            edges.add(edge)
-            heads[edge] = head
-            tails[edge] = tail
-
-        return cls._raw(
-            vertices=vertices,
-            edges=edges,
-            heads=heads,
-            tails=tails,
-        )
+            successors[index(tail)].append(index(head))
+
+        adjacency = CSRGraph.from_successors(successors)
+        return cls._raw(vertices=vertex_set, adjacency=adjacency)
 
     def annotated(self):
         """
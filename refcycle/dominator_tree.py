@@ -0,0 +1,157 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The dominator tree of a directed graph with respect to a set of roots.
+
+"""
+from refcycle.csr_graph import CSRGraph, filled_index_array, index_array
+
+
+class DominatorTree(object):
+    """
+    The dominator tree of a directed graph with respect to a set of roots.
+
+    A vertex u dominates a vertex v if every path from a root to v passes
+    through u.  For a graph of Python objects rooted at the objects that are
+    known to be alive, the vertices dominated by an object are those that
+    would become unreachable if that object went away.
+
+    The immediate dominator of v is the dominator of v, other than v itself,
+    that is dominated by all the others.  Roots have no immediate dominator,
+    and neither do vertices reachable along disjoint paths from two
+    different roots.
+
+    `vertices` is an IndexedVertexSet numbering the vertices of the graph
+    `dominators` is an index array mapping the position of each vertex to
+       the position of its immediate dominator; vertices with no immediate
+       dominator are mapped to themselves, and vertices not reachable from
+       the roots to -1
+    `order` is an index array of the positions of the vertices reachable from
+       the roots, in an order in which each vertex comes after its immediate
+       dominator
+
+    """
+    def __init__(self, vertices, dominators, order):
+        self.vertices = vertices
+        self.dominators = dominators
+        self.order = order
+        self._tree = None
+
+    def __repr__(self):
+        return "<{}.{} with {} reachable vertices at 0x{:x}>".format(
+            self.__module__,
+            type(self).__name__,
+            len(self.order),
+            id(self),
+        )
+
+    def reachable(self, vertex):
+        """
+        Return True if the given vertex is reachable from the roots.
+
+        """
+        return self.dominators[self.vertices.index(vertex)] != -1
+
+    def immediate_dominator(self, vertex):
+        """
+        Return the immediate dominator of the given vertex, or None if it
+        has no immediate dominator.
+
+        Raises ValueError if the vertex isn't reachable from the roots.
+
+        """
+        position = self.vertices.index(vertex)
+        dominator = self.dominators[position]
+        if dominator == -1:
+            raise ValueError(
+                "Vertex isn't reachable from the roots: {!r}".format(vertex))
+        if dominator == position:
+            return None
+        return self.vertices[dominator]
+
+    def dominates(self, dominator, vertex):
+        """
+        Return True if the first vertex dominates the second.
+
+        Every vertex reachable from the roots dominates itself.
+
+        """
+        dominators = self.dominators
+        target = self.vertices.index(dominator)
+        position = self.vertices.index(vertex)
+        if dominators[position] == -1:
+            return False
+        while position != target:
+            dominator = dominators[position]
+            if dominator == position:
+                return False
+            position = dominator
+        return True
+
+    def dominated(self, vertex):
+        """
+        Return the list of vertices whose immediate dominator is the given
+        vertex.
+
+        """
+        vertices = self.vertices
+        return [
+            vertices[position]
+            for position in self._dominated_by(vertices.index(vertex))
+        ]
+
+    def _dominated_by(self, position):
+        # The tree is stored as a CSRGraph with an edge from each vertex to
+        # its immediate dominator, so that the vertices immediately dominated
+        # by a vertex are its parents.
+        if self._tree is None:
+            dominators = self.dominators
+            out_offsets = filled_index_array(len(dominators) + 1)
+            heads = index_array()
+            for vertex, dominator in enumerate(dominators):
+                if dominator != -1 and dominator != vertex:
+                    heads.append(dominator)
+                out_offsets[vertex + 1] = len(heads)
+            self._tree = CSRGraph(out_offsets, heads)
+        return self._tree.parents(position)
+
+    def retained_sizes(self, sizes):
+        """
+        Return an index array giving the retained size of each vertex.
+
+        `sizes` should map the position of each vertex to its own size.
+        The retained size of a vertex is the total size of the vertices it
+        dominates, itself included; vertices not reachable from the roots
+        have retained size 0.
+
+        """
+        dominators = self.dominators
+        retained = filled_index_array(len(dominators))
+        for position in self.order:
+            retained[position] = sizes[position]
+        for position in reversed(self.order):
+            dominator = dominators[position]
+            if dominator != position:
+                retained[dominator] += retained[position]
+        return retained
+
+    def owned_objects(self):
+        """
+        List of gc-tracked objects owned by this DominatorTree instance.
+
+        """
+        objects = [self, self.__dict__, self.dominators, self.order]
+        if self._tree is not None:
+            objects.extend(self._tree.owned_objects())
+        return objects
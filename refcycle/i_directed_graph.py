@@ -16,7 +16,25 @@ Abstract base class for the various flavours of directed graph.
 
 """
 import abc
-from collections import Container, Counter, deque, Iterable, Sized
+from collections import Container, Counter, Iterable, Sized
+import heapq
+import time
+
+from six.moves import map, range
+
+from refcycle.condensation import Condensation
+from refcycle.csr_algorithms import (
+    breadth_first_order,
+    breadth_first_tree,
+    elementary_cycles as csr_elementary_cycles,
+    immediate_dominators,
+    shortest_cycles as csr_shortest_cycles,
+    shortest_path as csr_shortest_path,
+    strongly_connected_components,
+)
+from refcycle.csr_graph import CSRGraph
+from refcycle.dominator_tree import DominatorTree
+from refcycle.indexed_vertex_set import IndexedVertexSet
 
 
 class IDirectedGraph(Container, Iterable, Sized):
@@ -77,6 +95,17 @@ class IDirectedGraph(Container, Iterable, Sized):
 
         """
 
+    def materialize(self):
+        """
+        Return a standalone graph with the same vertices and edges as this
+        one, not depending on any other graph.
+
+        Graphs are standalone unless they're views sharing the storage of
+        another graph, so by default this returns the graph itself.
+
+        """
+        return self
+
     @classmethod
     def vertex_set(cls):
         """
@@ -99,6 +128,17 @@ class IDirectedGraph(Container, Iterable, Sized):
         """
         return dict()
 
+    @classmethod
+    def vertex_numbering(cls):
+        """
+        Return an empty IndexedVertexSet suitable for numbering vertices.
+
+        Usually vertices can be identified by equality; for the ObjectGraph
+        we'll override to identify them by id instead.
+
+        """
+        return IndexedVertexSet()
+
     @classmethod
     def vertex_equal(cls, vertex1, vertex2):
         """
@@ -109,6 +149,45 @@ class IDirectedGraph(Container, Iterable, Sized):
         """
         return vertex1 == vertex2
 
+    def _integer_graph(self):
+        """
+        Return the structure of this graph in integer form, if available.
+
+        Graphs that store their structure as a CSRGraph return a pair
+        (vertices, adjacency), where vertices is an IndexedVertexSet
+        numbering the vertices in iteration order, and adjacency is the
+        CSRGraph in terms of that numbering.  Other graphs return None.
+
+        Algorithms can use this to work with integer vertex indices in place
+        of the vertices themselves.
+
+        """
+        return None
+
+    def _integer_form(self):
+        """
+        Return the structure of this graph in integer form, as a pair
+        (vertices, adjacency) like that returned by :meth:`_integer_graph`.
+
+        For graphs without a stored integer form, it's built on first use
+        and cached under the name ``'integer_graph'``.
+
+        """
+        integer_graph = self._integer_graph()
+        if integer_graph is None:
+            integer_graph = self._cached_analysis(
+                'integer_graph', self._build_integer_graph)
+        return integer_graph
+
+    def _build_integer_graph(self):
+        vertices = self.vertex_numbering()
+        vertices.update(self.vertices)
+        adjacency = CSRGraph.from_successors(
+            list(map(vertices.index, self.iter_children(vertex)))
+            for vertex in vertices
+        )
+        return vertices, adjacency
+
     def __len__(self):
         """
         Number of vertices in the graph.
@@ -143,14 +222,31 @@ class IDirectedGraph(Container, Iterable, Sized):
         Return the list of immediate children of the given vertex.
 
         """
-        return [self.head(edge) for edge in self.out_edges(vertex)]
+        return list(self.iter_children(vertex))
 
     def parents(self, vertex):
         """
         Return the list of immediate parents of this vertex.
 
         """
-        return [self.tail(edge) for edge in self.in_edges(vertex)]
+        return list(self.iter_parents(vertex))
+
+    def iter_children(self, vertex):
+        """
+        Return an iterator over the immediate children of the given vertex.
+
+        Unlike :meth:`children`, this doesn't build a list, so it's the
+        cheaper choice when the children are only looped over once.
+
+        """
+        return map(self.head, self.out_edges(vertex))
+
+    def iter_parents(self, vertex):
+        """
+        Return an iterator over the immediate parents of the given vertex.
+
+        """
+        return map(self.tail, self.in_edges(vertex))
 
     def references(self):
         """
@@ -161,7 +257,7 @@ class IDirectedGraph(Container, Iterable, Sized):
         return [
             (tail, head)
             for tail in self.vertices
-            for head in self.children(tail)
+            for head in self.iter_children(tail)
         ]
 
     def descendants(self, start, generations=None):
@@ -173,18 +269,7 @@ class IDirectedGraph(Container, Iterable, Sized):
         many generations to limit to.
 
         """
-        visited = self.vertex_set()
-        visited.add(start)
-        to_visit = deque([(start, 0)])
-        while to_visit:
-            vertex, depth = to_visit.popleft()
-            if depth == generations:
-                continue
-            for child in self.children(vertex):
-                if child not in visited:
-                    visited.add(child)
-                    to_visit.append((child, depth+1))
-        return self.full_subgraph(visited)
+        return self.full_subgraph(self.reachable_from([start], generations))
 
     def ancestors(self, start, generations=None):
         """
@@ -195,167 +280,335 @@ class IDirectedGraph(Container, Iterable, Sized):
         many generations to limit to.
 
         """
-        visited = self.vertex_set()
-        visited.add(start)
-        to_visit = deque([(start, 0)])
-        while to_visit:
-            vertex, depth = to_visit.popleft()
-            if depth == generations:
-                continue
-            for parent in self.parents(vertex):
-                if parent not in visited:
-                    visited.add(parent)
-                    to_visit.append((parent, depth+1))
-        return self.full_subgraph(visited)
+        return self.full_subgraph(
+            self.reachable_from([start], generations, direction='parents'))
 
-    def shortest_path(self, start, end):
+    def iter_reachable_from(self, starts, generations=None,
+                            direction='children'):
+        """
+        Generate the vertices reachable from any of the given start
+        vertices, in breadth-first order, beginning with the start vertices
+        themselves.
+
+        If specified, the optional `generations` argument specifies how
+        many generations to limit to.  `direction` should be either
+        ``'children'``, to follow edges forwards, or ``'parents'``, to
+        follow them backwards.
+
+        The arguments are checked when this method is called, rather than
+        when iteration begins.
+
+        """
+        if direction not in ('children', 'parents'):
+            raise ValueError(
+                "direction should be 'children' or 'parents', "
+                "not {!r}".format(direction))
+
+        vertices, adjacency = self._integer_form()
+        positions = breadth_first_order(
+            adjacency,
+            [vertices.index(start) for start in starts],
+            generations=generations,
+            reverse=direction == 'parents',
+        )
+        return vertices.iter_elements(positions)
+
+    def reachable_from(self, starts, generations=None, direction='children',
+                       count_only=False):
+        """
+        Return the set of vertices reachable from any of the given start
+        vertices, including the start vertices themselves.
+
+        Arguments are as for :meth:`iter_reachable_from`.  The result is a
+        set of the kind returned by :meth:`vertex_set`, or just the number
+        of vertices reached if `count_only` is true.  Either way, no
+        subgraph is constructed.
+
+        """
+        reachable = self.iter_reachable_from(starts, generations, direction)
+        if count_only:
+            return sum(1 for _ in reachable)
+        vertex_set = self.vertex_set()
+        for vertex in reachable:
+            vertex_set.add(vertex)
+        return vertex_set
+
+    def shortest_path(self, start, end, max_length=None):
         """
         Find a shortest path from start to end.
 
         Returns the subgraph consisting of the vertices in that path
         and (all) the edges between them.
 
-        Raises ValueError if no path from start to end exists.
+        If `max_length` is given, only paths with at most that many edges
+        are considered.  Raises ValueError if no path from start to end
+        exists.
         """
-        # Vertices whose children are yet to be explored.
-        to_visit = deque([start])
+        return self.full_subgraph(
+            self.shortest_path_vertices(start, end, max_length))
 
-        # Mapping from each child to the parent that it was first found via.
-        # We map the start vertex to a dummy object.
-        dummy = object()
-        explored = self.vertex_dict()
-        explored[start] = dummy
+    def shortest_path_vertices(self, start, end, max_length=None):
+        """
+        Find a shortest path from start to end.
 
-        # Breadth-first search, rooted at ``start``.
-        while to_visit:
-            if end in explored:
-                break
+        Returns the list of vertices on that path, in order, beginning with
+        start and ending with end.
 
-            parent = to_visit.popleft()
-            for child in self.children(parent):
-                if child not in explored:
-                    explored[child] = parent
-                    to_visit.append(child)
-        else:
+        If `max_length` is given, only paths with at most that many edges
+        are considered.  Raises ValueError if no path from start to end
+        exists.
+        """
+        vertices, adjacency = self._integer_form()
+        path = csr_shortest_path(
+            adjacency,
+            vertices.index(start),
+            vertices.index(end),
+            max_length,
+        )
+        if path is None:
             raise ValueError("No path found.")
+        return [vertices[position] for position in path]
+
+    def elementary_cycles(self, max_length=None, max_count=None,
+                          time_budget=None):
+        """
+        Generate the elementary cycles of this graph.
+
+        An elementary cycle is a closed path that visits no vertex twice.
+        Each cycle is generated as a list of vertices, such that there's an
+        edge from each vertex to the next and from the last vertex back to
+        the first.  Cycles are found one strongly connected component at a
+        time, and generated as they're found.
+
+        Even a modest component can have an enormous number of cycles, so
+        generation can be bounded: `max_length` limits the number of edges
+        in each cycle, `max_count` the number of cycles generated, and
+        `time_budget` the number of seconds spent searching.
+
+        """
+        if max_count is not None and max_count <= 0:
+            return
+        deadline = None if time_budget is None else time.time() + time_budget
+
+        # Only members of components with internal edges can lie on a
+        # cycle, so search from those alone.
+        vertices, adjacency = self._integer_form()
+        condensation = self.condensation()
+        starts = (
+            position
+            for component in condensation.topological_order
+            if condensation.internal_edge_count(component)
+            for position in condensation.member_positions(component)
+        )
+        cycles = csr_elementary_cycles(
+            adjacency,
+            condensation.labels,
+            max_length=max_length,
+            deadline=deadline,
+            starts=starts,
+        )
+        for count, cycle in enumerate(cycles, start=1):
+            yield [vertices[position] for position in cycle]
+            if count == max_count:
+                return
+
+    def retention_paths(self, roots, targets):
+        """
+        Find shortest paths from a collection of roots to each of a
+        collection of targets.
+
+        Uses a single breadth-first search from all of the roots at once, so
+        the cost is at most linear in the size of the graph, however many
+        targets there are.
+
+        Returns a pair (paths, unreachable).  `paths` is a list containing,
+        for each target reachable from the roots, a shortest list of
+        vertices leading from some root to that target; `unreachable` is the
+        list of targets not reachable from any root, including any targets
+        that aren't vertices of the graph.  Both lists follow the order of
+        the given targets.
+        """
+        vertices, adjacency = self._integer_form()
+        root_positions = [vertices.index(root) for root in roots]
+        targets = list(targets)
+        target_positions = [
+            vertices.index(target) if target in vertices else None
+            for target in targets
+        ]
+        predecessors = breadth_first_tree(
+            adjacency,
+            root_positions,
+            [target for target in target_positions if target is not None],
+        )
 
-        # Backtrack to construct vertices of path.
-        vertex = end
-        path = []
-        while vertex is not dummy:
-            path.append(vertex)
-            vertex = explored[vertex]
-
-        return self.full_subgraph(path)
+        paths = []
+        unreachable = []
+        for original, target in zip(targets, target_positions):
+            if target is None or predecessors[target] == -1:
+                unreachable.append(original)
+                continue
+            path = [target]
+            while predecessors[path[-1]] != path[-1]:
+                path.append(predecessors[path[-1]])
+            paths.append([vertices[position] for position in reversed(path)])
+        return paths, unreachable
 
-    def shortest_cycle(self, start):
+    def shortest_cycle(self, start, max_length=None):
         """
         Find a shortest cycle including start.
 
         Returns the subgraph consisting of the vertices in that cycle
         and (all) the edges between them.
 
-        Raises ValueError if no cycle including start exists.
+        If `max_length` is given, only cycles with at most that many edges
+        are considered.  Raises ValueError if no cycle including start
+        exists.
+
+        The search never leaves the strongly connected component of start,
+        and for a vertex whose component contains no cycle there's no
+        search at all: the (cached) condensation of the graph shows
+        immediately that there's no cycle.
+        """
+        vertices, adjacency = self._integer_form()
+        position = vertices.index(start)
+        condensation = self.condensation()
+        labels = condensation.labels
+        if condensation.internal_edge_count(labels[position]) == 0:
+            raise ValueError("No path found.")
+
+        cycle, = csr_shortest_cycles(
+            adjacency, labels, [position], max_length)
+        if cycle is None:
+            raise ValueError("No path found.")
+        return self.full_subgraph([vertices[index] for index in cycle])
+
+    def shortest_cycles(self, vertices=None, distinct=False):
+        """
+        Find a shortest cycle through each of the given vertices.
+
+        If no vertices are given, all vertices of the graph are used.
+
+        Returns a list containing, for each vertex, either a list of the
+        vertices of a shortest cycle through it, beginning with that vertex,
+        or None if no cycle passes through it.  If `distinct` is true,
+        returns instead just the list of distinct cycles found, in the order
+        they're found.  Each begins with the vertex it was first found from,
+        which isn't necessarily the first of the given vertices that it
+        passes through.
+
+        Unlike repeated calls to :meth:`shortest_cycle`, each search is
+        restricted to the strongly connected component of its start vertex,
+        and no subgraphs are constructed.
         """
-        # Vertices whose children are yet to be explored.
-        to_visit = deque([start])
+        graph_vertices, adjacency = self._integer_form()
+        if vertices is None:
+            starts = range(len(graph_vertices))
+        else:
+            starts = [graph_vertices.index(vertex) for vertex in vertices]
+        cycles = csr_shortest_cycles(
+            adjacency, self.condensation().labels, starts)
+
+        if not distinct:
+            return [
+                None if cycle is None else [
+                    graph_vertices[position] for position in cycle]
+                for cycle in cycles
+            ]
+
+        # Identify each cycle by its rotation beginning at its least vertex.
+        seen = set()
+        distinct_cycles = []
+        for cycle in cycles:
+            if cycle is None:
+                continue
+            least = cycle.index(min(cycle))
+            key = tuple(cycle[least:] + cycle[:least])
+            if key not in seen:
+                seen.add(key)
+                distinct_cycles.append(
+                    [graph_vertices[position] for position in cycle])
+        return distinct_cycles
 
-        # Mapping from each child to the parent that it was first found via.
-        explored = self.vertex_dict()
+    def _cached_analysis(self, name, compute):
+        """
+        Return the result of the named analysis of this graph, calling
+        ``compute()`` to produce it the first time it's needed.
+
+        Graphs aren't modified after construction, so results are kept
+        until discarded by :meth:`clear_analysis_cache`.
 
-        # Breadth-first search, rooted at ``start``.
-        while to_visit:
-            if start in explored:
-                break
+        """
+        cache = self.__dict__.setdefault('_analysis_cache', {})
+        try:
+            return cache[name]
+        except KeyError:
+            result = cache[name] = compute()
+            return result
 
-            parent = to_visit.popleft()
-            for child in self.children(parent):
-                if child not in explored:
-                    explored[child] = parent
-                    to_visit.append(child)
+    def clear_analysis_cache(self, *names):
+        """
+        Discard cached analysis results.
+
+        Results of analyses such as :meth:`condensation` are cached on the
+        graph and reused by later calls.  With no arguments, this discards
+        the whole cache, releasing the memory it uses.  Otherwise it discards
+        only the results with the given names, such as ``'condensation'``
+        or ``'typename_index'``.
+
+        """
+        cache = self.__dict__.get('_analysis_cache')
+        if cache is None:
+            return
+        if names:
+            for name in names:
+                cache.pop(name, None)
         else:
-            raise ValueError("No path found.")
+            del self.__dict__['_analysis_cache']
 
-        # Backtrack to construct vertices of path.
-        vertex = start
-        path = []
-        while True:
-            path.append(vertex)
-            vertex = explored[vertex]
-            if self.vertex_equal(vertex, start):
-                break
+    def condensation(self):
+        """
+        Return the condensation of this graph.
+
+        The condensation is the directed acyclic graph obtained by
+        contracting each strongly connected component to a single vertex.
+        It's returned as a :class:`~refcycle.condensation.Condensation`
+        instance, which records the component of each vertex, the edges
+        between components together with their multiplicities, and a
+        topological order of the components.
 
-        return self.full_subgraph(path)
+        The result is cached; see :meth:`clear_analysis_cache`.
 
-    def _component_graph(self):
         """
-        Compute the graph of strongly connected components.
+        # The cached condensation doesn't refer to this graph, to avoid
+        # creating a reference cycle.
+        condensation = self._cached_analysis(
+            'condensation', self._condensation)
+        return condensation.for_graph(self)
 
-        Each strongly connected component is itself represented as a list of
-        pairs, giving information not only about the vertices belonging to
-        this strongly connected component, but also the edges leading from
-        this strongly connected component to other components.
+    def _condensation(self):
+        """
+        Compute the condensation of this graph, without a reference to the
+        graph itself.
 
-        Each pair is of the form ('EDGE', v) or ('VERTEX', v) for some vertex
-        v.  In the first case, that indicates that there's an edge from this
-        strongly connected component to the given vertex v (which will belong
-        to another component); in the second, it indicates that v is a member
-        of this strongly connected component.
+        """
+        vertices, adjacency = self._integer_form()
+        component_count, labels = strongly_connected_components(adjacency)
 
-        Each component will begin with a vertex (the *root* vertex of the
-        strongly connected component); the following edges are edges from that
-        vertex.
+        return Condensation(
+            graph=None,
+            vertices=vertices,
+            labels=labels,
+            component_count=component_count,
+            children=adjacency.children,
+        )
 
-        Algorithm is based on that described in "Path-based depth-first search
-        for strong and biconnected components" by Harold N. Gabow,
-        Inf.Process.Lett. 74 (2000) 107--114.
+    def _component_subgraph(self, condensation, component):
+        """
+        Return the full subgraph on the given component of the given
+        condensation of this graph.
 
         """
-        sccs = []
-        stack = []
-        boundaries = []
-        identified = self.vertex_set()
-        index = self.vertex_dict()
-        to_do = []
-
-        def visit_vertex(v):
-            index[v] = len(stack)
-            stack.append(('VERTEX', v))
-            boundaries.append(index[v])
-            to_do.append((leave_vertex, v))
-            to_do.extend((visit_edge, w) for w in self.children(v))
-
-        def visit_edge(v):
-            if v in identified:
-                stack.append(('EDGE', v))
-            elif v in index:
-                while index[v] < boundaries[-1]:
-                    boundaries.pop()
-            else:
-                to_do.append((visit_vertex, v))
-
-        def leave_vertex(v):
-            if boundaries[-1] == index[v]:
-                root = boundaries.pop()
-                scc = stack[root:]
-                del stack[root:]
-                for item_type, w in scc:
-                    if item_type == 'VERTEX':
-                        identified.add(w)
-                        del index[w]
-                sccs.append(scc)
-                stack.append(('EDGE', v))
-
-        # Visit every vertex of the graph.
-        for v in self.vertices:
-            if v not in identified:
-                to_do.append((visit_vertex, v))
-                while to_do:
-                    operation, v = to_do.pop()
-                    operation(v)
-                stack.pop()
-
-        return sccs
+        return self.full_subgraph(condensation.members(component))
 
     def source_components(self):
         """
@@ -363,50 +616,144 @@ class IDirectedGraph(Container, Iterable, Sized):
         component.  Any component in the graph is reachable from one of these.
 
         """
-        raw_sccs = self._component_graph()
-
-        # Construct a dictionary mapping each vertex to the root of its scc.
-        vertex_to_root = self.vertex_dict()
-
-        # And keep track of which SCCs have incoming edges.
-        non_sources = self.vertex_set()
+        condensation = self.condensation()
+        return [
+            self._component_subgraph(condensation, component)
+            for component in condensation.sources()
+        ]
 
-        # Build maps from vertices to roots, and identify the sccs that *are*
-        # reachable from other components.
-        for scc in raw_sccs:
-            root = scc[0][1]
-            for item_type, w in scc:
-                if item_type == 'VERTEX':
-                    vertex_to_root[w] = root
-                elif item_type == 'EDGE':
-                    non_sources.add(vertex_to_root[w])
+    def source_component_records(self):
+        """
+        Return records of the strongly connected components not reachable
+        from any other component.
 
-        sccs = []
-        for raw_scc in raw_sccs:
-            root = raw_scc[0][1]
-            if root not in non_sources:
-                sccs.append([v for vtype, v in raw_scc if vtype == 'VERTEX'])
+        Like :meth:`source_components`, but returns a list of
+        :class:`~refcycle.component_record.ComponentRecord` instances instead
+        of subgraphs.
 
-        return [self.full_subgraph(scc) for scc in sccs]
+        """
+        condensation = self.condensation()
+        return [
+            condensation.record(component)
+            for component in condensation.sources()
+        ]
 
     def strongly_connected_components(self):
         """
         Return list of strongly connected components of this graph.
 
-        Returns a list of subgraphs.
+        Returns a list of subgraphs, in topological order.
 
         Algorithm is based on that described in "Path-based depth-first search
         for strong and biconnected components" by Harold N. Gabow,
         Inf.Process.Lett. 74 (2000) 107--114.
 
         """
-        raw_sccs = self._component_graph()
+        condensation = self.condensation()
+        return [
+            self._component_subgraph(condensation, component)
+            for component in condensation.topological_order
+        ]
+
+    def component_records(self):
+        """
+        Return records of the strongly connected components of this graph.
 
-        sccs = []
-        for raw_scc in raw_sccs:
-            sccs.append([v for vtype, v in raw_scc if vtype == 'VERTEX'])
+        Like :meth:`strongly_connected_components`, but returns a list of
+        :class:`~refcycle.component_record.ComponentRecord` instances, each
+        giving the members of a component together with its numbers of
+        internal and outgoing edges.  No subgraphs are constructed, and each
+        record only computes its member list and outgoing edge count when
+        they're first used, so this is cheap even for graphs with many
+        components.
+
+        """
+        condensation = self.condensation()
+        return [
+            condensation.record(component)
+            for component in condensation.topological_order
+        ]
+
+    def dominator_tree(self, roots=None):
+        """
+        Return the dominator tree of this graph with respect to the given
+        iterable of root vertices.
+
+        If no roots are given, the vertices of the source components of the
+        graph are used; every vertex is reachable from those.
+
+        Returns a :class:`~refcycle.dominator_tree.DominatorTree` instance.
+        The result for the default roots is cached; see
+        :meth:`clear_analysis_cache`.
+
+        """
+        if roots is None:
+            return self._cached_analysis(
+                'dominator_tree', self._source_dominator_tree)
+        vertices, adjacency = self._integer_form()
+        return DominatorTree(
+            vertices,
+            *immediate_dominators(
+                adjacency, [vertices.index(root) for root in roots])
+        )
+
+    def _source_dominator_tree(self):
+        condensation = self.condensation()
+        roots = [
+            vertex
+            for component in condensation.sources()
+            for vertex in condensation.members(component)
+        ]
+        return self.dominator_tree(roots)
+
+    def out_degrees(self):
+        """
+        Return an index array giving the number of edges leaving each vertex,
+        with entries in the order of iteration over :attr:`vertices`.
+
+        The result is cached; see :meth:`clear_analysis_cache`.
+
+        """
+        return self._cached_analysis(
+            'out_degrees', lambda: self._integer_form()[1].out_degrees())
+
+    def in_degrees(self):
+        """
+        Return an index array giving the number of edges entering each
+        vertex, with entries in the order of iteration over :attr:`vertices`.
+
+        The result is cached; see :meth:`clear_analysis_cache`.
+
+        """
+        return self._cached_analysis(
+            'in_degrees', lambda: self._integer_form()[1].in_degrees())
+
+    def top_referrers(self, k):
+        """
+        Return the `k` vertices with the most edges leaving them: for a
+        graph of objects, the objects referring to the most others.
+
+        Returns a list of pairs (vertex, out-degree), largest first.
+
+        """
+        return self._top_by_degree(self.out_degrees(), k)
+
+    def top_referents(self, k):
+        """
+        Return the `k` vertices with the most edges entering them: for a
+        graph of objects, the objects referred to by the most others.
+
+        Returns a list of pairs (vertex, in-degree), largest first.
+
+        """
+        return self._top_by_degree(self.in_degrees(), k)
 
-        return [self.full_subgraph(scc) for scc in sccs]
+    def _top_by_degree(self, degrees, k):
+        vertices = self._integer_form()[0]
+        positions = heapq.nlargest(
+            k, range(len(degrees)), key=degrees.__getitem__)
+        return [(vertices[position], degrees[position])
+                for position in positions]
 
     def count_by(self, classifier):
         """
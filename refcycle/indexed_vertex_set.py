@@ -0,0 +1,87 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A set-like object that numbers its elements 0, 1, 2, ... in order of
+insertion, so that the elements can be referred to by integer index.
+
+"""
+from collections import Set
+
+from six.moves import map
+
+
+class IndexedVertexSet(Set):
+    """
+    A set-like object that numbers its elements 0, 1, 2, ... in order of
+    insertion.
+
+    If *transform* is given, elements are identified by their transformed
+    value (for example, ``transform=id`` identifies elements by identity);
+    otherwise elements must be hashable, and are compared by equality.
+
+    Elements can't be removed, since that would invalidate the numbering.
+
+    """
+    __slots__ = ('_transform', '_indices', '_elements')
+
+    def __init__(self, transform=None):
+        self._transform = transform
+        self._indices = {}
+        self._elements = []
+
+    def _key(self, element):
+        if self._transform is None:
+            return element
+        return self._transform(element)
+
+    def __contains__(self, element):
+        return self._key(element) in self._indices
+
+    def __iter__(self):
+        return iter(self._elements)
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __getitem__(self, index):
+        """Return the element with the given index."""
+        return self._elements[index]
+
+    def iter_elements(self, indices):
+        """Return an iterator over the elements with the given indices."""
+        return map(self._elements.__getitem__, indices)
+
+    def index(self, element):
+        """Return the index of the given element.
+
+        Raises KeyError if the element is not present.
+        """
+        try:
+            return self._indices[self._key(element)]
+        except KeyError:
+            raise KeyError(element)
+
+    def add(self, element):
+        """Add an element to this set, and return its index."""
+        key = self._key(element)
+        try:
+            return self._indices[key]
+        except KeyError:
+            index = self._indices[key] = len(self._elements)
+            self._elements.append(element)
+            return index
+
+    def update(self, iterable):
+        for element in iterable:
+            self.add(element)
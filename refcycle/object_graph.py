@@ -15,10 +15,14 @@
 Tools to analyze the Python object graph and find reference cycles.
 
 """
+from collections import Counter
 import gc
-import itertools
+import math
+import sys
+import weakref
 
 import six
+from six.moves import filter, map, range
 
 from refcycle.annotations import object_annotation, annotated_references
 from refcycle.annotated_graph import (
@@ -26,9 +30,66 @@ from refcycle.annotated_graph import (
     AnnotatedGraph,
     AnnotatedVertex,
 )
+from refcycle.csr_graph import CSRGraph, index_array
 from refcycle.element_transform_set import ElementTransformSet
-from refcycle.key_transform_dict import KeyTransformDict
 from refcycle.i_directed_graph import IDirectedGraph
+from refcycle.indexed_vertex_set import IndexedVertexSet
+from refcycle.key_transform_dict import KeyTransformDict
+from refcycle.subgraph_view import (
+    LabelMask,
+    membership,
+    SubgraphEdges,
+    SubgraphVertices,
+)
+
+
+# Weak references to every live standalone ObjectGraph, keyed by their ids,
+# so that snapshots can leave out the objects that the graphs themselves own.
+# Views aren't registered, since they're created in bulk; snapshots find them
+# among the objects captured.
+_live_graphs = {}
+
+
+def _forget_graph(ref):
+    """
+    Remove a weak reference to a dead graph from the registry.
+
+    """
+    _live_graphs.pop(id(ref), None)
+
+
+def _register_graph(graph):
+    """
+    Add a standalone graph to the registry of live graphs.
+
+    """
+    ref = weakref.ref(graph, _forget_graph)
+    _live_graphs[id(ref)] = ref
+
+
+def _live_graph_objects():
+    """
+    Return a list of the gc-tracked objects owned by live standalone graphs,
+    together with the registry and its weak references to those graphs.
+
+    """
+    objects = [_live_graphs]
+    for ref in list(_live_graphs.values()):
+        graph = ref()
+        if graph is not None:
+            objects.append(ref)
+            objects.extend(graph._own_objects())
+    return objects
+
+
+def _nearest_rank(sorted_values, percentile):
+    """
+    Return the given percentile of a nonempty sorted list of values, using
+    the nearest-rank method.
+
+    """
+    rank = int(math.ceil(percentile * len(sorted_values) / 100.0))
+    return sorted_values[max(rank, 1) - 1]
 
 
 class ObjectGraph(IDirectedGraph):
@@ -80,28 +141,28 @@ class ObjectGraph(IDirectedGraph):
         Return the head (target, destination) of the given edge.
 
         """
-        return self._head[edge]
+        return self._vertices[self._adjacency.head(edge)]
 
     def tail(self, edge):
         """
         Return the tail (source) of the given edge.
 
         """
-        return self._tail[edge]
+        return self._vertices[self._adjacency.tail(edge)]
 
     def out_edges(self, vertex):
         """
-        Return a list of the edges leaving this vertex.
+        Return a range of the edges leaving this vertex.
 
         """
-        return self._out_edges[vertex]
+        return self._adjacency.out_edges(self._vertices.index(vertex))
 
     def in_edges(self, vertex):
         """
-        Return a list of the edges entering this vertex.
+        Return an array of the edges entering this vertex.
 
         """
-        return self._in_edges[vertex]
+        return self._adjacency.in_edges(self._vertices.index(vertex))
 
     @property
     def vertices(self):
@@ -116,8 +177,11 @@ class ObjectGraph(IDirectedGraph):
         """
         Return collection of edges of the graph.
 
+        Edges are identified by consecutive integers, so this is simply a
+        range object.
+
         """
-        return self._edges
+        return range(self._adjacency.edge_count)
 
     def full_subgraph(self, objects):
         """
@@ -125,37 +189,50 @@ class ObjectGraph(IDirectedGraph):
         are the given ones and whose edges are the edges
         of the original graph between those vertices.
 
+        The subgraph is returned as an
+        :class:`~refcycle.object_graph.ObjectGraphView`, which shares the
+        storage of this graph rather than copying it.  Note that the view
+        keeps this graph, and hence all of its objects, alive; use
+        :meth:`~refcycle.object_graph.ObjectGraphView.materialize` to get a
+        standalone copy.
+
         """
-        vertices = ElementTransformSet(transform=id)
-        out_edges = KeyTransformDict(transform=id)
-        in_edges = KeyTransformDict(transform=id)
+        index = self._vertices.index
+        members = IndexedVertexSet()
         for obj in objects:
-            vertices.add(obj)
-            out_edges[obj] = []
-            in_edges[obj] = []
-
-        edges = set()
-        head = {}
-        tail = {}
-
-        for referrer in vertices:
-            for edge in self._out_edges[referrer]:
-                referent = self._head[edge]
-                if referent not in vertices:
-                    continue
-                edges.add(edge)
-                tail[edge] = referrer
-                head[edge] = referent
-                out_edges[referrer].append(edge)
-                in_edges[referent].append(edge)
+            members.add(index(obj))
+        return ObjectGraphView._from_members(self, index_array(members))
 
-        return ObjectGraph._raw(
-            vertices=vertices,
-            edges=edges,
-            out_edges=out_edges,
-            in_edges=in_edges,
-            head=head,
-            tail=tail,
+    def iter_children(self, vertex):
+        """
+        Return an iterator over the immediate children of the given vertex.
+
+        """
+        vertices = self._vertices
+        return vertices.iter_elements(
+            self._adjacency.children(vertices.index(vertex)))
+
+    def iter_parents(self, vertex):
+        """
+        Return an iterator over the immediate parents of the given vertex.
+
+        """
+        vertices = self._vertices
+        return vertices.iter_elements(
+            self._adjacency.iter_parents(vertices.index(vertex)))
+
+    def _integer_graph(self):
+        return self._vertices, self._adjacency
+
+    def _component_subgraph(self, condensation, component):
+        # Views on the components of a condensation of this graph can all
+        # share the condensation's labels array as their membership mask.
+        if condensation.vertices is not self._vertices:
+            return self.full_subgraph(condensation.members(component))
+        return ObjectGraphView._raw(
+            graph=self,
+            members=condensation.member_positions(component),
+            membership=LabelMask(condensation.labels, component),
         )
 
     ###########################################################################
@@ -170,6 +247,10 @@ class ObjectGraph(IDirectedGraph):
     def vertex_dict(cls):
         return KeyTransformDict(transform=id)
 
+    @classmethod
+    def vertex_numbering(cls):
+        return IndexedVertexSet(transform=id)
+
     @classmethod
     def vertex_equal(cls, vertex1, vertex2):
         return vertex1 is vertex2
@@ -179,73 +260,189 @@ class ObjectGraph(IDirectedGraph):
     ###########################################################################
 
     @classmethod
-    def _raw(cls, vertices, edges, out_edges, in_edges, head, tail):
+    def _raw(cls, vertices, adjacency, truncated=None):
         """
         Private constructor for direct construction
         of an ObjectGraph from its attributes.
 
-        vertices is the collection of vertices
-        out_edges and in_edges map vertices to lists of edges
-        head and tail map edges to objects.
+        vertices is an IndexedVertexSet numbering the objects of the graph
+        adjacency is a CSRGraph giving the references between those
+        objects, in terms of their indices
+        truncated is an optional sorted index array of the indices of the
+        objects whose references weren't examined
 
         """
         self = object.__new__(cls)
-        self._out_edges = out_edges
-        self._in_edges = in_edges
-        self._head = head
-        self._tail = tail
         self._vertices = vertices
-        self._edges = edges
+        self._adjacency = adjacency
+        self._truncated = index_array() if truncated is None else truncated
+        _register_graph(self)
         return self
 
     @classmethod
-    def _from_objects(cls, objects):
+    def _from_objects(cls, objects, truncated=(), boundary=None):
         """
         Private constructor: create graph from the given Python objects.
 
         The constructor examines the referents of each given object to build up
         a graph showing the objects and their links.
 
+        Objects in `truncated` that aren't also in `objects` are added as
+        vertices without examining their referents, so they have no outgoing
+        edges; they're reported by :meth:`truncated_vertices`.
+
+        If `boundary` is not None, it's a collection of object ids.
+        Referents of the given objects that aren't otherwise in the graph
+        are then added as truncated vertices as they're found, provided
+        they're tracked by the garbage collector and their ids aren't in
+        `boundary`.
+
         """
-        vertices = ElementTransformSet(transform=id)
-        out_edges = KeyTransformDict(transform=id)
-        in_edges = KeyTransformDict(transform=id)
-        for obj in objects:
-            vertices.add(obj)
-            out_edges[obj] = []
-            in_edges[obj] = []
-
-        # Edges are identified by simple integers, so
-        # we can use plain dictionaries for mapping
-        # edges to their heads and tails.
-        edge_label = itertools.count()
-        edges = set()
-        head = {}
-        tail = {}
-
-        for referrer in vertices:
+        vertices = IndexedVertexSet(transform=id)
+        vertices.update(objects)
+        expanded_count = len(vertices)
+        vertices.update(truncated)
+
+        # Vertices are numbered consecutively, and the edges leaving each
+        # vertex are recorded as the indices of their heads.  Edges are then
+        # identified with their positions in the resulting edge table.
+        # Boundary objects are appended to the vertices during the pass, so
+        # the iteration below reaches them too.
+        indices = vertices._indices
+
+        def referent_indices(referrer):
             for referent in gc.get_referents(referrer):
-                if referent not in vertices:
-                    continue
-                edge = next(edge_label)
-                edges.add(edge)
-                tail[edge] = referrer
-                head[edge] = referent
-                out_edges[referrer].append(edge)
-                in_edges[referent].append(edge)
+                index = indices.get(id(referent))
+                if index is None:
+                    if (boundary is None or id(referent) in boundary or
+                            not gc.is_tracked(referent)):
+                        continue
+                    index = vertices.add(referent)
+                yield index
+
+        adjacency = CSRGraph.from_successors(
+            referent_indices(referrer) if index < expanded_count else ()
+            for index, referrer in enumerate(vertices)
+        )
+        return cls._raw(
+            vertices=vertices,
+            adjacency=adjacency,
+            truncated=index_array(range(expanded_count, len(vertices))),
+        )
+
+    @classmethod
+    def _from_roots(cls, roots, excluded_ids, max_depth=None,
+                    max_objects=None, follow=None, include_untracked=True):
+        """
+        Private constructor: create graph of the objects reachable from the
+        given roots, as described in
+        :func:`~refcycle.creators.objects_reachable_from`.
+
+        The walk is breadth-first, so objects are expanded in the order in
+        which they're numbered, and the edges are recorded as each object is
+        expanded: the referents of each object are examined only once.
+
+        """
+        vertices = IndexedVertexSet(transform=id)
+        for root in roots:
+            if id(root) not in excluded_ids:
+                vertices.add(root)
+        if max_objects is not None and len(vertices) > max_objects:
+            # Not even the roots fit: keep the first of them, unexpanded.
+            kept = IndexedVertexSet(transform=id)
+            kept.update(vertices[index] for index in range(max_objects))
+            return cls._raw(
+                vertices=kept,
+                adjacency=CSRGraph.from_successors(
+                    () for _ in range(max_objects)),
+                truncated=index_array(range(max_objects)),
+            )
+        indices = vertices._indices
+        is_tracked = gc.is_tracked
+
+        out_offsets = index_array([0])
+        heads = index_array()
+        truncated = index_array()
+        depth, level_end = 0, len(vertices)
+        position = 0
+        while position < len(vertices):
+            if position == level_end:
+                depth, level_end = depth + 1, len(vertices)
+            obj = vertices[position]
+            if (max_depth is not None and depth >= max_depth or
+                    depth and follow is not None and not follow(obj)):
+                truncated.append(position)
+                out_offsets.append(len(heads))
+                position += 1
+                continue
+
+            # New referents are numbered provisionally, and only added to
+            # the graph if they fit within the budget.
+            new_referents = []
+            new_indices = {}
+            successors = []
+            for referent in gc.get_referents(obj):
+                key = id(referent)
+                index = indices.get(key)
+                if index is None:
+                    index = new_indices.get(key)
+                if index is None:
+                    if key in excluded_ids or not (
+                            include_untracked or is_tracked(referent)):
+                        continue
+                    index = new_indices[key] = (
+                        len(vertices) + len(new_referents))
+                    new_referents.append(referent)
+                successors.append(index)
+
+            if (max_objects is not None and
+                    len(vertices) + len(new_referents) > max_objects):
+                # Out of budget: everything not yet expanded is frontier.
+                unexpanded = range(position, len(vertices))
+                truncated.extend(unexpanded)
+                out_offsets.extend(len(heads) for _ in unexpanded)
+                break
+
+            vertices.update(new_referents)
+            heads.extend(successors)
+            out_offsets.append(len(heads))
+            position += 1
 
         return cls._raw(
             vertices=vertices,
-            edges=edges,
-            out_edges=out_edges,
-            in_edges=in_edges,
-            head=head,
-            tail=tail,
+            adjacency=CSRGraph(out_offsets, heads),
+            truncated=truncated,
         )
 
     def __new__(cls, objects=()):
         return cls._from_objects(objects)
 
+    def materialize(self):
+        """
+        Return a standalone ObjectGraph with the same vertices and edges as
+        this one.
+
+        An ObjectGraph is already standalone, so this returns the graph
+        itself; for a subgraph view, it returns a copy that no longer depends
+        on the underlying graph.
+
+        """
+        return self
+
+    def truncated_vertices(self):
+        """
+        Return the list of objects of the graph whose references weren't
+        examined when the graph was built.
+
+        These lie on the boundary of a partial graph: for example, the stubs
+        for older objects in a generation-scoped
+        :func:`~refcycle.creators.snapshot`.  A truncated object has no
+        outgoing edges in the graph, whatever it actually refers to.
+
+        """
+        vertices = self._vertices
+        return [vertices[index] for index in self._truncated]
+
     ###########################################################################
     ### Annotations.
     ###########################################################################
@@ -256,20 +453,21 @@ class ObjectGraph(IDirectedGraph):
         with the same structure.
 
         """
-        # Build up dictionary of edge annotations.
+        # Build up dictionary of edge annotations.  We annotate all edges
+        # from a given object at once.
         edge_annotations = {}
-        for edge in self.edges:
-            if edge not in edge_annotations:
-                # We annotate all edges from a given object at once.
-                referrer = self._tail[edge]
-                known_refs = annotated_references(referrer)
-                for out_edge in self._out_edges[referrer]:
-                    referent = self._head[out_edge]
-                    if known_refs[referent]:
-                        annotation = known_refs[referent].pop()
-                    else:
-                        annotation = None
-                    edge_annotations[out_edge] = annotation
+        for referrer in self.vertices:
+            out_edges = self.out_edges(referrer)
+            if not out_edges:
+                continue
+            known_refs = annotated_references(referrer)
+            for out_edge in out_edges:
+                referent = self.head(out_edge)
+                if known_refs[referent]:
+                    annotation = known_refs[referent].pop()
+                else:
+                    annotation = None
+                edge_annotations[out_edge] = annotation
 
         annotated_vertices = [
             AnnotatedVertex(
@@ -283,8 +481,8 @@ class ObjectGraph(IDirectedGraph):
             AnnotatedEdge(
                 id=edge,
                 annotation=edge_annotations[edge],
-                head=id(self._head[edge]),
-                tail=id(self._tail[edge]),
+                head=id(self.head(edge)),
+                tail=id(self.tail(edge)),
             )
             for edge in self.edges
         ]
@@ -354,31 +552,138 @@ class ObjectGraph(IDirectedGraph):
         List of gc-tracked objects owned by this ObjectGraph instance.
 
         """
-        return (
-            [
-                self,
-                self.__dict__,
-                self._head,
-                self._tail,
-                self._out_edges,
-                self._out_edges._keys,
-                self._out_edges._values,
-                self._in_edges,
-                self._in_edges._keys,
-                self._in_edges._values,
-                self._vertices,
-                self._vertices._elements,
-                self._edges,
-            ] +
-            list(six.itervalues(self._out_edges)) +
-            list(six.itervalues(self._in_edges))
-        )
+        return [
+            self,
+            self.__dict__,
+            self._vertices,
+            self._vertices._indices,
+            self._vertices._elements,
+            self._truncated,
+        ] + self._adjacency.owned_objects() + self._analysis_cache_objects()
+
+    def _own_objects(self):
+        """
+        List of gc-tracked objects owned by this graph and not shared with
+        any other graph.
+
+        """
+        return self.owned_objects()
+
+    def _analysis_cache_objects(self):
+        """
+        List of gc-tracked objects making up this graph's analysis cache.
+
+        """
+        cache = self.__dict__.get('_analysis_cache')
+        if cache is None:
+            return []
+
+        objects = [cache]
+        for result in cache.values():
+            if isinstance(result, tuple):
+                # An integer graph: a pair (vertices, adjacency).
+                vertices, adjacency = result
+                objects.extend([
+                    result,
+                    vertices,
+                    vertices._indices,
+                    vertices._elements,
+                ])
+                objects.extend(adjacency.owned_objects())
+            elif isinstance(result, dict):
+                # A typename index: a dict of index arrays.
+                objects.append(result)
+                objects.extend(result.values())
+            elif hasattr(result, 'owned_objects'):
+                objects.extend(result.owned_objects())
+            else:
+                objects.append(result)
+        return objects
+
+    def _typename_index(self):
+        """
+        Return a dict mapping each type name to an index array of the
+        positions, in iteration order, of the objects whose type has that
+        name.
+
+        The result is cached under the name ``'typename_index'``.
+
+        """
+        return self._cached_analysis(
+            'typename_index', self._build_typename_index)
+
+    def _build_typename_index(self):
+        index = {}
+        for position, obj in enumerate(self._integer_graph()[0]):
+            typename = type(obj).__name__
+            try:
+                positions = index[typename]
+            except KeyError:
+                positions = index[typename] = index_array()
+            positions.append(position)
+        return index
+
+    def shallow_sizes(self):
+        """
+        Return the size of each object in the graph, as reported by
+        ``sys.getsizeof``.
+
+        Returns an index array whose entries correspond to the objects of the
+        graph in iteration order.  The result is cached; see
+        :meth:`~refcycle.i_directed_graph.IDirectedGraph.clear_analysis_cache`.
+
+        """
+        return self._cached_analysis('shallow_sizes', self._shallow_sizes)
+
+    def _shallow_sizes(self):
+        getsizeof = sys.getsizeof
+        return index_array(
+            getsizeof(obj) for obj in self._integer_graph()[0])
+
+    def retained_sizes(self, roots=None):
+        """
+        Return the retained size of each object in the graph.
+
+        The retained size of an object is the total size, as reported by
+        ``sys.getsizeof``, of the objects that would become unreachable from
+        the given roots if that object went away: that is, of the objects it
+        dominates, itself included.  If no roots are given, the objects of
+        the source components of the graph are used.
+
+        Returns an index array whose entries correspond to the objects of the
+        graph in iteration order.  Objects not reachable from the roots have
+        retained size 0.  The result for the default roots is cached; see
+        :meth:`~refcycle.i_directed_graph.IDirectedGraph.clear_analysis_cache`.
+
+        """
+        if roots is None:
+            return self._cached_analysis(
+                'retained_sizes', self._source_retained_sizes)
+        return self._retained_sizes(self.dominator_tree(roots))
+
+    def _source_retained_sizes(self):
+        return self._retained_sizes(self.dominator_tree())
+
+    def _retained_sizes(self, dominator_tree):
+        return dominator_tree.retained_sizes(self.shallow_sizes())
+
+    def retained_size(self, obj, roots=None):
+        """
+        Return the retained size of the given object.
+
+        See :meth:`retained_sizes`.
+
+        """
+        position = self._integer_graph()[0].index(obj)
+        return self.retained_sizes(roots)[position]
 
     def find_by_typename(self, typename):
         """
         List of all objects whose type has the given name.
         """
-        return self.find_by(lambda obj: type(obj).__name__ == typename)
+        vertices = self._integer_graph()[0]
+        positions = self._typename_index().get(typename, ())
+        return [vertices[position] for position in positions]
 
     def count_by_typename(self):
         """Classify objects by type name.
@@ -387,4 +692,268 @@ class ObjectGraph(IDirectedGraph):
         of objects `obj` in this graph for which `type(obj).__name__` matches
         that type name.
         """
-        return self.count_by(lambda obj: type(obj).__name__)
+        return Counter({
+            typename: len(positions)
+            for typename, positions in six.iteritems(self._typename_index())
+        })
+
+    def size_by_typename(self, percentiles=(50, 90, 99)):
+        """Summarize object sizes by type name.
+
+        Returns a dict mapping each type name to a dict with keys
+        ``'count'``, ``'total'``, ``'max'`` and ``'percentiles'``, giving the
+        number of objects with that type name, their total and largest sizes
+        as reported by ``sys.getsizeof``, and a dict mapping each of the
+        given percentiles to the corresponding (nearest-rank) size.
+        """
+        sizes = self.shallow_sizes()
+        summary = {}
+        for typename, positions in six.iteritems(self._typename_index()):
+            type_sizes = sorted(sizes[position] for position in positions)
+            count = len(type_sizes)
+            summary[typename] = {
+                'count': count,
+                'total': sum(type_sizes),
+                'max': type_sizes[-1],
+                'percentiles': {
+                    percentile: _nearest_rank(type_sizes, percentile)
+                    for percentile in percentiles
+                },
+            }
+        return summary
+
+
+class ObjectGraphView(ObjectGraph):
+    """Full subgraph of an ObjectGraph that shares that graph's storage.
+
+    The view records only which vertices of the underlying graph it
+    contains; its edges are those edges of the underlying graph between its
+    vertices, and are filtered on demand.  That makes views cheap to create,
+    which matters for algorithms like
+    :meth:`~refcycle.object_graph.ObjectGraph.strongly_connected_components`
+    that produce many subgraphs, most of which are never examined in detail.
+
+    A view keeps the underlying graph alive.  Use :meth:`materialize` to
+    obtain a standalone ObjectGraph.
+
+    """
+    ###########################################################################
+    ### IDirectedGraph interface.
+    ###########################################################################
+
+    def head(self, edge):
+        """
+        Return the head (target, destination) of the given edge.
+
+        """
+        return self._graph.head(edge)
+
+    def tail(self, edge):
+        """
+        Return the tail (source) of the given edge.
+
+        """
+        return self._graph.tail(edge)
+
+    def out_edges(self, vertex):
+        """
+        Return a list of the edges leaving this vertex.
+
+        """
+        adjacency, membership = self._graph._adjacency, self._membership
+        heads = adjacency.heads
+        return [
+            edge for edge in adjacency.out_edges(self._index(vertex))
+            if heads[edge] in membership
+        ]
+
+    def in_edges(self, vertex):
+        """
+        Return a list of the edges entering this vertex.
+
+        """
+        adjacency, membership = self._graph._adjacency, self._membership
+        tails = adjacency.tails
+        return [
+            edge for edge in adjacency.in_edges(self._index(vertex))
+            if tails[edge] in membership
+        ]
+
+    @property
+    def vertices(self):
+        """
+        Return collection of vertices of the graph.
+
+        """
+        return SubgraphVertices(
+            self._graph._vertices, self._members, self._membership)
+
+    @property
+    def edges(self):
+        """
+        Return collection of edges of the graph.
+
+        The edges are those of the underlying graph, and keep their
+        identifiers.
+
+        """
+        return SubgraphEdges(
+            self._graph._adjacency, self._members, self._membership)
+
+    def full_subgraph(self, objects):
+        """
+        Return the subgraph of this graph whose vertices
+        are the given ones and whose edges are the edges
+        of the original graph between those vertices.
+
+        The result is a view on the same underlying graph as this view.
+
+        """
+        members = IndexedVertexSet()
+        for obj in objects:
+            members.add(self._index(obj))
+        return ObjectGraphView._from_members(self._graph, index_array(members))
+
+    def iter_children(self, vertex):
+        """
+        Return an iterator over the immediate children of the given vertex.
+
+        """
+        children = self._graph._adjacency.children(self._index(vertex))
+        return self._graph._vertices.iter_elements(
+            filter(self._membership.__contains__, children))
+
+    def iter_parents(self, vertex):
+        """
+        Return an iterator over the immediate parents of the given vertex.
+
+        """
+        parents = self._graph._adjacency.iter_parents(self._index(vertex))
+        return self._graph._vertices.iter_elements(
+            filter(self._membership.__contains__, parents))
+
+    def _integer_graph(self):
+        # Cached under the name 'integer_graph'.
+        return self._cached_analysis('integer_graph', self._local_numbering)
+
+    def _local_numbering(self):
+        """
+        Renumber the vertices and edges of this view consecutively.
+
+        """
+        vertices = IndexedVertexSet(transform=id)
+        vertices.update(self.vertices)
+        return vertices, self._graph._adjacency.subgraph(self._members)
+
+    def _component_subgraph(self, condensation, component):
+        return self.full_subgraph(condensation.members(component))
+
+    def __len__(self):
+        return len(self._members)
+
+    def __contains__(self, vertex):
+        return vertex in self.vertices
+
+    ###########################################################################
+    ### ObjectGraphView constructors.
+    ###########################################################################
+
+    @classmethod
+    def _raw(cls, graph, members, membership):
+        """
+        Private constructor for direct construction of a view from its
+        attributes.
+
+        graph is the underlying standalone ObjectGraph
+        members is an index array of the indices of the vertices of the view
+        membership supports fast membership testing for those indices
+
+        """
+        self = object.__new__(cls)
+        self._graph = graph
+        self._members = members
+        self._membership = membership
+        return self
+
+    @classmethod
+    def _from_members(cls, graph, members):
+        """
+        Private constructor: create a view of the given ObjectGraph from the
+        indices of its vertices.
+
+        """
+        return cls._raw(
+            graph=graph,
+            members=members,
+            membership=membership(members, len(graph)),
+        )
+
+    def __new__(cls, *args, **kwargs):
+        raise TypeError(
+            "ObjectGraphView instances can't be created directly; "
+            "use ObjectGraph.full_subgraph instead."
+        )
+
+    def materialize(self):
+        """
+        Return a standalone ObjectGraph with the same vertices and edges as
+        this view.
+
+        The returned graph doesn't refer to the underlying graph, so it
+        doesn't keep that graph's other objects alive.  Its edges are
+        renumbered consecutively.
+
+        """
+        vertices, adjacency = self._integer_graph()
+        truncated = index_array(
+            sorted(map(vertices.index, self.truncated_vertices())))
+        return ObjectGraph._raw(
+            vertices=vertices, adjacency=adjacency, truncated=truncated)
+
+    def truncated_vertices(self):
+        """
+        Return the list of objects of the view whose references weren't
+        examined when the underlying graph was built.
+
+        """
+        vertices, membership = self._graph._vertices, self._membership
+        return [
+            vertices[index] for index in self._graph._truncated
+            if index in membership
+        ]
+
+    def _index(self, vertex):
+        """
+        Return the index of the given vertex in the underlying graph.
+
+        Raises KeyError if the vertex doesn't belong to this view.
+
+        """
+        index = self._graph._vertices.index(vertex)
+        if index not in self._membership:
+            raise KeyError(vertex)
+        return index
+
+    ###########################################################################
+    ### Other utility methods.
+    ###########################################################################
+
+    def owned_objects(self):
+        """
+        List of gc-tracked objects owned by this ObjectGraphView instance.
+
+        This includes the objects owned by the underlying graph.
+
+        """
+        return self._own_objects() + self._graph.owned_objects()
+
+    def _own_objects(self):
+        """
+        List of gc-tracked objects owned by this view, leaving out those
+        owned by the underlying graph.
+
+        """
+        objects = [self, self.__dict__, self._members, self._membership]
+        if isinstance(self._membership, LabelMask):
+            objects.append(self._membership.labels)
+        return objects + self._analysis_cache_objects()
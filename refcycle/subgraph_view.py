@@ -0,0 +1,129 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Support for subgraph views: subgraphs that share the storage of the graph
+they come from, and record only which of its vertices they contain.
+
+Vertices here are the integer indices used by a CSRGraph.
+
+"""
+from collections import Set
+import numbers
+
+# A dense membership mask costs one byte per vertex of the underlying graph,
+# while a set of indices costs several tens of bytes per member.  Use the set
+# for subgraphs smaller than this fraction of the underlying graph.
+SPARSE_MEMBERSHIP_RATIO = 64
+
+
+class LabelMask(object):
+    """
+    Membership test for the vertices v with ``labels[v] == label``.
+
+    Several subgraphs can share a single labels array; for example, the
+    strongly connected components of a graph can all share one array mapping
+    each vertex to the number of its component.
+
+    """
+    __slots__ = ('labels', 'label')
+
+    def __init__(self, labels, label):
+        self.labels = labels
+        self.label = label
+
+    def __contains__(self, vertex):
+        return self.labels[vertex] == self.label
+
+
+def membership(members, vertex_count):
+    """
+    Return an object supporting fast membership tests for the given
+    collection of vertices of a graph with the given number of vertices.
+
+    """
+    if len(members) * SPARSE_MEMBERSHIP_RATIO < vertex_count:
+        return frozenset(members)
+    mask = bytearray(vertex_count)
+    for vertex in members:
+        mask[vertex] = 1
+    return LabelMask(mask, 1)
+
+
+class SubgraphVertices(Set):
+    """
+    Collection of the vertices of a subgraph view.
+
+    `vertices` is the IndexedVertexSet of the underlying graph
+    `members` is a sequence of the indices of the vertices of the subgraph
+    `membership` supports fast membership testing for those indices
+
+    """
+    __slots__ = ('_vertices', '_members', '_membership')
+
+    def __init__(self, vertices, members, membership):
+        self._vertices = vertices
+        self._members = members
+        self._membership = membership
+
+    def __contains__(self, vertex):
+        try:
+            index = self._vertices.index(vertex)
+        except KeyError:
+            return False
+        return index in self._membership
+
+    def __iter__(self):
+        vertices = self._vertices
+        for index in self._members:
+            yield vertices[index]
+
+    def __len__(self):
+        return len(self._members)
+
+
+class SubgraphEdges(Set):
+    """
+    Collection of the edges of a subgraph view: the edges of the underlying
+    CSRGraph whose head and tail both belong to the subgraph.
+
+    """
+    __slots__ = ('_adjacency', '_members', '_membership')
+
+    def __init__(self, adjacency, members, membership):
+        self._adjacency = adjacency
+        self._members = members
+        self._membership = membership
+
+    def __contains__(self, edge):
+        # Like a range, report anything that isn't an edge index as absent.
+        if not isinstance(edge, numbers.Integral):
+            return False
+        adjacency = self._adjacency
+        if not 0 <= edge < adjacency.edge_count:
+            return False
+        return (
+            adjacency.tail(edge) in self._membership and
+            adjacency.head(edge) in self._membership
+        )
+
+    def __iter__(self):
+        adjacency, membership = self._adjacency, self._membership
+        heads = adjacency.heads
+        for vertex in self._members:
+            for edge in adjacency.out_edges(vertex):
+                if heads[edge] in membership:
+                    yield edge
+
+    def __len__(self):
+        return sum(1 for _ in self)
@@ -69,6 +69,36 @@ class TestAnnotatedGraph(unittest.TestCase):
         self.assertIsInstance(sccs[0], AnnotatedGraph)
         self.assertIsInstance(sccs[1], AnnotatedGraph)
 
+    def test_shortest_path_vertices(self):
+        vertices = [
+            AnnotatedVertex(id=i, annotation="vertex {}".format(i))
+            for i in range(4)
+        ]
+        edges = [
+            AnnotatedEdge(id=10 + i, annotation="", tail=tail, head=head)
+            for i, (tail, head) in enumerate([(0, 1), (1, 2), (2, 3), (0, 2)])
+        ]
+        graph = AnnotatedGraph(vertices=vertices, edges=edges)
+        self.assertEqual(
+            graph.shortest_path_vertices(vertices[0], vertices[3]),
+            [vertices[0], vertices[2], vertices[3]],
+        )
+        with self.assertRaises(ValueError):
+            graph.shortest_path_vertices(vertices[3], vertices[0])
+
+    def test_top_referrers_and_referents(self):
+        vertices = [
+            AnnotatedVertex(id=i, annotation="vertex {}".format(i))
+            for i in range(3)
+        ]
+        edges = [
+            AnnotatedEdge(id=10 + i, annotation="", tail=tail, head=head)
+            for i, (tail, head) in enumerate([(0, 1), (0, 2), (1, 2)])
+        ]
+        graph = AnnotatedGraph(vertices=vertices, edges=edges)
+        self.assertEqual(graph.top_referrers(1), [(vertices[0], 2)])
+        self.assertEqual(graph.top_referents(1), [(vertices[2], 2)])
+
     def test_to_json(self):
         graph = AnnotatedGraph(
             vertices=[
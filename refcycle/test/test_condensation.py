@@ -0,0 +1,158 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the Condensation class.
+
+"""
+import unittest
+
+from refcycle.annotated_graph import (
+    AnnotatedEdge,
+    AnnotatedGraph,
+    AnnotatedVertex,
+)
+from refcycle.condensation import Condensation
+from refcycle.object_graph import ObjectGraph
+from refcycle.test.test_directed_graph import graph_from_string, test_pairs
+
+
+class TestCondensation(unittest.TestCase):
+    def check_condensation(self, graph, condensation):
+        """
+        Check the internal consistency of a condensation.
+
+        """
+        self.assertIsInstance(condensation, Condensation)
+        self.assertIs(condensation.graph, graph)
+        self.assertEqual(
+            sum(condensation.size(c) for c in condensation.topological_order),
+            len(graph),
+        )
+        for vertex in graph.vertices:
+            component = condensation.component_of(vertex)
+            self.assertTrue(
+                any(
+                    graph.vertex_equal(vertex, member)
+                    for member in condensation.members(component)
+                )
+            )
+            for child in graph.children(vertex):
+                # Edges never go backwards in the topological order.
+                self.assertLessEqual(
+                    component, condensation.component_of(child))
+
+        edge_count = 0
+        for component in condensation.topological_order:
+            edge_count += condensation.internal_edge_count(component)
+            edge_count += condensation.outgoing_edge_count(component)
+            for target, multiplicity in condensation.successors(component):
+                self.assertGreater(target, component)
+                self.assertGreater(multiplicity, 0)
+                self.assertIn(
+                    (component, multiplicity),
+                    condensation.predecessors(target),
+                )
+        self.assertEqual(edge_count, len(graph.edges))
+
+    def test_components_match_sccs(self):
+        for graph, expected_sccs in test_pairs:
+            condensation = graph.condensation()
+            self.check_condensation(graph, condensation)
+            self.assertEqual(len(condensation), len(expected_sccs))
+            self.assertCountEqual(
+                [
+                    set(condensation.members(component))
+                    for component in condensation.topological_order
+                ],
+                expected_sccs,
+            )
+
+    def test_multiplicities(self):
+        graph = graph_from_string("1 2 3 4; 1->2->1 2->3 2->3 1->3 3->4 3->3")
+        condensation = graph.condensation()
+        self.check_condensation(graph, condensation)
+        self.assertEqual(len(condensation), 3)
+        c12, c3, c4 = [
+            condensation.component_of(vertex) for vertex in '134'
+        ]
+        self.assertEqual(c12, 0)
+        self.assertEqual(c3, 1)
+        self.assertEqual(c4, 2)
+        self.assertEqual(condensation.successors(c12), [(c3, 3)])
+        self.assertEqual(condensation.successors(c3), [(c4, 1)])
+        self.assertEqual(condensation.internal_edge_count(c12), 2)
+        self.assertEqual(condensation.internal_edge_count(c3), 1)
+        self.assertEqual(condensation.outgoing_edge_count(c12), 3)
+        self.assertEqual(condensation.sources(), [c12])
+        self.assertEqual(condensation.sinks(), [c4])
+
+    def test_labels(self):
+        graph = graph_from_string("1 2 3; 1->2->1 3->1")
+        condensation = graph.condensation()
+        self.assertEqual(list(condensation.labels), [1, 1, 0])
+
+    def test_record(self):
+        graph = graph_from_string("1 2 3; 1->2->1 2->3")
+        condensation = graph.condensation()
+        record = condensation.record(condensation.component_of('1'))
+        self.assertEqual(record.component, condensation.component_of('1'))
+        self.assertIs(record.graph, graph)
+        self.assertEqual(len(record), 2)
+        self.assertCountEqual(record.members, ['1', '2'])
+        self.assertEqual(record.internal_edge_count, 2)
+        self.assertEqual(record.outgoing_edge_count, 1)
+
+    def test_owned_objects(self):
+        graph = graph_from_string("1 2 3; 1->2->1 2->3")
+        condensation = graph.condensation()
+        owned = set(map(id, condensation.owned_objects()))
+        for obj in (condensation, condensation.labels,
+                    condensation.multiplicities, condensation.dag,
+                    condensation.dag.out_offsets, condensation.dag.heads):
+            self.assertIn(id(obj), owned)
+
+    def test_object_graph(self):
+        a, b, c, d = [], [], [], []
+        a.append(b)
+        b.append(a)
+        b.append(c)
+        c.append(d)
+        d.append(c)
+        graph = ObjectGraph([a, b, c, d])
+        condensation = graph.condensation()
+        self.check_condensation(graph, condensation)
+        self.assertEqual(len(condensation), 2)
+        self.assertEqual(condensation.component_of(a), 0)
+        self.assertEqual(condensation.component_of(d), 1)
+
+        # Condensation of a subgraph view.
+        view = graph.full_subgraph([b, c, d])
+        condensation = view.condensation()
+        self.check_condensation(view, condensation)
+        self.assertEqual(len(condensation), 2)
+        self.assertEqual(len(condensation.members(0)), 1)
+        self.assertIs(condensation.members(0)[0], b)
+
+    def test_graph_without_integer_structure(self):
+        vertices = [AnnotatedVertex(id=n, annotation=str(n)) for n in range(3)]
+        edges = [
+            AnnotatedEdge(id=0, annotation="", tail=0, head=1),
+            AnnotatedEdge(id=1, annotation="", tail=1, head=0),
+            AnnotatedEdge(id=2, annotation="", tail=1, head=2),
+        ]
+        graph = AnnotatedGraph(vertices=vertices, edges=edges)
+        condensation = graph.condensation()
+        self.check_condensation(graph, condensation)
+        self.assertEqual(len(condensation), 2)
+        self.assertEqual(condensation.sources(), [0])
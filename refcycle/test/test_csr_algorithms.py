@@ -0,0 +1,442 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the integer graph algorithms in refcycle.csr_algorithms.
+
+"""
+import itertools
+import random
+import time
+import unittest
+
+from refcycle.csr_algorithms import (
+    breadth_first_order,
+    breadth_first_tree,
+    elementary_cycles,
+    immediate_dominators,
+    shortest_cycles,
+    shortest_path,
+    strongly_connected_components,
+)
+from refcycle.csr_graph import CSRGraph
+from refcycle.test.test_directed_graph import test_pairs
+
+
+def reachable_avoiding(graph, roots, avoid):
+    """
+    Return the set of vertices reachable from the roots without passing
+    through the vertex `avoid`.
+
+    """
+    reachable = set()
+    to_do = [root for root in roots if root != avoid]
+    while to_do:
+        vertex = to_do.pop()
+        if vertex in reachable:
+            continue
+        reachable.add(vertex)
+        to_do.extend(
+            child for child in graph.children(vertex) if child != avoid)
+    return reachable
+
+
+def distances_from(graph, start):
+    """
+    Return a dict mapping each vertex reachable from start to its distance.
+
+    """
+    distances = {start: 0}
+    frontier = [start]
+    while frontier:
+        next_frontier = []
+        for vertex in frontier:
+            for child in graph.children(vertex):
+                if child not in distances:
+                    distances[child] = distances[vertex] + 1
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return distances
+
+
+def random_graph(vertex_count, edge_count):
+    successors = [[] for _ in range(vertex_count)]
+    for _ in range(edge_count):
+        tail = random.randrange(vertex_count)
+        successors[tail].append(random.randrange(vertex_count))
+    return CSRGraph.from_successors(successors)
+
+
+class TestStronglyConnectedComponents(unittest.TestCase):
+    def check_labels(self, graph, component_count, labels):
+        """
+        Check that labels give a valid topologically ordered labelling.
+
+        """
+        self.assertEqual(len(labels), graph.vertex_count)
+        self.assertEqual(set(labels), set(range(component_count)))
+        for edge in range(graph.edge_count):
+            self.assertLessEqual(
+                labels[graph.tail(edge)], labels[graph.head(edge)])
+
+    def test_matches_generic_algorithm(self):
+        for test_graph, expected_sccs in test_pairs:
+            vertices, adjacency = test_graph._integer_graph()
+            component_count, labels = strongly_connected_components(
+                adjacency)
+            self.check_labels(adjacency, component_count, labels)
+            sccs = {}
+            for position, label in enumerate(labels):
+                sccs.setdefault(label, set()).add(vertices[position])
+            self.assertEqual(
+                sorted(sorted(scc) for scc in sccs.values()),
+                sorted(sorted(scc) for scc in expected_sccs),
+            )
+
+    def test_empty_graph(self):
+        graph = CSRGraph.from_successors([])
+        component_count, labels = strongly_connected_components(graph)
+        self.assertEqual(component_count, 0)
+        self.assertEqual(len(labels), 0)
+
+    def test_random_graphs(self):
+        random.seed(2718)
+        for _ in range(20):
+            graph = random_graph(50, random.randrange(100))
+            component_count, labels = strongly_connected_components(graph)
+            self.check_labels(graph, component_count, labels)
+            # Every vertex must reach every other member of its component.
+            for vertex in range(graph.vertex_count):
+                reachable = {vertex}
+                to_do = [vertex]
+                while to_do:
+                    for child in graph.children(to_do.pop()):
+                        if child not in reachable:
+                            reachable.add(child)
+                            to_do.append(child)
+                self.assertEqual(
+                    {w for w in reachable if labels[w] == labels[vertex]},
+                    {w for w in range(graph.vertex_count)
+                     if labels[w] == labels[vertex]},
+                )
+
+    def test_long_cycle(self):
+        # Deep enough that a recursive implementation would fail.
+        vertex_count = 100000
+        graph = CSRGraph.from_successors(
+            [[(v + 1) % vertex_count] for v in range(vertex_count)])
+        component_count, labels = strongly_connected_components(graph)
+        self.assertEqual(component_count, 1)
+        self.assertEqual(set(labels), {0})
+
+    def test_long_chain(self):
+        vertex_count = 100000
+        graph = CSRGraph.from_successors(
+            [[v + 1] for v in range(vertex_count - 1)] + [[]])
+        component_count, labels = strongly_connected_components(graph)
+        self.assertEqual(component_count, vertex_count)
+        self.assertEqual(list(labels), list(range(vertex_count)))
+
+
+class TestImmediateDominators(unittest.TestCase):
+    def test_diamond(self):
+        # 0 -> 1 -> 3, 0 -> 2 -> 3, 3 -> 4; vertex 5 -> 3 is unreachable.
+        graph = CSRGraph.from_successors([[1, 2], [3], [3], [4], [], [3]])
+        dominators, order = immediate_dominators(graph, [0])
+        self.assertEqual(list(dominators), [0, 0, 0, 0, 3, -1])
+        self.assertEqual(sorted(order), [0, 1, 2, 3, 4])
+
+    def test_multiple_roots(self):
+        graph = CSRGraph.from_successors([[1, 2], [3], [3], [4], [], [3]])
+        dominators, order = immediate_dominators(graph, [0, 5])
+        # Vertex 3 is reachable from both roots, so has no dominator.
+        self.assertEqual(list(dominators), [0, 0, 0, 3, 3, 5])
+
+    def test_no_roots(self):
+        graph = CSRGraph.from_successors([[1], [0]])
+        dominators, order = immediate_dominators(graph, [])
+        self.assertEqual(list(dominators), [-1, -1])
+        self.assertEqual(len(order), 0)
+
+    def test_random_graphs(self):
+        random.seed(3141)
+        for _ in range(20):
+            graph = random_graph(30, random.randrange(60))
+            roots = random.sample(range(30), random.randrange(1, 4))
+            dominators, order = immediate_dominators(graph, roots)
+            reachable = reachable_avoiding(graph, roots, None)
+            self.assertEqual(set(order), reachable)
+
+            # Strict dominators of each reachable vertex, by brute force.
+            strict_dominators = {vertex: set() for vertex in reachable}
+            for avoid in reachable:
+                lost = reachable - reachable_avoiding(graph, roots, avoid)
+                for vertex in lost - {avoid}:
+                    strict_dominators[vertex].add(avoid)
+
+            for vertex in range(30):
+                dominator = dominators[vertex]
+                if vertex not in reachable:
+                    self.assertEqual(dominator, -1)
+                elif not strict_dominators[vertex]:
+                    self.assertEqual(dominator, vertex)
+                else:
+                    # The immediate dominator is the strict dominator that
+                    # is dominated by all the others.
+                    self.assertIn(dominator, strict_dominators[vertex])
+                    self.assertEqual(
+                        strict_dominators[dominator] | {dominator},
+                        strict_dominators[vertex],
+                    )
+
+            # Each vertex comes after its immediate dominator.
+            seen = set()
+            for vertex in order:
+                dominator = dominators[vertex]
+                if dominator != vertex:
+                    self.assertIn(dominator, seen)
+                seen.add(vertex)
+
+
+class TestShortestPath(unittest.TestCase):
+    def check_path(self, graph, path, start, end):
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], end)
+        for tail, head in zip(path, path[1:]):
+            self.assertIn(head, list(graph.children(tail)))
+
+    def test_simple(self):
+        # 0 -> 1 -> 2 -> 3 and 0 -> 4 -> 3.
+        graph = CSRGraph.from_successors([[1, 4], [2], [3], [], [3]])
+        self.assertEqual(shortest_path(graph, 0, 3), [0, 4, 3])
+        self.assertEqual(shortest_path(graph, 1, 3), [1, 2, 3])
+        self.assertEqual(shortest_path(graph, 2, 2), [2])
+        self.assertIsNone(shortest_path(graph, 3, 0))
+
+    def test_max_length(self):
+        graph = CSRGraph.from_successors([[1, 4], [2], [3], [], [3]])
+        self.assertEqual(shortest_path(graph, 0, 3, max_length=2), [0, 4, 3])
+        self.assertIsNone(shortest_path(graph, 0, 3, max_length=1))
+        self.assertEqual(shortest_path(graph, 0, 0, max_length=0), [0])
+        self.assertIsNone(shortest_path(graph, 0, 1, max_length=0))
+
+    def test_random_graphs(self):
+        random.seed(1618)
+        for _ in range(20):
+            graph = random_graph(40, random.randrange(80))
+            for _ in range(10):
+                start = random.randrange(40)
+                end = random.randrange(40)
+                distances = distances_from(graph, start)
+                path = shortest_path(graph, start, end)
+                if end in distances:
+                    self.check_path(graph, path, start, end)
+                    self.assertEqual(len(path) - 1, distances[end])
+                    if start != end:
+                        self.assertIsNone(shortest_path(
+                            graph, start, end,
+                            max_length=distances[end] - 1,
+                        ))
+                else:
+                    self.assertIsNone(path)
+
+
+class TestBreadthFirstTree(unittest.TestCase):
+    def test_simple(self):
+        # 0 -> 1 -> 2 -> 3, 4 -> 3; 5 is unreachable.
+        graph = CSRGraph.from_successors([[1], [2], [3], [], [3], []])
+        predecessors = breadth_first_tree(graph, [0, 4])
+        self.assertEqual(list(predecessors), [0, 0, 1, 4, 4, -1])
+
+    def test_stops_once_targets_reached(self):
+        graph = CSRGraph.from_successors([[1], [2], [3], []])
+        predecessors = breadth_first_tree(graph, [0], [1])
+        self.assertEqual(predecessors[1], 0)
+        self.assertEqual(predecessors[3], -1)
+
+    def test_random_graphs(self):
+        random.seed(1414)
+        for _ in range(20):
+            graph = random_graph(40, random.randrange(80))
+            sources = random.sample(range(40), 3)
+            predecessors = breadth_first_tree(graph, sources)
+            distances = {}
+            for source in sources:
+                for vertex, distance in distances_from(graph, source).items():
+                    distances[vertex] = min(
+                        distance, distances.get(vertex, distance))
+            for vertex in range(40):
+                if vertex not in distances:
+                    self.assertEqual(predecessors[vertex], -1)
+                    continue
+                # Following predecessors gives a shortest path from a source.
+                position, length = vertex, 0
+                while predecessors[position] != position:
+                    self.assertIn(
+                        position, list(graph.children(predecessors[position])))
+                    position = predecessors[position]
+                    length += 1
+                self.assertIn(position, sources)
+                self.assertEqual(length, distances[vertex])
+
+
+def brute_force_cycles(graph, max_length=None):
+    """
+    Return the set of elementary cycles of a small graph, as tuples
+    beginning with their smallest vertex.
+
+    """
+    edges = {
+        (graph.tail(edge), graph.head(edge))
+        for edge in range(graph.edge_count)
+    }
+    cycles = set()
+    for length in range(1, graph.vertex_count + 1):
+        if max_length is not None and length > max_length:
+            break
+        for cycle in itertools.permutations(range(graph.vertex_count), length):
+            if cycle[0] != min(cycle):
+                continue
+            if all((cycle[i - 1], cycle[i]) in edges for i in range(length)):
+                cycles.add(cycle)
+    return cycles
+
+
+class TestElementaryCycles(unittest.TestCase):
+    def cycles(self, graph, **kwargs):
+        _, labels = strongly_connected_components(graph)
+        return [
+            tuple(cycle)
+            for cycle in elementary_cycles(graph, labels, **kwargs)
+        ]
+
+    def test_simple(self):
+        # Cycles 0 -> 1 -> 0, 0 -> 1 -> 2 -> 0 and 2 -> 2.
+        graph = CSRGraph.from_successors([[1], [0, 2], [0, 2], []])
+        self.assertCountEqual(
+            self.cycles(graph), [(0, 1), (0, 1, 2), (2,)])
+        self.assertCountEqual(
+            self.cycles(graph, max_length=2), [(0, 1), (2,)])
+        self.assertEqual(self.cycles(graph, max_length=0), [])
+
+    def test_starts(self):
+        graph = CSRGraph.from_successors([[1], [0, 2], [0, 2], []])
+        self.assertEqual(self.cycles(graph, starts=[2]), [(2,)])
+        self.assertEqual(self.cycles(graph, starts=[1, 3]), [])
+        cycles = self.cycles(graph, starts=[2, 0])
+        self.assertEqual(cycles[0], (2,))
+        self.assertCountEqual(cycles[1:], [(0, 1), (0, 1, 2)])
+
+    def test_random_graphs(self):
+        random.seed(1729)
+        for _ in range(30):
+            graph = random_graph(6, random.randrange(15))
+            expected = brute_force_cycles(graph)
+            cycles = self.cycles(graph)
+            self.assertEqual(len(cycles), len(set(cycles)))
+            self.assertEqual(set(cycles), expected)
+
+            max_length = random.randrange(1, 5)
+            cycles = self.cycles(graph, max_length=max_length)
+            self.assertEqual(len(cycles), len(set(cycles)))
+            self.assertEqual(
+                set(cycles), brute_force_cycles(graph, max_length))
+
+    def test_deadline(self):
+        # The complete graph on 10 vertices has over a million elementary
+        # cycles.
+        graph = CSRGraph.from_successors(
+            [[w for w in range(10) if w != v] for v in range(10)])
+        start = time.time()
+        cycles = self.cycles(graph, deadline=start + 0.05)
+        self.assertLess(time.time() - start, 5.0)
+        self.assertLess(len(cycles), 1000000)
+
+
+class TestShortestCycles(unittest.TestCase):
+    def test_simple(self):
+        # 0 -> 1 -> 0, 1 -> 2 -> 0, 2 -> 2; 3 -> 0 is on no cycle.
+        graph = CSRGraph.from_successors([[1], [0, 2], [0, 2], [0]])
+        _, labels = strongly_connected_components(graph)
+        self.assertEqual(
+            list(shortest_cycles(graph, labels, [0, 1, 2, 3])),
+            [[0, 1], [1, 0], [2], None],
+        )
+        self.assertEqual(
+            list(shortest_cycles(graph, labels, [0, 2], max_length=1)),
+            [None, [2]],
+        )
+
+    def test_random_graphs(self):
+        random.seed(1123)
+        for _ in range(20):
+            graph = random_graph(30, random.randrange(60))
+            _, labels = strongly_connected_components(graph)
+            starts = list(range(30)) * 2
+            cycles = list(shortest_cycles(graph, labels, starts))
+            for start, cycle in zip(starts, cycles):
+                distances = distances_from(graph, start)
+                lengths = [
+                    distances[graph.tail(edge)] + 1
+                    for edge in graph.in_edges(start)
+                    if graph.tail(edge) in distances
+                ]
+                if not lengths:
+                    self.assertIsNone(cycle)
+                    continue
+                self.assertEqual(cycle[0], start)
+                self.assertEqual(len(cycle), min(lengths))
+                self.assertEqual(len(set(cycle)), len(cycle))
+                for tail, head in zip(cycle, cycle[1:] + cycle[:1]):
+                    self.assertIn(head, list(graph.children(tail)))
+
+
+class TestBreadthFirstOrder(unittest.TestCase):
+    def test_simple(self):
+        # 0 -> 1 -> 2 -> 3, 0 -> 4, 5 -> 2.
+        graph = CSRGraph.from_successors([[1, 4], [2], [3], [], [], [2]])
+        self.assertEqual(
+            list(breadth_first_order(graph, [0])), [0, 1, 4, 2, 3])
+        self.assertEqual(
+            list(breadth_first_order(graph, [0], generations=1)), [0, 1, 4])
+        self.assertEqual(
+            list(breadth_first_order(graph, [0], generations=0)), [0])
+        self.assertEqual(
+            list(breadth_first_order(graph, [3, 4], reverse=True)),
+            [3, 4, 2, 0, 1, 5],
+        )
+        self.assertEqual(
+            list(breadth_first_order(graph, [0, 1, 0])), [0, 1, 4, 2, 3])
+
+    def test_random_graphs(self):
+        random.seed(2236)
+        for _ in range(20):
+            graph = random_graph(40, random.randrange(80))
+            sources = random.sample(range(40), 2)
+            generations = random.choice([None, 1, 2, 3])
+            distances = {}
+            for source in sources:
+                for vertex, distance in distances_from(graph, source).items():
+                    distances[vertex] = min(
+                        distance, distances.get(vertex, distance))
+            order = list(breadth_first_order(graph, sources, generations))
+            self.assertEqual(len(order), len(set(order)))
+            self.assertEqual(
+                set(order),
+                {
+                    vertex for vertex, distance in distances.items()
+                    if generations is None or distance <= generations
+                },
+            )
+            order_distances = [distances[vertex] for vertex in order]
+            self.assertEqual(order_distances, sorted(order_distances))
@@ -0,0 +1,122 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the CSRGraph class.
+
+"""
+import unittest
+
+from refcycle.csr_graph import CSRGraph
+
+
+def example_graph():
+    # 0 -> 1, 0 -> 2, 1 -> 2, 2 -> 0, 2 -> 2; vertex 3 is isolated.
+    return CSRGraph.from_successors([[1, 2], [2], [0, 2], []])
+
+
+class TestCSRGraph(unittest.TestCase):
+    def test_counts(self):
+        graph = example_graph()
+        self.assertEqual(graph.vertex_count, 4)
+        self.assertEqual(graph.edge_count, 5)
+
+    def test_empty(self):
+        graph = CSRGraph.from_successors([])
+        self.assertEqual(graph.vertex_count, 0)
+        self.assertEqual(graph.edge_count, 0)
+
+    def test_out_edges(self):
+        graph = example_graph()
+        self.assertEqual(list(graph.out_edges(0)), [0, 1])
+        self.assertEqual(list(graph.out_edges(1)), [2])
+        self.assertEqual(list(graph.out_edges(2)), [3, 4])
+        self.assertEqual(list(graph.out_edges(3)), [])
+
+    def test_head_and_tail(self):
+        graph = example_graph()
+        self.assertEqual(
+            [(graph.tail(edge), graph.head(edge)) for edge in range(5)],
+            [(0, 1), (0, 2), (1, 2), (2, 0), (2, 2)],
+        )
+
+    def test_in_edges(self):
+        graph = example_graph()
+        self.assertEqual(list(graph.in_edges(0)), [3])
+        self.assertEqual(list(graph.in_edges(1)), [0])
+        self.assertEqual(list(graph.in_edges(2)), [1, 2, 4])
+        self.assertEqual(list(graph.in_edges(3)), [])
+
+    def test_children_and_parents(self):
+        graph = example_graph()
+        self.assertEqual(list(graph.children(0)), [1, 2])
+        self.assertEqual(list(graph.children(2)), [0, 2])
+        self.assertEqual(list(graph.parents(2)), [0, 1, 2])
+        self.assertEqual(list(graph.parents(3)), [])
+        self.assertEqual(list(graph.iter_parents(2)), [0, 1, 2])
+        self.assertEqual(list(graph.iter_parents(3)), [])
+
+    def test_degrees(self):
+        graph = example_graph()
+        self.assertEqual(list(graph.out_degrees()), [2, 1, 2, 0])
+        self.assertEqual(list(graph.in_degrees()), [1, 1, 3, 0])
+        self.assertFalse(graph.has_reverse)
+        graph.in_offsets
+        self.assertEqual(list(graph.in_degrees()), [1, 1, 3, 0])
+
+    def test_subgraph(self):
+        graph = example_graph()
+        subgraph = graph.subgraph([2, 0])
+        self.assertEqual(subgraph.vertex_count, 2)
+        # Edges 2 -> 0, 2 -> 2 and 0 -> 2, renumbered.
+        self.assertEqual(list(subgraph.children(0)), [1, 0])
+        self.assertEqual(list(subgraph.children(1)), [0])
+        self.assertEqual(list(subgraph.parents(0)), [0, 1])
+
+    def test_nbytes(self):
+        graph = example_graph()
+        self.assertGreater(graph.nbytes(), 0)
+
+    def test_owned_objects(self):
+        graph = example_graph()
+        owned = list(map(id, graph.owned_objects()))
+        self.assertEqual(
+            owned, [id(graph), id(graph.out_offsets), id(graph.heads)])
+
+        graph.parents(0)
+        owned = set(map(id, graph.owned_objects()))
+        for array in graph.in_offsets, graph.in_order, graph.tails:
+            self.assertIn(id(array), owned)
+
+    def test_reverse_built_lazily(self):
+        graph = example_graph()
+        self.assertFalse(graph.has_reverse)
+        # Forward traversal and tail lookups don't need the reverse
+        # structure.
+        self.assertEqual(list(graph.children(0)), [1, 2])
+        self.assertEqual(graph.tail(3), 2)
+        self.assertFalse(graph.has_reverse)
+        forward_bytes = graph.nbytes()
+
+        self.assertEqual(list(graph.parents(2)), [0, 1, 2])
+        self.assertTrue(graph.has_reverse)
+        self.assertGreater(graph.nbytes(), forward_bytes)
+        self.assertEqual(
+            [graph.tail(edge) for edge in range(5)],
+            [0, 0, 1, 2, 2],
+        )
+
+    def test_tail_out_of_range(self):
+        graph = example_graph()
+        with self.assertRaises(IndexError):
+            graph.tail(5)
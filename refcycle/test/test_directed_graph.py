@@ -20,6 +20,7 @@ import unittest
 import six
 from six.moves import range
 
+from refcycle.component_record import ComponentRecord
 from refcycle.directed_graph import DirectedGraph
 
 
@@ -137,6 +138,73 @@ class TestDirectedGraph(unittest.TestCase):
             ]
             self.assertCountEqual(actual_sccs, alternative_sccs)
 
+    def test_component_records(self):
+        for test_graph, expected_sccs in test_pairs:
+            records = test_graph.component_records()
+            for record in records:
+                self.assertIsInstance(record, ComponentRecord)
+                self.assertIs(record.graph, test_graph)
+                self.assertEqual(len(record), len(record.members))
+            self.assertCountEqual(
+                [set(record) for record in records],
+                expected_sccs,
+            )
+            self.assertEqual(
+                sum(record.internal_edge_count + record.outgoing_edge_count
+                    for record in records),
+                len(test_graph.edges),
+            )
+
+    def test_analysis_cache(self):
+        graph = graph_from_string("1 2 3; 1->2->1 2->3")
+        condensation = graph.condensation()
+        self.assertIs(graph.condensation().labels, condensation.labels)
+        self.assertEqual(len(graph.strongly_connected_components()), 2)
+        self.assertIs(graph.condensation().labels, condensation.labels)
+
+        graph.clear_analysis_cache()
+        self.assertIsNot(graph.condensation().labels, condensation.labels)
+        # Clearing an empty cache, or unknown names, is harmless.
+        graph.clear_analysis_cache('no_such_analysis')
+        graph.clear_analysis_cache()
+        graph.clear_analysis_cache()
+
+    def test_component_record_edge_counts(self):
+        graph = graph_from_string("1 2 3 4; 1->2->1 2->3 2->3 1->4 4->4")
+        records = {
+            frozenset(record): record
+            for record in graph.component_records()
+        }
+        self.assertEqual(len(records), 3)
+        record_12 = records[frozenset('12')]
+        self.assertEqual(record_12.internal_edge_count, 2)
+        self.assertEqual(record_12.outgoing_edge_count, 3)
+        self.assertTrue(record_12.cyclic)
+        record_3 = records[frozenset('3')]
+        self.assertEqual(record_3.internal_edge_count, 0)
+        self.assertEqual(record_3.outgoing_edge_count, 0)
+        self.assertFalse(record_3.cyclic)
+        record_4 = records[frozenset('4')]
+        self.assertEqual(record_4.internal_edge_count, 1)
+        self.assertTrue(record_4.cyclic)
+
+        subgraph = record_12.subgraph()
+        self.assertIsInstance(subgraph, DirectedGraph)
+        self.assertCountEqual(subgraph, ['1', '2'])
+        self.assertEqual(len(subgraph.edges), 2)
+
+    def test_source_component_records(self):
+        graph = graph_from_string("1 2 3 4 5; 1->2->1 2->3 4->3 5->5")
+        records = graph.source_component_records()
+        self.assertCountEqual(
+            [set(record) for record in records],
+            [{'1', '2'}, {'4'}, {'5'}],
+        )
+        self.assertCountEqual(
+            [set(source) for source in graph.source_components()],
+            [{'1', '2'}, {'4'}, {'5'}],
+        )
+
     def test_strongly_connected_components_deep(self):
         # A deep graph will blow Python's recursion limit with
         # a recursive implementation of the algorithm.
@@ -284,6 +352,31 @@ class TestDirectedGraph(unittest.TestCase):
             [2],
         )
 
+    def test_iter_children_and_parents(self):
+        self.assertCountEqual(test_graph.iter_children(1), [2, 3, 4])
+        self.assertCountEqual(test_graph.iter_children(7), [])
+        self.assertCountEqual(test_graph.iter_parents(7), [3, 6])
+        graph = graph_from_string("1 2; 1->2 1->2 2->2")
+        self.assertEqual(list(graph.iter_children('1')), ['2', '2'])
+        self.assertEqual(list(graph.iter_parents('2')), ['1', '1', '2'])
+
+    def test_edges(self):
+        graph = graph_from_string("1 2 3; 1->2 1->2 2->3 3->3")
+        edges = graph.edges
+        self.assertEqual(len(edges), 4)
+        self.assertCountEqual(list(edges), range(4))
+        self.assertIn(3, edges)
+        self.assertNotIn(4, edges)
+        self.assertNotIn(-1, edges)
+        self.assertCountEqual(
+            [(graph.tail(edge), graph.head(edge)) for edge in edges],
+            [('1', '2'), ('1', '2'), ('2', '3'), ('3', '3')],
+        )
+        for edge in graph.out_edges('1'):
+            self.assertEqual(graph.tail(edge), '1')
+        for edge in graph.in_edges('3'):
+            self.assertEqual(graph.head(edge), '3')
+
     def test_full_subgraph(self):
         subgraph = test_graph.full_subgraph(range(1, 6))
         edges = subgraph.edges
@@ -323,6 +416,19 @@ class TestDirectedGraph(unittest.TestCase):
         self.assertEqual(len(subgraph.vertices), len(graph.vertices))
         self.assertEqual(len(subgraph.edges), len(graph.edges))
 
+    def test_shortest_cycles_distinct(self):
+        graph = graph_from_string("a b; a->a a->b->a")
+        # The cycle a -> b -> a is first found from b, since the shortest
+        # cycle through a is the self-loop.
+        self.assertEqual(
+            graph.shortest_cycles(['a', 'b'], distinct=True),
+            [['a'], ['b', 'a']],
+        )
+        self.assertEqual(
+            graph.shortest_cycles(['b', 'a'], distinct=True),
+            [['b', 'a'], ['a']],
+        )
+
     def test_to_dot(self):
         dot = test_graph.to_dot()
         self.assertIsInstance(dot, six.text_type)
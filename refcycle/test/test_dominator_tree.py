@@ -0,0 +1,87 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the DominatorTree class.
+
+"""
+import unittest
+
+from refcycle.dominator_tree import DominatorTree
+from refcycle.test.test_directed_graph import graph_from_string
+
+
+class TestDominatorTree(unittest.TestCase):
+    def setUp(self):
+        # 1 -> 2 -> 4, 1 -> 3 -> 4, 4 -> 5 -> 4; 6 -> 4 is unreachable from 1.
+        self.graph = graph_from_string(
+            "1 2 3 4 5 6; 1->2 1->3 2->4 3->4 4->5 5->4 6->4")
+        self.tree = self.graph.dominator_tree(['1'])
+
+    def test_immediate_dominator(self):
+        tree = self.tree
+        self.assertIsInstance(tree, DominatorTree)
+        self.assertIsNone(tree.immediate_dominator('1'))
+        self.assertEqual(tree.immediate_dominator('2'), '1')
+        self.assertEqual(tree.immediate_dominator('3'), '1')
+        self.assertEqual(tree.immediate_dominator('4'), '1')
+        self.assertEqual(tree.immediate_dominator('5'), '4')
+        with self.assertRaises(ValueError):
+            tree.immediate_dominator('6')
+        with self.assertRaises(KeyError):
+            tree.immediate_dominator('7')
+
+    def test_reachable(self):
+        self.assertTrue(self.tree.reachable('5'))
+        self.assertFalse(self.tree.reachable('6'))
+
+    def test_dominates(self):
+        tree = self.tree
+        self.assertTrue(tree.dominates('1', '5'))
+        self.assertTrue(tree.dominates('4', '5'))
+        self.assertTrue(tree.dominates('5', '5'))
+        self.assertFalse(tree.dominates('2', '4'))
+        self.assertFalse(tree.dominates('5', '4'))
+        self.assertFalse(tree.dominates('1', '6'))
+
+    def test_dominated(self):
+        tree = self.tree
+        self.assertCountEqual(tree.dominated('1'), ['2', '3', '4'])
+        self.assertEqual(tree.dominated('4'), ['5'])
+        self.assertEqual(tree.dominated('2'), [])
+        self.assertEqual(tree.dominated('6'), [])
+
+    def test_retained_sizes(self):
+        vertices = self.tree.vertices
+        sizes = [10 * int(vertex) for vertex in vertices]
+        retained = dict(zip(vertices, self.tree.retained_sizes(sizes)))
+        self.assertEqual(
+            retained,
+            {'1': 150, '2': 20, '3': 30, '4': 90, '5': 50, '6': 0},
+        )
+
+    def test_owned_objects(self):
+        tree = self.tree
+        tree.dominated('1')
+        owned = set(map(id, tree.owned_objects()))
+        for obj in tree, tree.dominators, tree.order, tree._tree.heads:
+            self.assertIn(id(obj), owned)
+
+    def test_default_roots(self):
+        tree = self.graph.dominator_tree()
+        self.assertIs(self.graph.dominator_tree(), tree)
+        # Sources are 1 and 6, both reaching 4 by different routes.
+        self.assertIsNone(tree.immediate_dominator('1'))
+        self.assertIsNone(tree.immediate_dominator('6'))
+        self.assertIsNone(tree.immediate_dominator('4'))
+        self.assertEqual(tree.immediate_dominator('5'), '4')
@@ -0,0 +1,64 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the IndexedVertexSet class.
+
+"""
+import unittest
+
+from refcycle.indexed_vertex_set import IndexedVertexSet
+
+
+class TestIndexedVertexSet(unittest.TestCase):
+    def test_add_returns_index(self):
+        s = IndexedVertexSet()
+        self.assertEqual(s.add('a'), 0)
+        self.assertEqual(s.add('b'), 1)
+        self.assertEqual(s.add('a'), 0)
+        self.assertEqual(len(s), 2)
+
+    def test_index_and_getitem(self):
+        s = IndexedVertexSet()
+        s.update(['x', 'y', 'z'])
+        self.assertEqual(s.index('y'), 1)
+        self.assertEqual(s[2], 'z')
+        self.assertEqual(list(s.iter_elements([2, 0, 2])), ['z', 'x', 'z'])
+
+    def test_index_missing(self):
+        s = IndexedVertexSet(transform=id)
+        a = []
+        with self.assertRaises(KeyError) as cm:
+            s.index(a)
+        # The KeyError carries the original value, not the transformed one.
+        self.assertIs(cm.exception.args[0], a)
+
+    def test_transform(self):
+        s = IndexedVertexSet(transform=id)
+        a, b = [], []
+        s.add(a)
+        self.assertIn(a, s)
+        # b == a, but b is not a.
+        self.assertNotIn(b, s)
+        self.assertEqual(s.add(b), 1)
+
+    def test_iteration_order(self):
+        s = IndexedVertexSet()
+        s.update([3, 1, 2, 1])
+        self.assertEqual(list(s), [3, 1, 2])
+
+    def test_bool(self):
+        s = IndexedVertexSet()
+        self.assertFalse(s)
+        s.add(23)
+        self.assertTrue(s)
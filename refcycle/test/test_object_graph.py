@@ -17,8 +17,11 @@ import json
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
+import time
 import unittest
+import weakref
 import xml.etree.ElementTree as ET
 
 import six
@@ -26,7 +29,7 @@ from six.moves import range
 
 from refcycle.creators import objects_reachable_from
 from refcycle.i_directed_graph import IDirectedGraph
-from refcycle.object_graph import ObjectGraph
+from refcycle.object_graph import ObjectGraph, ObjectGraphView
 
 
 def dot_available():
@@ -135,6 +138,145 @@ class TestObjectGraph(unittest.TestCase):
             [(a, b), (b, a)],
         )
 
+    def test_edges_heads_and_tails(self):
+        a = [0]
+        b = [1]
+        a.append(b)
+        a.append(a)
+        b.append(a)
+        graph = ObjectGraph([a, b])
+        self.assertEqual(len(graph.edges), 3)
+        pairs = [(graph.tail(edge), graph.head(edge)) for edge in graph.edges]
+        self.assertCountEqual(pairs, [(a, b), (a, a), (b, a)])
+        for edge in graph.out_edges(a):
+            self.assertIs(graph.tail(edge), a)
+        for edge in graph.in_edges(a):
+            self.assertIs(graph.head(edge), a)
+        self.assertEqual(len(graph.in_edges(a)), 2)
+
+    def test_reverse_adjacency_built_on_demand(self):
+        a = []
+        b = [a]
+        c = [a, b]
+        graph = ObjectGraph([a, b, c])
+        self.assertCountEqual(graph.descendants(c), [a, b, c])
+        self.assertEqual(len(graph.strongly_connected_components()), 3)
+        self.assertFalse(graph._adjacency.has_reverse)
+        self.assertCountEqual(graph.parents(a), [b, c])
+        self.assertTrue(graph._adjacency.has_reverse)
+
+    def test_full_subgraph(self):
+        a = [0]
+        b = [1]
+        c = [2]
+        a.append(b)
+        b.append(c)
+        c.append(a)
+        a.append(c)
+        graph = ObjectGraph([a, b, c])
+        subgraph = graph.full_subgraph([a, c])
+        self.assertEqual(len(subgraph), 2)
+        self.assertCountEqual(
+            subgraph.references(),
+            [(a, c), (c, a)],
+        )
+        self.assertEqual(subgraph.parents(c), [a])
+
+    def test_full_subgraph_is_view(self):
+        a, b, c, d = [], [], [], []
+        a.append(b)
+        b.append(c)
+        c.append(a)
+        c.append(d)
+        graph = ObjectGraph([a, b, c, d])
+        view = graph.full_subgraph([c, a, b])
+        self.assertIsInstance(view, ObjectGraphView)
+        self.assertIsInstance(view, ObjectGraph)
+        self.assertEqual(list(view), [c, a, b])
+        self.assertIn(a, view)
+        self.assertNotIn(d, view)
+        self.assertEqual(len(view.edges), 3)
+        self.assertCountEqual(view.children(c), [a])
+        self.assertCountEqual(view.parents(a), [c])
+        for edge in view.edges:
+            self.assertIs(view.head(edge), graph.head(edge))
+        with self.assertRaises(KeyError):
+            view.children(d)
+
+        # Subgraphs of views are views on the same underlying graph.
+        subview = view.full_subgraph([a, b])
+        self.assertIsInstance(subview, ObjectGraphView)
+        self.assertIs(subview._graph, graph)
+        self.assertEqual(subview.references(), [(a, b)])
+        with self.assertRaises(KeyError):
+            view.full_subgraph([d])
+
+    def test_view_sparse_membership(self):
+        # A small subgraph of a large graph uses a sparse membership set.
+        objects = [[] for _ in range(1000)]
+        for obj1, obj2 in zip(objects, objects[1:]):
+            obj1.append(obj2)
+        graph = ObjectGraph(objects)
+        view = graph.full_subgraph(objects[10:13])
+        self.assertEqual(len(view), 3)
+        self.assertEqual(len(view.edges), 2)
+        self.assertIn(objects[11], view)
+        self.assertNotIn(objects[13], view)
+        self.assertEqual(view.children(objects[12]), [])
+
+    def test_materialize(self):
+        a, b, c = [], [], []
+        a.append(b)
+        b.append(a)
+        b.append(c)
+        graph = ObjectGraph([a, b, c])
+        self.assertIs(graph.materialize(), graph)
+        view = graph.full_subgraph([a, b])
+        standalone = view.materialize()
+        self.assertNotIsInstance(standalone, ObjectGraphView)
+        self.assertIsInstance(standalone, ObjectGraph)
+        self.assertEqual(list(standalone), [a, b])
+        self.assertCountEqual(standalone.references(), [(a, b), (b, a)])
+        self.assertEqual(list(standalone.edges), [0, 1])
+
+    def test_truncated_vertices(self):
+        a, b, c = [], [], []
+        a.append(b)
+        b.append(c)
+        c.append(a)
+        self.assertEqual(ObjectGraph([a, b, c]).truncated_vertices(), [])
+
+        # The references of truncated objects aren't examined.
+        graph = ObjectGraph._from_objects([a], truncated=[b, c, a])
+        self.assertEqual(list(graph), [a, b, c])
+        self.assertEqual(graph.truncated_vertices(), [b, c])
+        self.assertCountEqual(graph.references(), [(a, b)])
+
+        view = graph.full_subgraph([c, a])
+        self.assertEqual(view.truncated_vertices(), [c])
+        self.assertEqual(view.materialize().truncated_vertices(), [c])
+
+    def test_view_owned_objects(self):
+        a, b = [], []
+        a.append(b)
+        graph = ObjectGraph([a, b])
+        view = graph.full_subgraph([a])
+        owned = ObjectGraph(view.owned_objects())
+        self.assertIn(view, owned)
+        self.assertIn(graph, owned)
+        self.assertNotIn(a, owned)
+
+    def test_view_cannot_be_instantiated_directly(self):
+        with self.assertRaises(TypeError):
+            ObjectGraphView([[]])
+
+    def test_duplicate_objects(self):
+        a = []
+        b = [a]
+        graph = ObjectGraph([a, b, a])
+        self.assertEqual(len(graph), 2)
+        self.assertEqual(graph.references(), [(b, a)])
+
     def test_length(self):
         a = []
         b = []
@@ -198,6 +340,29 @@ class TestObjectGraph(unittest.TestCase):
         self.assertCountEqual(graph.parents(c), [a])
         self.assertCountEqual(graph.parents(d), [b, c])
 
+    def test_iter_children_and_parents(self):
+        a = []
+        b = []
+        c = []
+        d = []
+        a.append(b)
+        a.append(c)
+        b.append(d)
+        c.append(d)
+        graph = ObjectGraph([a, b, c, d])
+        self.assertNotIsInstance(graph.iter_children(a), list)
+        self.assertCountEqual(graph.iter_children(a), [b, c])
+        self.assertCountEqual(graph.iter_children(d), [])
+        self.assertCountEqual(graph.iter_parents(d), [b, c])
+        self.assertCountEqual(graph.iter_parents(a), [])
+
+        # Views only report neighbours that belong to the view.
+        view = graph.full_subgraph([a, b, d])
+        self.assertCountEqual(view.iter_children(a), [b])
+        self.assertCountEqual(view.iter_parents(d), [b])
+        self.assertCountEqual(view.children(a), [b])
+        self.assertCountEqual(view.parents(d), [b])
+
     def test_descendants(self):
         a = []
         b = []
@@ -228,6 +393,46 @@ class TestObjectGraph(unittest.TestCase):
         self.assertCountEqual(graph.ancestors(c), [c, a])
         self.assertCountEqual(graph.ancestors(d), [d, b, c, a])
 
+    def test_reachable_from(self):
+        # a -> b -> c -> d, e -> c; f isolated.
+        a, b, c, d, e, f = [], [], [], [], [], []
+        a.append(b)
+        b.append(c)
+        c.append(d)
+        e.append(c)
+        graph = ObjectGraph([a, b, c, d, e, f])
+
+        reachable = graph.reachable_from([a, e])
+        self.assertEqual(len(reachable), 5)
+        self.assertIn(d, reachable)
+        self.assertNotIn(f, reachable)
+        self.assertEqual(graph.reachable_from([a], count_only=True), 4)
+        self.assertEqual(
+            graph.reachable_from([a], generations=1, count_only=True), 2)
+        reachable = graph.reachable_from([c], direction='parents')
+        self.assertEqual(len(reachable), 4)
+        self.assertNotIn(d, reachable)
+        with self.assertRaises(ValueError):
+            graph.reachable_from([a], direction='sideways')
+
+    def test_iter_reachable_from(self):
+        a, b, c = [], [], []
+        a.append(b)
+        b.append(c)
+        graph = ObjectGraph([a, b, c])
+        reachable = graph.iter_reachable_from([a])
+        self.assertIs(next(reachable), a)
+        self.assertIs(next(reachable), b)
+        self.assertIs(next(reachable), c)
+        with self.assertRaises(StopIteration):
+            next(reachable)
+
+        # Bad arguments are reported immediately, not on first use.
+        with self.assertRaises(ValueError):
+            graph.iter_reachable_from([a], direction='sideways')
+        with self.assertRaises(KeyError):
+            graph.iter_reachable_from([[]])
+
     def test_shortest_path(self):
         # Looking for paths from a to f, we have:
         #     a -> b -> e -> f
@@ -253,6 +458,114 @@ class TestObjectGraph(unittest.TestCase):
         self.assertIn(c, path.vertices)
         self.assertIn(f, path.vertices)
 
+    def test_shortest_path_vertices(self):
+        a, b, c, d, e = [], [], [], [], []
+        a.append(b)
+        b.append(c)
+        c.append(d)
+        a.append(e)
+        e.append(d)
+        graph = ObjectGraph([a, b, c, d, e])
+        path = graph.shortest_path_vertices(a, d)
+        self.assertEqual(len(path), 3)
+        self.assertIs(path[0], a)
+        self.assertIs(path[1], e)
+        self.assertIs(path[2], d)
+
+        self.assertEqual(len(graph.shortest_path(a, d, max_length=2)), 3)
+        with self.assertRaises(ValueError):
+            graph.shortest_path_vertices(a, d, max_length=1)
+        with self.assertRaises(ValueError):
+            graph.shortest_path_vertices(d, a)
+
+    def test_view_shortest_path_vertices(self):
+        a, b, c, d = [], [], [], []
+        a.append(b)
+        b.append(d)
+        a.append(c)
+        c.append(d)
+        graph = ObjectGraph([a, b, c, d])
+        view = graph.full_subgraph([a, c, d])
+        path = view.shortest_path_vertices(a, d)
+        self.assertEqual(len(path), 3)
+        self.assertIs(path[1], c)
+
+    def test_retention_paths(self):
+        # root1 -> a -> b -> target1; root2 -> target1, root2 -> target2;
+        # target3 is unreachable from the roots.
+        root1, root2, a, b = [], [], [], []
+        target1, target2, target3 = [], [], []
+        root1.append(a)
+        a.append(b)
+        b.append(target1)
+        root2.extend([target1, target2])
+        target3.append(root1)
+        graph = ObjectGraph(
+            [root1, root2, a, b, target1, target2, target3])
+
+        paths, unreachable = graph.retention_paths(
+            [root1, root2], [target3, target1, target2])
+        self.assertEqual(len(paths), 2)
+        self.assertEqual(len(paths[0]), 2)
+        self.assertIs(paths[0][0], root2)
+        self.assertIs(paths[0][1], target1)
+        self.assertIs(paths[1][0], root2)
+        self.assertIs(paths[1][1], target2)
+        self.assertEqual(len(unreachable), 1)
+        self.assertIs(unreachable[0], target3)
+
+        # A target that's also a root has a one-vertex path.
+        paths, unreachable = graph.retention_paths([a], [a, b])
+        self.assertEqual(len(paths), 2)
+        self.assertEqual(len(paths[0]), 1)
+        self.assertIs(paths[0][0], a)
+        self.assertEqual(unreachable, [])
+
+        # Targets missing from the graph are reported as unreachable.
+        outsider = []
+        paths, unreachable = graph.retention_paths(
+            [root1], [outsider, b, target2])
+        self.assertEqual(len(paths), 1)
+        self.assertIs(paths[0][-1], b)
+        self.assertEqual(len(unreachable), 2)
+        self.assertIs(unreachable[0], outsider)
+        self.assertIs(unreachable[1], target2)
+
+    def test_elementary_cycles(self):
+        a, b, c, d = [], [], [], []
+        a.extend([b, c])
+        b.append(a)
+        c.extend([a, c])
+        d.append(a)
+        graph = ObjectGraph([a, b, c, d])
+        cycles = list(graph.elementary_cycles())
+        self.assertEqual(len(cycles), 3)
+        self.assertCountEqual(
+            [[id(obj) for obj in cycle] for cycle in cycles],
+            [[id(a), id(b)], [id(a), id(c)], [id(c)]],
+        )
+
+        self.assertEqual(len(list(graph.elementary_cycles(max_length=1))), 1)
+        self.assertEqual(len(list(graph.elementary_cycles(max_count=2))), 2)
+        self.assertEqual(list(graph.elementary_cycles(max_count=0)), [])
+
+    def test_elementary_cycles_time_budget(self):
+        objects = [[] for _ in range(10)]
+        for obj in objects:
+            obj.extend(other for other in objects if other is not obj)
+        graph = ObjectGraph(objects)
+        # The complete graph on 10 vertices has over a million elementary
+        # cycles, far more than can be found within the budget.
+        time_budget = 0.05
+        start = time.time()
+        cycles = graph.elementary_cycles(time_budget=time_budget)
+        count = sum(1 for _ in cycles)
+        elapsed = time.time() - start
+        self.assertGreaterEqual(elapsed, time_budget)
+        self.assertLess(elapsed, 5.0)
+        self.assertGreater(count, 0)
+        self.assertLess(count, 1000000)
+
     def test_shortest_path_no_path(self):
         a = []
         b = []
@@ -284,6 +597,44 @@ class TestObjectGraph(unittest.TestCase):
         self.assertIsInstance(cycle, IDirectedGraph)
         self.assertEqual(len(cycle), 2)
 
+    def test_shortest_cycle_max_length(self):
+        # a -> b -> c -> a, and a -> d; d is on no cycle.
+        a, b, c, d = [], [], [], []
+        a.extend([b, d])
+        b.append(c)
+        c.append(a)
+        graph = ObjectGraph([a, b, c, d])
+        self.assertEqual(len(graph.shortest_cycle(a, max_length=3)), 3)
+        with self.assertRaises(ValueError):
+            graph.shortest_cycle(a, max_length=2)
+        with self.assertRaises(ValueError):
+            graph.shortest_cycle(d)
+        with self.assertRaises(KeyError):
+            graph.shortest_cycle([])
+
+    def test_shortest_cycles(self):
+        # a -> b -> a, b -> c -> a, c -> c, d -> a.
+        a, b, c, d = [], [], [], []
+        a.append(b)
+        b.extend([a, c])
+        c.extend([a, c])
+        d.append(a)
+        graph = ObjectGraph([a, b, c, d])
+
+        cycles = graph.shortest_cycles([a, b, c, d])
+        self.assertEqual(len(cycles), 4)
+        self.assertEqual(list(map(len, cycles[:3])), [2, 2, 1])
+        self.assertIs(cycles[0][0], a)
+        self.assertIs(cycles[0][1], b)
+        self.assertIs(cycles[1][0], b)
+        self.assertIs(cycles[1][1], a)
+        self.assertIs(cycles[2][0], c)
+        self.assertIsNone(cycles[3])
+
+        distinct = graph.shortest_cycles([a, b, c, d], distinct=True)
+        self.assertEqual(len(distinct), 2)
+        self.assertEqual(len(graph.shortest_cycles()), 4)
+
     def test_shortest_cycle_self_cycle(self):
         a = []
         b = []
@@ -326,6 +677,36 @@ class TestObjectGraph(unittest.TestCase):
         # Exactly one of c and d should be in the cycle.
         self.assertEqual((c in cycle) + (d in cycle), 1)
 
+    def test_degrees(self):
+        a, b, c = [], [], []
+        a.extend([b, c, c])
+        b.append(c)
+        graph = ObjectGraph([a, b, c])
+        self.assertEqual(list(graph.out_degrees()), [3, 1, 0])
+        self.assertEqual(list(graph.in_degrees()), [0, 1, 3])
+        self.assertIs(graph.out_degrees(), graph.out_degrees())
+
+    def test_top_referrers_and_referents(self):
+        a, b, c, d = [], [], [], []
+        a.extend([b, c, d])
+        b.extend([c, d])
+        c.append(d)
+        graph = ObjectGraph([a, b, c, d])
+
+        top = graph.top_referrers(2)
+        self.assertEqual(len(top), 2)
+        self.assertIs(top[0][0], a)
+        self.assertEqual(top[0][1], 3)
+        self.assertIs(top[1][0], b)
+        self.assertEqual(top[1][1], 2)
+
+        top = graph.top_referents(1)
+        self.assertEqual(len(top), 1)
+        self.assertIs(top[0][0], d)
+        self.assertEqual(top[0][1], 3)
+
+        self.assertEqual(len(graph.top_referents(10)), 4)
+
     def test_count_by_typename(self):
         a, b, c = [], [], []
         d, e = set(), set()
@@ -349,6 +730,36 @@ class TestObjectGraph(unittest.TestCase):
         self.assertIn(d, sets)
         self.assertIn(e, sets)
 
+    def test_shallow_sizes(self):
+        a, b, c = [], [1, 2, 3], {}
+        graph = ObjectGraph([a, b, c])
+        sizes = graph.shallow_sizes()
+        self.assertEqual(list(sizes), [sys.getsizeof(obj) for obj in graph])
+        self.assertIs(graph.shallow_sizes(), sizes)
+
+    def test_size_by_typename(self):
+        lists = [list(range(n)) for n in range(10)]
+        d = {}
+        graph = ObjectGraph(lists + [d])
+        list_sizes = sorted(sys.getsizeof(obj) for obj in lists)
+
+        summary = graph.size_by_typename(percentiles=(0, 50, 90, 100))
+        self.assertEqual(set(summary), {'list', 'dict'})
+        self.assertEqual(summary['list']['count'], 10)
+        self.assertEqual(summary['list']['total'], sum(list_sizes))
+        self.assertEqual(summary['list']['max'], list_sizes[-1])
+        self.assertEqual(
+            summary['list']['percentiles'],
+            {0: list_sizes[0], 50: list_sizes[4], 90: list_sizes[8],
+             100: list_sizes[9]},
+        )
+        self.assertEqual(summary['dict']['count'], 1)
+        self.assertEqual(summary['dict']['max'], sys.getsizeof(d))
+        self.assertEqual(
+            set(graph.size_by_typename()['dict']['percentiles']),
+            {50, 90, 99},
+        )
+
     def test_to_dot(self):
         a = []
         b = []
@@ -486,6 +897,41 @@ class TestObjectGraph(unittest.TestCase):
         self.assertEqual(scc_cd.children(c), [d])
         self.assertEqual(scc_cd.children(d), [c])
 
+        # The components are views sharing a single membership array.
+        self.assertIsInstance(scc_ab, ObjectGraphView)
+        self.assertIs(
+            scc_ab._membership.labels,
+            scc_cd._membership.labels,
+        )
+
+    def test_component_records(self):
+        a, b, c, d = ['A'], ['B'], ['C'], ['D']
+        a.append(b)
+        b.append(a)
+        b.append(c)
+        c.append(c)
+        graph = ObjectGraph([a, b, c, d])
+        records = graph.component_records()
+        self.assertEqual(len(records), 3)
+        record_ab = next(record for record in records if a in record.members)
+        self.assertEqual(len(record_ab), 2)
+        self.assertEqual(record_ab.internal_edge_count, 2)
+        self.assertEqual(record_ab.outgoing_edge_count, 1)
+        record_d = next(record for record in records if d in record.members)
+        self.assertFalse(record_d.cyclic)
+        subgraph = record_ab.subgraph()
+        self.assertIsInstance(subgraph, ObjectGraph)
+        self.assertCountEqual(subgraph.references(), [(a, b), (b, a)])
+        # The subgraph shares the condensation's labels as its mask.
+        self.assertIs(
+            subgraph._membership.labels, graph.condensation().labels)
+
+        sources = graph.source_component_records()
+        self.assertCountEqual(
+            [len(source) for source in sources],
+            [2, 1],
+        )
+
     def test_source_components(self):
         # Single source consisting of two objects.
         a, b, c, d = ['A'], ['B'], ['C'], ['D']
@@ -528,6 +974,122 @@ class TestObjectGraph(unittest.TestCase):
         sources = graph.source_components()
         self.assertEqual(len(sources), 3)
 
+    def test_condensation_cached(self):
+        a, b, c = [], [], []
+        a.append(b)
+        b.append(a)
+        b.append(c)
+        graph = ObjectGraph([a, b, c])
+        first = graph.condensation()
+        second = graph.condensation()
+        self.assertIs(first.graph, graph)
+        self.assertIs(second.labels, first.labels)
+        self.assertIs(second.dag, first.dag)
+
+        graph.clear_analysis_cache('condensation')
+        third = graph.condensation()
+        self.assertIsNot(third.labels, first.labels)
+        self.assertEqual(list(third.labels), list(first.labels))
+
+        graph.clear_analysis_cache()
+        self.assertIsNot(graph.condensation().labels, third.labels)
+
+    def test_condensation_cache_creates_no_cycles(self):
+        a = []
+        a.append(a)
+        graph = ObjectGraph([a])
+        graph.condensation()
+        graph.find_by_typename('list')
+        # Without any cycles, the graph is freed as soon as it's deleted.
+        graph_ref = weakref.ref(graph)
+        del graph
+        self.assertIsNone(graph_ref())
+
+    def test_typename_queries_cached(self):
+        a, b = [], {}
+        graph = ObjectGraph([a, b])
+        self.assertEqual(graph.find_by_typename('list'), [a])
+        index = graph._typename_index()
+        self.assertIs(graph._typename_index(), index)
+        self.assertEqual(graph.count_by_typename(), {'list': 1, 'dict': 1})
+
+        graph.clear_analysis_cache('typename_index')
+        self.assertIsNot(graph._typename_index(), index)
+
+    def test_view_typename_queries(self):
+        a, b, c = [], {}, []
+        graph = ObjectGraph([a, b, c])
+        view = graph.full_subgraph([b, c])
+        self.assertEqual(view.find_by_typename('list'), [c])
+        self.assertEqual(view.count_by_typename(), {'list': 1, 'dict': 1})
+
+    def test_owned_objects_include_adjacency(self):
+        a, b = [], []
+        a.append(b)
+        b.append(a)
+        graph = ObjectGraph([a, b])
+        graph.parents(a)
+        owned = ObjectGraph(graph.owned_objects())
+        adjacency = graph._adjacency
+        for array in (adjacency.out_offsets, adjacency.heads,
+                      adjacency.in_offsets, adjacency.in_order,
+                      adjacency.tails):
+            self.assertIn(array, owned)
+
+    def test_owned_objects_include_analysis_cache(self):
+        a, b = [], []
+        a.append(b)
+        b.append(a)
+        graph = ObjectGraph([a, b])
+        view = graph.full_subgraph([a])
+        for g in graph, view:
+            g.condensation()
+            g.count_by_typename()
+            owned = ObjectGraph(g.owned_objects())
+            cache = g.__dict__['_analysis_cache']
+            self.assertIn(cache, owned)
+            for result in cache.values():
+                self.assertIn(result, owned)
+
+    def test_retained_sizes(self):
+        # a refers to b and c, both of which refer to d; e refers to d too.
+        a, b, c, d, e = [], [], [], [], []
+        a.extend([b, c])
+        b.append(d)
+        c.append(d)
+        e.append(d)
+        graph = ObjectGraph([a, b, c, d, e])
+        size = {id(obj): sys.getsizeof(obj) for obj in graph}
+
+        retained = dict(zip(map(id, graph), graph.retained_sizes([a])))
+        self.assertEqual(
+            retained[id(a)],
+            size[id(a)] + size[id(b)] + size[id(c)] + size[id(d)],
+        )
+        self.assertEqual(retained[id(b)], size[id(b)])
+        self.assertEqual(retained[id(d)], size[id(d)])
+        self.assertEqual(retained[id(e)], 0)
+
+        # By default, the sources a and e are the roots, so neither of them
+        # retains d.
+        self.assertEqual(
+            graph.retained_size(a), size[id(a)] + size[id(b)] + size[id(c)])
+        self.assertEqual(graph.retained_size(e), size[id(e)])
+        self.assertEqual(
+            sum(graph.retained_size(obj) for obj in [a, d, e]),
+            sum(size.values()),
+        )
+
+    def test_view_retained_sizes(self):
+        a, b, c = [], [], []
+        a.append(b)
+        b.append(c)
+        graph = ObjectGraph([a, b, c])
+        view = graph.full_subgraph([b, c])
+        self.assertEqual(
+            view.retained_size(b), sys.getsizeof(b) + sys.getsizeof(c))
+        self.assertEqual(view.dominator_tree().immediate_dominator(c), b)
+
     def test_abstract_bases(self):
         graph = ObjectGraph()
         self.assertIsInstance(graph, IDirectedGraph)
@@ -16,16 +16,21 @@ General tests for the refcycle package.
 
 """
 import gc
+import sys
 import unittest
+import weakref
 
 from refcycle import (
+    census,
     cycles_created_by,
     garbage,
+    iter_key_cycles,
     ObjectGraph,
     objects_reachable_from,
     snapshot,
     key_cycles,
 )
+from refcycle.directed_graph import DirectedGraph
 from refcycle.gc_utils import restore_gc_state
 
 
@@ -71,6 +76,114 @@ class TestRefcycle(unittest.TestCase):
                 original_objects.owned_objects())
             self.assertEqual(len(diff), 4)
 
+    def test_snapshot_skips_live_graphs(self):
+        with restore_gc_state():
+            gc.disable()
+            first = snapshot()
+            view = first.full_subgraph([])
+            second = snapshot()
+            second_ids = set(map(id, second))
+            for obj in first.owned_objects() + view.owned_objects():
+                self.assertNotIn(id(obj), second_ids)
+
+    def test_snapshot_keeps_weakrefs_to_graphs(self):
+        # Only the registry's own references to live graphs are left out.
+        with restore_gc_state():
+            gc.disable()
+            first = snapshot()
+            ref = weakref.ref(first)
+            second = snapshot()
+            self.assertIn(ref, second)
+            self.assertNotIn(first, second)
+
+    def test_snapshot_with_dead_proxy(self):
+        # Reading __class__ from a dead proxy raises ReferenceError.
+        with restore_gc_state():
+            gc.disable()
+            a = A()
+            proxy = weakref.proxy(a)
+            holder = [proxy]
+            del a
+            graph = snapshot()
+            self.assertIn(holder, graph)
+
+    def test_snapshot_exclude(self):
+        with restore_gc_state():
+            gc.disable()
+            original_objects = snapshot()
+            create_cycles()
+            new_objects = snapshot(exclude=original_objects)
+            # Depending on the Python version, the instance dictionaries
+            # may or may not be separate gc-tracked objects.
+            instances = new_objects.find_by(lambda obj: isinstance(obj, A))
+            self.assertEqual(len(instances), 2)
+            for obj in new_objects:
+                self.assertIn(type(obj), (A, dict))
+
+    def test_repeated_snapshot_exclude(self):
+        # The analysis results cached on live graphs shouldn't turn up in
+        # later snapshots.
+        with restore_gc_state():
+            gc.disable()
+            sizes = []
+            base = snapshot()
+            base.condensation()
+            base.count_by_typename()
+            for _ in range(4):
+                new_objects = snapshot(exclude=base)
+                new_objects.condensation()
+                new_objects.count_by_typename()
+                sizes.append(len(new_objects))
+            self.assertEqual(len(set(sizes)), 1, sizes)
+
+    @unittest.skipUnless(
+        sys.version_info >= (3, 8),
+        "gc.get_objects doesn't accept a generation before Python 3.8")
+    def test_snapshot_generation(self):
+        with restore_gc_state():
+            gc.disable()
+            gc.collect()
+            old = ['old']
+            gc.collect()
+            young = [old, ['young']]
+
+            graph = snapshot(generation=0)
+            self.assertIn(young, graph)
+            self.assertIn(young[1], graph)
+            self.assertNotIn(old, graph)
+            self.assertEqual(graph.truncated_vertices(), [])
+            self.assertIn(young, snapshot(generations=[0, 1, 2]))
+
+            graph = snapshot(generation=0, boundary=True)
+            self.assertIn(old, graph)
+            # Stubs are arbitrary heap objects, so compare by identity.
+            stub_ids = set(map(id, graph.truncated_vertices()))
+            self.assertIn(id(old), stub_ids)
+            self.assertNotIn(id(young), stub_ids)
+            self.assertCountEqual(graph.children(young), [old, young[1]])
+            self.assertEqual(graph.children(old), [])
+
+    def test_snapshot_bad_generation(self):
+        with self.assertRaises(ValueError):
+            snapshot(generation=0, generations=[1])
+        with self.assertRaises(ValueError):
+            snapshot(generation=len(gc.get_count()))
+        with self.assertRaises(ValueError):
+            snapshot(generations=[-1])
+
+    def test_census(self):
+        name = '{}.A'.format(__name__)
+        before = census().get(name, (0, 0))
+        objects = [A(), A(), A()]
+        refcounts = [sys.getrefcount(obj) for obj in objects]
+        count, size = census()[name]
+        self.assertEqual(count, before[0] + 3)
+        self.assertEqual(
+            size, before[1] + sum(sys.getsizeof(obj) for obj in objects))
+        # No references to the objects are kept.
+        self.assertEqual(
+            [sys.getrefcount(obj) for obj in objects], refcounts)
+
     def test_objects_reachable_from(self):
         a = []
         b = []
@@ -81,6 +194,111 @@ class TestRefcycle(unittest.TestCase):
             [a, b],
         )
 
+    def test_objects_reachable_from_exclude(self):
+        a = []
+        b = []
+        c = []
+        a.append(b)
+        b.append(c)
+        graph = objects_reachable_from(a, exclude=[b])
+        self.assertCountEqual(list(graph), [a])
+        graph = objects_reachable_from(a, exclude=ObjectGraph([a]))
+        self.assertEqual(len(graph), 0)
+
+    def test_objects_reachable_from_roots(self):
+        a = []
+        b = []
+        c = []
+        a.append(c)
+        b.append(c)
+        graph = objects_reachable_from(a, b)
+        self.assertCountEqual(list(graph), [a, b, c])
+        self.assertCountEqual(graph.parents(c), [a, b])
+        self.assertEqual(graph.truncated_vertices(), [])
+        self.assertEqual(len(objects_reachable_from()), 0)
+        with self.assertRaises(TypeError):
+            objects_reachable_from(a, max_dpeth=2)
+
+        # A single root can still be passed by keyword.
+        graph = objects_reachable_from(obj=a)
+        self.assertCountEqual(list(graph), [a, c])
+        with self.assertRaises(TypeError):
+            objects_reachable_from(a, obj=b)
+
+    def test_objects_reachable_from_edges(self):
+        # The edges recorded during the walk match those found by examining
+        # the objects afterwards.
+        a = {'x': [], 'y': []}
+        a['x'].extend([a, a['y'], a['y']])
+        a['y'].append(a['x'])
+        graph = objects_reachable_from(a, include_untracked=False)
+        rebuilt = ObjectGraph(graph)
+        self.assertEqual(len(graph), 3)
+        self.assertEqual(len(graph.edges), len(rebuilt.edges))
+        for obj in graph:
+            self.assertEqual(
+                list(map(id, graph.children(obj))),
+                list(map(id, rebuilt.children(obj))),
+            )
+
+    def test_objects_reachable_from_max_depth(self):
+        a, b, c, d = [], [], [], []
+        a.append(b)
+        b.append(c)
+        c.append(d)
+        graph = objects_reachable_from(a, max_depth=2)
+        self.assertCountEqual(list(graph), [a, b, c])
+        self.assertEqual(graph.truncated_vertices(), [c])
+        self.assertEqual(graph.children(c), [])
+        self.assertEqual(graph.children(b), [c])
+
+        graph = objects_reachable_from(a, max_depth=0)
+        self.assertEqual(list(graph), [a])
+        self.assertEqual(graph.truncated_vertices(), [a])
+
+    def test_objects_reachable_from_max_objects(self):
+        a, b, c, d = [], [], [], []
+        a.extend([b, c])
+        b.append(d)
+        graph = objects_reachable_from(a, max_objects=3)
+        self.assertCountEqual(list(graph), [a, b, c])
+        # c has no referents, so only b is cut short.
+        self.assertEqual(len(graph.truncated_vertices()), 1)
+        self.assertIs(graph.truncated_vertices()[0], b)
+        graph = objects_reachable_from(a, max_objects=2)
+        self.assertEqual(list(graph), [a])
+        self.assertEqual(graph.truncated_vertices(), [a])
+        graph = objects_reachable_from(a, max_objects=4)
+        self.assertEqual(len(graph), 4)
+        self.assertEqual(graph.truncated_vertices(), [])
+
+        # The limit applies to the roots too.
+        graph = objects_reachable_from(a, b, c, max_objects=1)
+        self.assertEqual(list(map(id, graph)), [id(a)])
+        self.assertEqual(list(map(id, graph.truncated_vertices())), [id(a)])
+        self.assertEqual(len(graph.edges), 0)
+        self.assertEqual(len(objects_reachable_from(a, max_objects=0)), 0)
+
+    def test_objects_reachable_from_follow(self):
+        inner = [[]]
+        outer = [inner, ['other']]
+        graph = objects_reachable_from(
+            outer, follow=lambda obj: obj is not inner)
+        self.assertIn(inner, graph)
+        self.assertNotIn(inner[0], graph)
+        self.assertEqual(graph.truncated_vertices(), [inner])
+
+        # The roots are always followed.
+        graph = objects_reachable_from(outer, follow=lambda obj: False)
+        self.assertEqual(len(graph), 3)
+
+    def test_objects_reachable_from_untracked(self):
+        a = [1, 'one', (), []]
+        graph = objects_reachable_from(a)
+        self.assertIn(1, [obj for obj in graph if type(obj) is int])
+        graph = objects_reachable_from(a, include_untracked=False)
+        self.assertCountEqual(list(graph), [a, a[3]])
+
     def test_garbage(self):
         with restore_gc_state():
             gc.disable()
@@ -157,3 +375,117 @@ class TestRefcycle(unittest.TestCase):
             # Make sure to remove the sccs for good.
             del sccs
             gc.collect()
+
+    def test_iter_key_cycles(self):
+        # Sources {a, b} and {e, f, g}, and an acyclic source h.
+        a, b, c, d = ['a'], ['b'], ['c'], ['d']
+        e, f, g, h = ['e'], ['f'], ['g'], ['h']
+        a.append(b)
+        b.extend([a, c])
+        c.append(d)
+        d.append(c)
+        e.append(f)
+        f.append(g)
+        g.extend([e, d])
+        h.append(c)
+        graph = ObjectGraph([a, b, c, d, e, f, g, h])
+
+        def names(cycles):
+            return [sorted(obj[0] for obj in cycle) for cycle in cycles]
+
+        self.assertCountEqual(
+            names(iter_key_cycles(graph)),
+            [['h'], ['a', 'b'], ['e', 'f', 'g']],
+        )
+        self.assertEqual(
+            names(iter_key_cycles(graph, order='largest')),
+            [['e', 'f', 'g'], ['a', 'b'], ['h']],
+        )
+        self.assertEqual(
+            names(iter_key_cycles(graph, order='largest', max_cycles=1)),
+            [['e', 'f', 'g']],
+        )
+        self.assertCountEqual(
+            names(iter_key_cycles(graph, min_size=2)),
+            [['a', 'b'], ['e', 'f', 'g']],
+        )
+        with self.assertRaises(ValueError):
+            iter_key_cycles(graph, order='smallest')
+        with self.assertRaises(ValueError):
+            iter_key_cycles(graph, max_cycles=-1)
+        self.assertEqual(list(iter_key_cycles(graph, max_cycles=0)), [])
+
+        # Components are standalone graphs keeping the original edges.
+        cycle = next(iter_key_cycles(graph, order='largest'))
+        self.assertIs(type(cycle), ObjectGraph)
+        self.assertEqual(len(cycle.edges), 3)
+
+    def test_key_cycles_of_directed_graph(self):
+        graph = DirectedGraph.from_edge_pairs(
+            vertices=[1, 2, 3],
+            edge_pairs=[(1, 2), (2, 1), (2, 3)],
+        )
+        cycles = key_cycles(graph)
+        self.assertEqual(len(cycles), 1)
+        self.assertIsInstance(cycles[0], DirectedGraph)
+        self.assertCountEqual(cycles[0].vertices, [1, 2])
+
+    def test_iter_key_cycles_releases_objects(self):
+        def instances_of_a(graph):
+            return graph.find_by(lambda obj: isinstance(obj, A))
+
+        def live_names():
+            return {
+                obj.name for obj in gc.get_objects() if isinstance(obj, A)}
+
+        with restore_gc_state():
+            gc.disable()
+            # Two cycles, the second larger and with more garbage hanging
+            # off it.
+            first, second = A(), A()
+            first.name = 'first'
+            first.foo = A()
+            first.foo.name = 'first'
+            first.foo.foo = first
+            second.name = 'second'
+            second.foo = A()
+            second.foo.name = 'second'
+            second.foo.foo = A()
+            second.foo.foo.name = 'second'
+            second.foo.foo.foo = second
+            second.foo.bar = A()
+            second.foo.bar.name = 'second'
+            second.foo.bar.foo = second.foo.bar
+            del first, second
+
+            cycles = iter_key_cycles(order='largest')
+            cycle = next(cycles)
+            self.assertEqual(len(instances_of_a(cycle)), 3)
+            del cycle
+            gc.collect()
+            # The generator holds the first cycle, but not the second.
+            self.assertEqual(live_names(), {'first'})
+
+            cycle = next(cycles)
+            self.assertEqual(len(instances_of_a(cycle)), 2)
+            del cycle, cycles
+            gc.collect()
+            self.assertEqual(live_names(), set())
+
+    def test_key_cycles_from_graph(self):
+        a, b, c, d, e = ['a'], ['b'], ['c'], ['d'], ['e']
+        a.append(b)
+        b.append(a)
+        b.append(c)
+        c.append(d)
+        d.append(c)
+        e.append(d)
+        graph = ObjectGraph([a, b, c, d, e])
+        sccs = key_cycles(graph)
+        self.assertEqual(len(sccs), 2)
+        self.assertCountEqual(
+            [sorted(obj[0] for obj in scc) for scc in sccs],
+            [['a', 'b'], ['e']],
+        )
+        for scc in sccs:
+            self.assertIs(type(scc), ObjectGraph)
@@ -0,0 +1,71 @@
+# Copyright 2013 Mark Dickinson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the subgraph view helpers.
+
+"""
+import unittest
+
+from refcycle.csr_graph import CSRGraph, index_array
+from refcycle.indexed_vertex_set import IndexedVertexSet
+from refcycle.subgraph_view import (
+    LabelMask,
+    membership,
+    SubgraphEdges,
+    SubgraphVertices,
+)
+
+
+class TestSubgraphView(unittest.TestCase):
+    def test_label_mask(self):
+        mask = LabelMask(bytearray([0, 2, 1, 2]), 2)
+        self.assertEqual([v for v in range(4) if v in mask], [1, 3])
+
+    def test_dense_membership(self):
+        members = index_array([0, 2])
+        contains = membership(members, 4)
+        self.assertIsInstance(contains, LabelMask)
+        self.assertEqual([v for v in range(4) if v in contains], [0, 2])
+
+    def test_sparse_membership(self):
+        members = index_array([3, 500])
+        contains = membership(members, 1000)
+        self.assertNotIsInstance(contains, LabelMask)
+        self.assertEqual([v for v in range(1000) if v in contains], [3, 500])
+
+    def test_subgraph_vertices(self):
+        vertices = IndexedVertexSet()
+        vertices.update('abcd')
+        members = index_array([3, 1])
+        subgraph_vertices = SubgraphVertices(
+            vertices, members, membership(members, 4))
+        self.assertEqual(list(subgraph_vertices), ['d', 'b'])
+        self.assertEqual(len(subgraph_vertices), 2)
+        self.assertIn('b', subgraph_vertices)
+        self.assertNotIn('a', subgraph_vertices)
+        self.assertNotIn('z', subgraph_vertices)
+
+    def test_subgraph_edges(self):
+        # Edges: 0: 0->1, 1: 0->2, 2: 1->2, 3: 2->0, 4: 2->2
+        adjacency = CSRGraph.from_successors([[1, 2], [2], [0, 2], []])
+        members = index_array([0, 2])
+        edges = SubgraphEdges(adjacency, members, membership(members, 4))
+        self.assertCountEqual(list(edges), [1, 3, 4])
+        self.assertEqual(len(edges), 3)
+        self.assertIn(4, edges)
+        self.assertNotIn(0, edges)
+        self.assertNotIn(2, edges)
+        self.assertNotIn(5, edges)
+        self.assertNotIn('x', edges)
+        self.assertNotIn(None, edges)